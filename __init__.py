@@ -1,14 +1,64 @@
 import bpy
+import bmesh
+from bpy.app.handlers import persistent
 from bpy.props import (
     BoolProperty,
+    FloatProperty,
     IntProperty,
     StringProperty,
     CollectionProperty,
     PointerProperty,
     EnumProperty,
 )
-from bpy.types import Operator, Panel, PropertyGroup, UIList, Object, VertexGroup
-from typing import List, Dict, Set, Optional, Any
+from bpy.types import (
+    AddonPreferences,
+    Operator,
+    Panel,
+    PropertyGroup,
+    UIList,
+    Object,
+    VertexGroup,
+)
+from typing import List, Dict, Set, Optional, Any, Tuple, Iterable
+from contextlib import contextmanager, nullcontext
+import copy
+import cProfile
+import functools
+import os
+import re
+import tempfile
+import time
+import numpy as np
+from .merge_core import (
+    GroupStatistics,
+    MembershipArrays,
+    MembershipIndex,
+    MergeOptions,
+    MergeOutcome,
+    MergePlanError,
+    MergeSummary,
+    PhaseTimings,
+    RemovedGroup,
+    WeightJournal,
+    DeformLayerGroups,
+    apply_merge_outcome,
+    collapse_bone_plan,
+    compute_group_statistics,
+    compute_merge_outcome,
+    compute_merge_outcomes_parallel,
+    compute_plan_weights,
+    concatenate_memberships,
+    extract_deform_weights,
+    extract_group_weights,
+    iter_group_weight_chunks,
+    record_previous_weights,
+    remove_masked_sources,
+    restore_group_weights,
+    normalize_merged_weights,
+    summarize_merge_outcome,
+    validate_merge_plan,
+)
+from .name_index import CollectionNameCache, GroupNameIndex, diff_name_lists
 from .translations import translations_dict
 
 # Global state for range selection to avoid Blender's property modification restrictions
@@ -17,10 +67,762 @@ _range_selection_state = {
     "prev_active_object": None,
 }
 
+# Source list as last drawn (see MESH_UL_merge_source_groups.filter_items), so
+# range selection follows the filtered and sorted order on screen
+_source_list_display = {
+    "key": None,
+    "flags": [],
+    "order": [],
+    "bitflag": 0,
+    "invert": False,
+    "reverse": False,
+}
+
 # Tracking for UI updates
-_last_object_id = None
-_last_target_group = ""
-_last_vg_names = ()
+# Object and vertex group count the source groups list was last reconciled with
+_list_sync_state = {
+    "object_id": None,
+    # group_order_key of the active object at the last update
+    "group_order": (),
+    # Vertex group names by index at the last update, to tell renames apart
+    "group_names": (),
+    "update_scheduled": False,
+    # Incremented whenever the list contents change
+    "list_version": 0,
+}
+
+# Owner of msgbus subscriptions
+_msgbus_owner = object()
+
+# Name-to-index lookups for obj.vertex_groups (keyed by object)
+# and settings.source_groups (keyed by settings)
+_vertex_group_name_cache = CollectionNameCache()
+_source_item_name_cache = CollectionNameCache()
+
+
+def find_vertex_group_index(obj: Object, name: str) -> int:
+    """Return the index of the named vertex group on obj, or -1"""
+    return _vertex_group_name_cache.find(obj.as_pointer(), obj.vertex_groups, name)
+
+
+def find_source_item_index(settings, name: str) -> int:
+    """Return the list index of the named source group item, or -1"""
+    return _source_item_name_cache.find(
+        settings.as_pointer(), settings.source_groups, name
+    )
+
+
+# Per-group statistics (keyed by mesh data), dropped on mesh updates
+_group_stats_cache: Dict[int, GroupStatistics] = {}
+
+
+def get_group_statistics(
+    obj: Object, target_group_name: str = ""
+) -> Optional[GroupStatistics]:
+    """
+    Return cached statistics for every vertex group of obj, building them once
+
+    Args:
+        obj: Mesh object
+        target_group_name: Group to count shared vertices against
+    """
+    if obj.mode == "EDIT":
+        # Mesh data is not up to date while in Edit Mode
+        return None
+
+    target_idx = (
+        find_vertex_group_index(obj, target_group_name) if target_group_name else -1
+    )
+    key = obj.data.as_pointer()
+    stats = _group_stats_cache.get(key)
+    if (
+        stats is None
+        or len(stats.member_counts) != len(obj.vertex_groups)
+        or stats.target_idx != target_idx
+    ):
+        memberships = get_membership_index(obj).memberships()
+        stats = compute_group_statistics(
+            memberships, len(obj.vertex_groups), target_idx
+        )
+        _group_stats_cache[key] = stats
+    return stats
+
+
+# Per-mesh weight index (keyed by mesh data), updated by merges and dropped on
+# mesh updates from anywhere else
+_membership_indices: Dict[int, MembershipIndex] = {}
+# Meshes whose next update comes from a merge already in their index
+_own_weight_writes: Set[int] = set()
+
+
+def get_membership_index(obj: Object, build: bool = True) -> Optional[MembershipIndex]:
+    """
+    Return the weight index of obj's mesh, building it with one scan if needed
+
+    Args:
+        obj: Mesh object in Object (or a paint) mode
+        build: Whether to scan the mesh when no valid index exists
+    """
+    key = obj.data.as_pointer()
+    index = _membership_indices.get(key)
+    if index is not None and (
+        index.group_count != len(obj.vertex_groups)
+        or index.vertex_count != len(obj.data.vertices)
+    ):
+        del _membership_indices[key]
+        index = None
+    if index is None and build:
+        count_event("index_builds")
+        count_event("vertices_scanned", len(obj.data.vertices))
+        index = MembershipIndex(
+            extract_group_weights(obj.data.vertices, None),
+            len(obj.vertex_groups),
+            len(obj.data.vertices),
+        )
+        _membership_indices[key] = index
+    return index
+
+
+def update_membership_index(
+    obj: Object, outcome: MergeOutcome, removed_groups: Iterable[int] = ()
+) -> None:
+    """
+    Apply a written merge to the weight index of obj instead of dropping it
+
+    Call after the source groups are deleted, with their former indices, and
+    only if the merge wrote weights or deleted groups: the geometry update
+    of that write is then taken as already applied.
+    """
+    key = obj.data.as_pointer()
+    index = _membership_indices.get(key)
+    if index is None:
+        return
+    if obj.mode == "EDIT":
+        # Edit-mode writes reach the mesh only when leaving Edit Mode
+        drop_membership_index(obj)
+        return
+
+    index.apply_outcome(outcome)
+    index.remove_groups(removed_groups)
+    _own_weight_writes.add(key)
+
+
+def drop_membership_index(obj: Optional[Object] = None) -> None:
+    """Drop the weight index of obj, or of every object if obj is None"""
+    if obj is None:
+        _membership_indices.clear()
+        _own_weight_writes.clear()
+    else:
+        _membership_indices.pop(obj.data.as_pointer(), None)
+        _own_weight_writes.discard(obj.data.as_pointer())
+
+
+# Last previewed merge, reused by the merge operator when the inputs match
+_merge_preview = {
+    "key": None,
+    "outcome": None,
+    "summary": None,
+    "target_group": "",
+}
+
+
+def merge_preview_key(
+    obj: Object,
+    source_groups: List[VertexGroup],
+    target_group: VertexGroup,
+    options: MergeOptions,
+    mask: Optional[np.ndarray],
+) -> tuple:
+    """Identify the inputs of a merge for preview reuse"""
+    return (
+        obj.data.as_pointer(),
+        target_group.index,
+        tuple(sorted(g.index for g in source_groups)),
+        options,
+        (tuple(sorted(locked_group_indices(obj))) if options.reads_all_groups else ()),
+        None if mask is None else hash(mask.tobytes()),
+    )
+
+
+def store_merge_preview(
+    key: tuple, outcome: MergeOutcome, target_group: VertexGroup
+) -> MergeSummary:
+    """Keep a computed merge outcome for reuse and return its summary"""
+    summary = summarize_merge_outcome(outcome)
+    _merge_preview.update(
+        key=key, outcome=outcome, summary=summary, target_group=target_group.name
+    )
+    return summary
+
+
+def take_merge_preview(key: tuple) -> Optional[MergeOutcome]:
+    """Return the previewed outcome for key, if any, and clear the preview"""
+    outcome = _merge_preview["outcome"] if _merge_preview["key"] == key else None
+    invalidate_merge_preview()
+    return outcome
+
+
+def invalidate_merge_preview() -> None:
+    _merge_preview.update(key=None, outcome=None, summary=None, target_group="")
+
+
+# Timing records of recent operations, newest last (see get_timing_records)
+_timing_records: List[Dict[str, Any]] = []
+TIMING_RECORD_DEPTH = 32
+_timing_state: Dict[str, Optional[PhaseTimings]] = {"active": None}
+
+
+@contextmanager
+def timed_operation(operation: str, profile_path: str = ""):
+    """
+    Collect the phase timings and counters of an operation into a timing record
+
+    Args:
+        operation: Name of the operation in the record
+        profile_path: Also write a cProfile dump of the operation to this file
+    """
+    timings = PhaseTimings(operation)
+    outer = _timing_state["active"]
+    _timing_state["active"] = timings
+    profiler = cProfile.Profile() if profile_path else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield timings
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        _timing_state["active"] = outer
+        store_timing_record(timings, profile_path)
+
+
+def store_timing_record(timings: PhaseTimings, profile_path: str = "") -> None:
+    """Keep the timings of a finished operation (see get_timing_records)"""
+    record = timings.as_record()
+    if profile_path:
+        record["profile"] = profile_path
+    _timing_records.append(record)
+    del _timing_records[:-TIMING_RECORD_DEPTH]
+
+
+def timed_phase(name: str):
+    """Time a phase of the running timed operation (no-op outside of one)"""
+    timings = _timing_state["active"]
+    return nullcontext() if timings is None else timings.phase(name)
+
+
+def count_event(name: str, amount: int = 1) -> None:
+    """Add to a counter of the running timed operation"""
+    timings = _timing_state["active"]
+    if timings is not None:
+        timings.count(name, amount)
+
+
+def get_timing_records() -> List[Dict[str, Any]]:
+    """
+    Return the timing records of recent merges and list updates, newest last
+
+    Each record has "operation", "total" (seconds), "phases" (seconds by phase)
+    and "counters", plus "profile" (dump path) for profiled merges.
+    """
+    return copy.deepcopy(_timing_records)
+
+
+def take_profile_request(context) -> str:
+    """Return a dump path if the next merge should be profiled, clearing the request"""
+    prefs = get_preferences(context)
+    if not prefs.profile_next_merge:
+        return ""
+    prefs.profile_next_merge = False
+    return os.path.join(
+        tempfile.gettempdir(),
+        f"vertex_group_merger_{time.strftime('%Y%m%d_%H%M%S')}.prof",
+    )
+
+
+def timed_execute(execute=None, *, profile: bool = True):
+    """
+    Run an operator's execute() as a timed operation, profiled on request
+
+    Operators that do not merge use profile=False, so a "Profile Next Merge"
+    request is left for the next merge.
+    """
+    if execute is None:
+        return functools.partial(timed_execute, profile=profile)
+
+    @functools.wraps(execute)
+    def wrapper(self, context) -> Set[str]:
+        profile_path = take_profile_request(context) if profile else ""
+        with timed_operation(self.bl_idname, profile_path):
+            result = execute(self, context)
+        if profile_path:
+            self.report(
+                {"INFO"},
+                bpy.app.translations.pgettext("Profile written to {path}").format(
+                    path=profile_path
+                ),
+            )
+        return result
+
+    return wrapper
+
+
+# Weight journals of recent merges, newest last (see push_merge_history)
+# Each entry maps object names to the journal of that object
+_weight_journals: List[Dict[str, WeightJournal]] = []
+WEIGHT_JOURNAL_DEPTH = 32
+
+
+def journal_from_outcome(obj: Object, outcome: MergeOutcome) -> WeightJournal:
+    """
+    Name the previous weights recorded in an outcome before it is written
+
+    Must be called while the group indices of the outcome are still valid.
+    """
+    groups = obj.vertex_groups
+    removed_groups = [
+        RemovedGroup(groups[index].name, groups[index].lock_weight, vertices, weights)
+        for index, (vertices, weights) in sorted(outcome.removed_weights.items())
+    ]
+    return WeightJournal(
+        {groups[index].name: data for index, data in outcome.previous_weights.items()},
+        removed_groups,
+    )
+
+
+def push_merge_history(message: str, journals: Dict[str, WeightJournal]) -> None:
+    """
+    Record a finished merge for undo
+
+    With journals, only the changed weights are kept for Revert Merge, otherwise a
+    regular undo step (a copy of the whole mesh) is pushed.
+    """
+    if not journals:
+        with timed_phase("undo_push"):
+            bpy.ops.ed.undo_push(message=message)
+        return
+
+    _weight_journals.append(journals)
+    del _weight_journals[:-WEIGHT_JOURNAL_DEPTH]
+
+
+def locked_group_indices(obj: Object) -> Set[int]:
+    """Return the indices of obj's vertex groups with locked weights"""
+    return {g.index for g in obj.vertex_groups if g.lock_weight}
+
+
+def read_group_weights(
+    obj: Object,
+    group_indices: Optional[Set[int]],
+    mask: Optional[np.ndarray] = None,
+) -> MembershipArrays:
+    """
+    Read the weights of the given groups (None for all) of a mesh object
+
+    In edit mode the weights are read from the bmesh deform layer, so no mode
+    switch (and full mesh write-back) is needed. Otherwise the weights come
+    from the mesh's weight index, which is built with one scan and reused by
+    later merges. With a mask (see masked_vertex_indices) and no index yet,
+    only the masked vertices are visited.
+    """
+    if obj.mode == "EDIT":
+        bm = bmesh.from_edit_mesh(obj.data)
+        layer = bm.verts.layers.deform.active
+        if layer is None:
+            return extract_deform_weights([], group_indices)
+        if mask is None:
+            count_event("vertices_scanned", len(bm.verts))
+            return extract_deform_weights([v[layer] for v in bm.verts], group_indices)
+        count_event("vertices_scanned", len(mask))
+        bm.verts.ensure_lookup_table()
+        deform_verts = [bm.verts[i][layer] for i in mask.tolist()]
+        return extract_deform_weights(deform_verts, group_indices, mask)
+
+    index = get_membership_index(obj, build=mask is None)
+    if index is None:
+        count_event("vertices_scanned", len(mask))
+        return extract_group_weights(obj.data.vertices, group_indices, mask)
+    return index.memberships(group_indices, mask)
+
+
+def masked_vertex_indices(obj: Object, options: MergeOptions) -> Optional[np.ndarray]:
+    """
+    Build the sorted indices of the vertices a masked merge may change
+
+    Built once per merge, so reading weights afterwards only visits the mask.
+    Selection is read in bulk; a missing mask group gives an empty mask.
+
+    Returns:
+        Vertex indices, or None if options.masked is not set
+    """
+    if not options.masked:
+        return None
+
+    if options.mask_mode == "SELECTED":
+        if obj.mode == "EDIT":
+            bm = bmesh.from_edit_mesh(obj.data)
+            return np.fromiter(
+                (i for i, v in enumerate(bm.verts) if v.select), dtype=np.int32
+            )
+        selected = np.zeros(len(obj.data.vertices), dtype=bool)
+        obj.data.vertices.foreach_get("select", selected)
+        return np.flatnonzero(selected).astype(np.int32)
+
+    mask_group = obj.vertex_groups.get(options.mask_group)
+    if mask_group is None:
+        return np.zeros(0, dtype=np.int32)
+    members = read_group_weights(obj, {mask_group.index})
+    return members.vertex_indices[members.weights > 0.0]
+
+
+def write_merge_outcome(obj: Object, outcome: MergeOutcome) -> Tuple[int, int]:
+    """
+    Write a merge outcome to the vertex groups of obj
+
+    In edit mode the weights are written to the bmesh deform layer.
+
+    Returns:
+        Tuple of (number of target vertices removed due to zero weight, number
+        of add() and remove() calls issued)
+    """
+    with timed_phase("write"):
+        removed, calls = apply_merge_outcome(writable_vertex_groups(obj), outcome)
+        finish_vertex_group_writes(obj)
+    count_event("write_calls", calls)
+
+    written = sum(
+        int(np.count_nonzero((result.weights > 0.0) | result.in_target))
+        for result in outcome.results.values()
+    )
+    written += sum(len(vertices) for vertices, _ in outcome.group_weights.values())
+    written += sum(len(vertices) for vertices in outcome.group_removals.values())
+    count_event("memberships_written", written)
+    return removed, calls
+
+
+def writable_vertex_groups(obj: Object):
+    """Return obj's vertex groups by index, over the bmesh deform layer in edit mode"""
+    if obj.mode != "EDIT":
+        return obj.vertex_groups
+
+    bm = bmesh.from_edit_mesh(obj.data)
+    layer = bm.verts.layers.deform.verify()
+    return DeformLayerGroups([v[layer] for v in bm.verts])
+
+
+def finish_vertex_group_writes(obj: Object) -> None:
+    """Notify Blender of weights written through writable_vertex_groups"""
+    if obj.mode == "EDIT":
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+
+
+def merge_options_from_context(context) -> MergeOptions:
+    """Build merge options from the scene settings and add-on preferences"""
+    settings = context.scene.vertex_group_merger
+    return MergeOptions(
+        maintain_total_weight=settings.maintain_total_weight,
+        operation_mode=settings.operation_mode,
+        keep_source_groups=settings.keep_source_groups,
+        normalize_all=settings.normalize_all,
+        max_influences=settings.max_influences if settings.limit_influences else 0,
+        record_journal=get_preferences(context).merge_history == "JOURNAL",
+        source_factors=tuple(
+            (item.name, item.factor)
+            for item in settings.source_groups
+            if item.use and item.factor != 1.0
+        ),
+        mask_mode=settings.mask_mode,
+        mask_group=settings.mask_group if settings.mask_mode == "GROUP" else "",
+    )
+
+
+def prepare_merge_job(
+    obj: Object,
+    source_groups: List[VertexGroup],
+    target_group: VertexGroup,
+    options: MergeOptions,
+    mask: Optional[np.ndarray],
+) -> tuple:
+    """
+    Read the weights of obj for a merge
+
+    Args:
+        mask: Vertices to read from masked_vertex_indices, None for all
+
+    Returns:
+        Arguments for compute_merge_outcome
+    """
+    target_idx: int = target_group.index
+    source_indices: Set[int] = {g.index for g in source_groups}
+
+    # Normalization and the influence limit need every group of the vertices
+    with timed_phase("scan"):
+        if options.reads_all_groups:
+            memberships = read_group_weights(obj, None, mask)
+            locked_groups = locked_group_indices(obj)
+        else:
+            memberships = read_group_weights(obj, source_indices | {target_idx}, mask)
+            locked_groups = set()
+    count_event("memberships_read", len(memberships.vertex_indices))
+
+    factors = dict(options.source_factors)
+    source_factors = {g.index: factors.get(g.name, 1.0) for g in source_groups}
+    return (
+        memberships,
+        target_idx,
+        source_indices,
+        options,
+        locked_groups,
+        source_factors,
+    )
+
+
+def calculate_merge(
+    obj: Object,
+    source_groups: List[VertexGroup],
+    target_group: VertexGroup,
+    options: MergeOptions,
+    mask: Optional[np.ndarray],
+) -> MergeOutcome:
+    """
+    Read the weights of obj once and calculate the merge
+
+    Returns:
+        Merge outcome with the target result and any other changed groups
+    """
+    job = prepare_merge_job(obj, source_groups, target_group, options, mask)
+    with timed_phase("compute"):
+        return compute_merge_outcome(*job)
+
+
+def invalidate_group_statistics(obj: Optional[Object] = None) -> None:
+    """Drop cached statistics of obj, or of every object if obj is None"""
+    if obj is None:
+        _group_stats_cache.clear()
+    else:
+        _group_stats_cache.pop(obj.data.as_pointer(), None)
+
+
+def merge_object_vertex_groups(
+    obj: Object,
+    source_groups: List[VertexGroup],
+    target_group: VertexGroup,
+    options: MergeOptions,
+) -> Tuple[MergeOutcome, int, Optional[WeightJournal]]:
+    """
+    Merge source vertex groups into target group on one object
+
+    Shared by the merge operator and the headless batch entry point.
+
+    Args:
+        obj: Object containing vertex groups
+        source_groups: List of source vertex groups to merge
+        target_group: Target vertex group to merge into
+        options: Merge options
+
+    Returns:
+        Tuple of (merge outcome, number of target vertices removed due to zero
+        weight, journal of the previous weights if options.record_journal is set)
+    """
+    # Reuse a preview of the same inputs, otherwise calculate merged weights
+    # in a single pass using vertex.groups
+    with timed_phase("mask"):
+        mask = masked_vertex_indices(obj, options)
+    outcome: Optional[MergeOutcome] = take_merge_preview(
+        merge_preview_key(obj, source_groups, target_group, options, mask)
+    )
+    if outcome is None:
+        outcome = calculate_merge(obj, source_groups, target_group, options, mask)
+
+    removed_vertices, journal = commit_merge_outcome(
+        obj, outcome, source_groups, options
+    )
+    return outcome, removed_vertices, journal
+
+
+def commit_merge_outcome(
+    obj: Object,
+    outcome: MergeOutcome,
+    source_groups: List[VertexGroup],
+    options: MergeOptions,
+) -> Tuple[int, Optional[WeightJournal]]:
+    """
+    Write a calculated merge to obj and delete its source groups
+
+    Shared by every merge operator, so the journal, the weight index and the
+    cached statistics follow each write in the same way.
+
+    Args:
+        obj: Object containing vertex groups
+        outcome: Outcome to write, with previous weights recorded if
+            options.record_journal is set
+        source_groups: Source groups, deleted unless kept or masked
+        options: Merge options
+
+    Returns:
+        Tuple of (number of target vertices removed due to zero weight,
+        journal of the previous weights if options.record_journal is set)
+    """
+    journal = None
+    if options.record_journal:
+        with timed_phase("journal"):
+            journal = journal_from_outcome(obj, outcome)
+
+    # Apply new weights to the target groups, and normalized or trimmed
+    # weights to the other groups while their indices are still valid
+    removed_vertices, write_calls = write_merge_outcome(obj, outcome)
+
+    # Remove source groups after all writes so group references stay valid
+    removed_groups: List[int] = []
+    if options.deletes_source_groups:
+        removed_groups = [g.index for g in source_groups]
+        with timed_phase("remove_groups"):
+            for group in sorted(source_groups, key=lambda g: g.index, reverse=True):
+                obj.vertex_groups.remove(group)
+        count_event("groups_removed", len(removed_groups))
+
+    # Without any write no update follows that could mark the index as current
+    if write_calls or removed_groups:
+        with timed_phase("index_update"):
+            update_membership_index(obj, outcome, removed_groups)
+    invalidate_group_statistics(obj)
+    return removed_vertices, journal
+
+
+def plan_index_factors(
+    obj: Object, plan: Dict[str, List[str]], factors: Dict[str, float]
+) -> Tuple[Dict[int, List[int]], Dict[int, float]]:
+    """Translate a plan and its source factors from group names to indices"""
+    index_plan: Dict[int, List[int]] = {
+        obj.vertex_groups[target].index: [
+            obj.vertex_groups[name].index for name in sources
+        ]
+        for target, sources in plan.items()
+    }
+    index_factors: Dict[int, float] = {
+        obj.vertex_groups[name].index: factors.get(name, 1.0)
+        for sources in plan.values()
+        for name in sources
+    }
+    return index_plan, index_factors
+
+
+def plan_preview_key(
+    obj: Object,
+    plan: Dict[str, List[str]],
+    factors: Dict[str, float],
+    options: MergeOptions,
+    mask: Optional[np.ndarray],
+) -> tuple:
+    """Identify the inputs of a plan merge for preview reuse"""
+    index_plan, index_factors = plan_index_factors(obj, plan, factors)
+    return (
+        obj.data.as_pointer(),
+        tuple(sorted((target, tuple(sorted(s))) for target, s in index_plan.items())),
+        tuple(sorted(index_factors.items())),
+        options,
+        (tuple(sorted(locked_group_indices(obj))) if options.reads_all_groups else ()),
+        None if mask is None else hash(mask.tobytes()),
+    )
+
+
+def calculate_plan_merge(
+    obj: Object,
+    plan: Dict[str, List[str]],
+    factors: Dict[str, float],
+    options: MergeOptions,
+    mask: Optional[np.ndarray],
+) -> MergeOutcome:
+    """
+    Read the weights of obj once and calculate every entry of a validated plan
+
+    Args:
+        obj: Object containing vertex groups
+        plan: Target group name to existing source group names
+        factors: Source factors by group name, defaults to 1.0
+        options: Merge options
+        mask: Vertices to read from masked_vertex_indices, None for all
+
+    Returns:
+        Merge outcome of all targets, with previous weights recorded if
+        options.record_journal is set
+    """
+    index_plan, index_factors = plan_index_factors(obj, plan, factors)
+    plan_groups: Set[int] = set(index_plan)
+    for sources in index_plan.values():
+        plan_groups.update(sources)
+
+    with timed_phase("scan"):
+        memberships = read_group_weights(
+            obj, None if options.reads_all_groups else plan_groups, mask
+        )
+    count_event("memberships_read", len(memberships.vertex_indices))
+    with timed_phase("compute"):
+        results = compute_plan_weights(
+            memberships,
+            index_plan,
+            options.maintain_total_weight,
+            options.operation_mode,
+            index_factors,
+        )
+        removed_groups = (
+            set() if options.keep_source_groups else plan_groups.difference(index_plan)
+        )
+        outcome = MergeOutcome(results, {}, {})
+        if options.reads_all_groups:
+            outcome = normalize_merged_weights(
+                memberships,
+                results,
+                removed_groups=removed_groups,
+                locked_groups=locked_group_indices(obj),
+                max_influences=options.max_influences,
+            )
+        if options.masked and removed_groups:
+            outcome = remove_masked_sources(memberships, outcome, removed_groups)
+            removed_groups = set()
+    if options.record_journal:
+        with timed_phase("journal"):
+            outcome = record_previous_weights(memberships, outcome, removed_groups)
+    return outcome
+
+
+def merge_plan_on_object(
+    obj: Object,
+    plan: Dict[str, List[str]],
+    factors: Dict[str, float],
+    options: MergeOptions,
+) -> Tuple[MergeOutcome, Optional[WeightJournal]]:
+    """
+    Merge every entry of a validated plan on one object with a single scan
+
+    Args:
+        obj: Object containing vertex groups
+        plan: Target group name to existing source group names
+        factors: Source factors by group name, defaults to 1.0
+        options: Merge options (the mask group must exist)
+
+    Returns:
+        Tuple of (merge outcome, journal of the previous weights if
+        options.record_journal is set)
+    """
+    # Reuse a preview of the same plan, otherwise one scan for all targets,
+    # then one bulk write per target
+    with timed_phase("mask"):
+        mask = masked_vertex_indices(obj, options)
+    outcome: Optional[MergeOutcome] = take_merge_preview(
+        plan_preview_key(obj, plan, factors, options, mask)
+    )
+    if outcome is None:
+        outcome = calculate_plan_merge(obj, plan, factors, options, mask)
+
+    _, journal = commit_merge_outcome(
+        obj,
+        outcome,
+        [obj.vertex_groups[name] for sources in plan.values() for name in sources],
+        options,
+    )
+    return outcome, journal
 
 
 class MESH_OT_merge_vertex_groups(Operator):
@@ -28,66 +830,41 @@ class MESH_OT_merge_vertex_groups(Operator):
 
     bl_idname = "mesh.merge_vertex_groups"
     bl_label = "Merge Vertex Groups"
-    bl_options = {"REGISTER", "UNDO"}
+    # Undo is pushed by push_merge_history
+    bl_options = {"REGISTER"}
 
     @classmethod
     def poll(cls, context) -> bool:
         obj = context.active_object
-        return (
-            obj
-            and obj.type == "MESH"
-            and obj.mode != "EDIT"
-            and len(obj.vertex_groups) > 1
-        )
+        return obj and obj.type == "MESH" and len(obj.vertex_groups) > 1
 
+    @timed_execute
     def execute(self, context) -> Set[str]:
         obj: Object = context.active_object
         settings = context.scene.vertex_group_merger
 
-        # Get target group
+        # Get target and source groups
         target_group_name: str = settings.target_group
-        target_group: Optional[VertexGroup] = obj.vertex_groups.get(target_group_name)
-
-        if not target_group:
-            self.report(
-                {"ERROR"}, bpy.app.translations.pgettext("Target group not found")
-            )
-            return {"CANCELLED"}
-
-        # Get source groups (re-resolve, exclude missing groups and target)
-        source_groups: List[VertexGroup] = [
-            g
-            for name in (item.name for item in settings.source_groups if item.use)
-            if (g := obj.vertex_groups.get(name)) is not None
-            and name != target_group_name
-        ]
-
-        if not source_groups:
-            self.report(
-                {"ERROR"}, bpy.app.translations.pgettext("No source groups selected")
-            )
+        options = merge_options_from_context(context)
+        inputs = check_merge_inputs(self, obj, settings, options)
+        if inputs is None:
             return {"CANCELLED"}
+        target_group, source_groups, plan, unpaired = inputs
 
         # Perform merge operation
-        self.merge_vertex_groups(
-            obj,
-            source_groups,
-            target_group,
-            settings.maintain_total_weight,
-            settings.keep_source_groups,
-            settings.operation_mode,
-        )
+        if plan is not None:
+            journal = self.merge_mirrored(obj, plan, unpaired, options)
+        else:
+            journal = self.merge_vertex_groups(
+                obj, source_groups, target_group, options
+            )
 
         # Update list
-        update_source_groups(self, context)
+        with timed_phase("list_update"):
+            update_source_groups(self, context)
 
         # Set target group as active to show merge result immediately
-        target_group_index = -1
-        for i, vg in enumerate(obj.vertex_groups):
-            if vg.name == target_group_name:
-                target_group_index = i
-                break
-
+        target_group_index = find_vertex_group_index(obj, target_group_name)
         if target_group_index >= 0:
             obj.vertex_groups.active_index = target_group_index
 
@@ -103,6 +880,7 @@ class MESH_OT_merge_vertex_groups(Operator):
 
             bpy.app.timers.register(reset_range_mode_after_merge, first_interval=0.01)
 
+        push_merge_history(self.bl_label, {obj.name: journal} if journal else {})
         return {"FINISHED"}
 
     def merge_vertex_groups(
@@ -110,10 +888,8 @@ class MESH_OT_merge_vertex_groups(Operator):
         obj: Object,
         source_groups: List[VertexGroup],
         target_group: VertexGroup,
-        maintain_total_weight: bool,
-        keep_source_groups: bool,
-        operation_mode: str,
-    ) -> None:
+        options: MergeOptions,
+    ) -> Optional[WeightJournal]:
         """
         Merge source vertex groups into target group
 
@@ -121,125 +897,862 @@ class MESH_OT_merge_vertex_groups(Operator):
             obj: Object containing vertex groups
             source_groups: List of source vertex groups to merge
             target_group: Target vertex group to merge into
-            maintain_total_weight: Flag to keep total weight ≤ 1.0
-            keep_source_groups: Flag to keep source groups after merging
-            operation_mode: 'ADD' or 'SUBTRACT' operation mode
-        """
-        # Calculate merged weights in a single pass using vertex.groups
-        vertex_weights: Dict[int, float] = self._calculate_vertex_weights(
-            obj, source_groups, target_group, maintain_total_weight, operation_mode
-        )
+            options: Merge options
 
-        # Apply new weights to target group
-        removed_vertices = self._apply_weights_to_target(target_group, vertex_weights)
-
-        # Save source group names before deletion
+        Returns:
+            Previous weights of the changed groups if options.record_journal is set
+        """
         source_names: List[str] = [group.name for group in source_groups]
-
-        # Remove source groups (only if keep_source_groups is False)
-        if not keep_source_groups:
-            for group in reversed(source_groups):
-                obj.vertex_groups.remove(group)
+        outcome, removed_vertices, journal = merge_object_vertex_groups(
+            obj, source_groups, target_group, options
+        )
 
         # Report success with operation-specific message
         source_list = ", ".join(source_names)
-        if operation_mode == "ADD":
+        if options.operation_mode == "SUBTRACT":
             # Use complete translatable message with placeholders
             success_message = bpy.app.translations.pgettext(
-                "Groups {source} merged into {target}"
+                "Groups {source} subtracted from {target}"
             ).format(source=source_list, target=target_group.name)
-        else:  # SUBTRACT
+        else:  # ADD, MAX, MIN, MULTIPLY
             success_message = bpy.app.translations.pgettext(
-                "Groups {source} subtracted from {target}"
+                "Groups {source} merged into {target}"
             ).format(source=source_list, target=target_group.name)
-            if removed_vertices > 0:
-                vertices_msg = bpy.app.translations.pgettext(
-                    "{count} vertices removed with zero weight"
-                ).format(count=removed_vertices)
-                success_message += f" ({vertices_msg})"
+        if removed_vertices > 0:
+            vertices_msg = bpy.app.translations.pgettext(
+                "{count} vertices removed with zero weight"
+            ).format(count=removed_vertices)
+            success_message += f" ({vertices_msg})"
 
-        if keep_source_groups:
+        if options.masked:
+            success_message += (
+                f" {bpy.app.translations.pgettext('(masked vertices only)')}"
+            )
+        elif options.keep_source_groups:
             success_message += (
                 f" {bpy.app.translations.pgettext('(source groups kept)')}"
             )
+        if outcome.trimmed_count > 0:
+            trimmed_msg = bpy.app.translations.pgettext(
+                "{count} vertices trimmed to {limit} influences"
+            ).format(count=outcome.trimmed_count, limit=options.max_influences)
+            success_message += f" ({trimmed_msg})"
+        if outcome.normalized_count > 0:
+            normalized_msg = bpy.app.translations.pgettext(
+                "{count} vertices normalized"
+            ).format(count=outcome.normalized_count)
+            success_message += f" ({normalized_msg})"
 
         self.report({"INFO"}, success_message)
+        return journal
 
-    def _calculate_vertex_weights(
+    def merge_mirrored(
         self,
         obj: Object,
-        source_groups: List[VertexGroup],
-        target_group: VertexGroup,
-        maintain_total_weight: bool,
-        operation_mode: str,
-    ) -> Dict[int, float]:
-        """Collect relevant vertices and calculate merged weights in a single pass"""
-        target_idx: int = target_group.index
-        source_indices: Set[int] = {g.index for g in source_groups}
-        vertex_weights: Dict[int, float] = {}
-
-        for v in obj.data.vertices:
-            target_weight: float = 0.0
-            source_sum: float = 0.0
-            relevant: bool = False
-
-            for g in v.groups:
-                if g.group == target_idx:
-                    target_weight = g.weight
-                    relevant = True
-                elif g.group in source_indices:
-                    source_sum += g.weight
-                    relevant = True
-
-            if not relevant:
-                continue
+        plan: Dict[str, List[str]],
+        unpaired: List[str],
+        options: MergeOptions,
+    ) -> Optional[WeightJournal]:
+        """
+        Merge both sides of a mirrored merge in one pass and report unpaired names
+
+        Args:
+            obj: Object containing vertex groups
+            plan: Mirrored plan from mirror_merge_plan
+            unpaired: Names without a mirrored counterpart
+            options: Merge options
 
-            if operation_mode == "ADD":
-                weight = target_weight + source_sum
-            else:  # SUBTRACT
-                weight = target_weight - source_sum
+        Returns:
+            Previous weights of the changed groups if options.record_journal is set
+        """
+        _, journal = merge_plan_on_object(
+            obj, plan, mirrored_source_factors(options), options
+        )
 
-            weight = max(0.0, weight)
-            if operation_mode == "SUBTRACT" and weight < 1e-6:
-                weight = 0.0
-            if maintain_total_weight and weight > 1.0:
-                weight = 1.0
+        source_list = ", ".join(name for sources in plan.values() for name in sources)
+        target_list = ", ".join(plan)
+        if options.operation_mode == "SUBTRACT":
+            message = bpy.app.translations.pgettext(
+                "Groups {source} subtracted from {target}"
+            ).format(source=source_list, target=target_list)
+        else:  # ADD, MAX, MIN, MULTIPLY
+            message = bpy.app.translations.pgettext(
+                "Groups {source} merged into {target}"
+            ).format(source=source_list, target=target_list)
 
-            vertex_weights[v.index] = weight
+        if unpaired:
+            unpaired_msg = bpy.app.translations.pgettext(
+                "no mirrored counterpart: {names}"
+            ).format(names=", ".join(unpaired))
+            self.report({"WARNING"}, f"{message} ({unpaired_msg})")
+        else:
+            self.report({"INFO"}, message)
+        return journal
 
-        return vertex_weights
 
-    def _apply_weights_to_target(
-        self,
-        target_group: VertexGroup,
-        vertex_weights: Dict[int, float],
-    ) -> int:
+# Meshes from this size are read in steps by the modal merge
+MODAL_MERGE_MIN_VERTICES = 200_000
+MODAL_CHUNK_VERTICES = 20_000
+# Reading time per timer tick, short enough to keep the UI responsive
+MODAL_STEP_SECONDS = 0.1
+
+
+class MESH_OT_merge_vertex_groups_modal(Operator):
+    """Merge selected vertex groups, reading large meshes in steps with a progress bar (Esc to cancel)"""
+
+    bl_idname = "mesh.merge_vertex_groups_modal"
+    bl_label = "Merge Vertex Groups"
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return MESH_OT_merge_vertex_groups.poll(context)
+
+    def execute(self, context) -> Set[str]:
+        # Without an event loop (e.g. called from a script), merge directly
+        return bpy.ops.mesh.merge_vertex_groups()
+
+    def invoke(self, context, event) -> Set[str]:
+        obj: Object = context.active_object
+        options = merge_options_from_context(context)
+
+        # Report invalid settings before reading, not after
+        if (
+            check_merge_inputs(self, obj, context.scene.vertex_group_merger, options)
+            is None
+        ):
+            return {"CANCELLED"}
+
+        # Only a full scan of a large mesh is worth reading in steps; Edit Mode
+        # and selection masks are read directly, an index needs no reading
+        if (
+            obj.mode == "EDIT"
+            or options.mask_mode == "SELECTED"
+            or len(obj.data.vertices) < MODAL_MERGE_MIN_VERTICES
+            or get_membership_index(obj, build=False) is not None
+        ):
+            return bpy.ops.mesh.merge_vertex_groups()
+
+        self._object_name = obj.name
+        self._vertex_count = len(obj.data.vertices)
+        self._group_count = len(obj.vertex_groups)
+        self._chunks: List[MembershipArrays] = []
+        self._reader = iter_group_weight_chunks(
+            obj.data.vertices, None, MODAL_CHUNK_VERTICES
+        )
+        # The steps run outside of any timed operation, so they keep their own
+        # record of the scan
+        self._timings = PhaseTimings(self.bl_idname)
+
+        wm = context.window_manager
+        wm.progress_begin(0, self._vertex_count)
+        self._timer = wm.event_timer_add(0.001, window=context.window)
+        wm.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event) -> Set[str]:
+        if event.type == "ESC" and event.value == "PRESS":
+            self._finish(context)
+            self.report(
+                {"WARNING"},
+                bpy.app.translations.pgettext(
+                    "Merge cancelled, no weights were changed"
+                ),
+            )
+            return {"CANCELLED"}
+
+        # Other events are blocked so the mesh cannot change while it is read
+        if event.type != "TIMER":
+            return {"RUNNING_MODAL"}
+
+        obj = bpy.data.objects.get(self._object_name)
+        if (
+            obj is None
+            or obj.mode == "EDIT"
+            or len(obj.data.vertices) != self._vertex_count
+            or len(obj.vertex_groups) != self._group_count
+        ):
+            self._finish(context)
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext(
+                    "Mesh changed while reading, merge cancelled"
+                ),
+            )
+            return {"CANCELLED"}
+
+        deadline = time.perf_counter() + MODAL_STEP_SECONDS
+        read_all = False
+        with self._timings.phase("scan"):
+            for chunk in self._reader:
+                self._chunks.append(chunk)
+                if time.perf_counter() >= deadline:
+                    break
+            else:
+                # Everything is read: keep it as the weight index, so the regular
+                # merge neither scans again nor writes before this point
+                _membership_indices[obj.data.as_pointer()] = MembershipIndex(
+                    concatenate_memberships(self._chunks),
+                    self._group_count,
+                    self._vertex_count,
+                )
+                read_all = True
+        if read_all:
+            self._timings.count("index_builds")
+            self._timings.count("vertices_scanned", self._vertex_count)
+            self._finish(context)
+            return bpy.ops.mesh.merge_vertex_groups()
+
+        done = min(len(self._chunks) * MODAL_CHUNK_VERTICES, self._vertex_count)
+        context.window_manager.progress_update(done)
+        context.workspace.status_text_set(
+            bpy.app.translations.pgettext(
+                "Reading weights: {percent}% (Esc to cancel)"
+            ).format(percent=done * 100 // self._vertex_count)
+        )
+        return {"RUNNING_MODAL"}
+
+    def _finish(self, context) -> None:
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
+        self._chunks = []
+        store_timing_record(self._timings)
+
+
+class MESH_OT_preview_vertex_group_merge(Operator):
+    """Calculate the merge without changing any weights and show what it would do"""
+
+    bl_idname = "mesh.preview_vertex_group_merge"
+    bl_label = "Preview Merge"
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return MESH_OT_merge_vertex_groups.poll(context)
+
+    @timed_execute(profile=False)
+    def execute(self, context) -> Set[str]:
+        obj: Object = context.active_object
+        settings = context.scene.vertex_group_merger
+
+        options = merge_options_from_context(context)
+        inputs = check_merge_inputs(self, obj, settings, options)
+        if inputs is None:
+            return {"CANCELLED"}
+        target_group, source_groups, plan, _ = inputs
+
+        # Keep the outcome so merging right after the preview only has to write
+        mask = masked_vertex_indices(obj, options)
+        if plan is not None:
+            # Mirror: preview both sides, as the merge will write them
+            factors = mirrored_source_factors(options)
+            outcome = calculate_plan_merge(obj, plan, factors, options, mask)
+            key = plan_preview_key(obj, plan, factors, options, mask)
+        else:
+            outcome = calculate_merge(obj, source_groups, target_group, options, mask)
+            key = merge_preview_key(obj, source_groups, target_group, options, mask)
+        summary = store_merge_preview(key, outcome, target_group)
+
+        self.report(
+            {"INFO"},
+            bpy.app.translations.pgettext(
+                "{affected} vertices affected, {clamped} clamped, {removed} removed"
+            ).format(
+                affected=summary.affected_count,
+                clamped=summary.clamped_count,
+                removed=summary.removed_count,
+            ),
+        )
+        if context.area:
+            context.area.tag_redraw()
+        return {"FINISHED"}
+
+
+def mirrored_source_factors(options: MergeOptions) -> Dict[str, float]:
+    """Source factors by name, with mirrored sources taking their counterpart's"""
+    factors = dict(options.source_factors)
+    for name, factor in options.source_factors:
+        factors.setdefault(bpy.utils.flip_name(name), factor)
+    return factors
+
+
+def mirror_merge_plan(
+    obj: Object, target_name: str, source_names: List[str]
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Pair a merge with its mirrored counterpart using Blender's side naming
+
+    Names are flipped like Blender's own mirror tools (.L/.R, _L/_R, Left/Right
+    and so on). A target without a side shares the mirrored sources.
+
+    Returns:
+        Tuple of (plan of target name to source names, with one entry per side,
+        names whose counterpart has no side or no vertex group)
+    """
+    plan: Dict[str, List[str]] = {target_name: list(source_names)}
+    unpaired: List[str] = []
+
+    mirrored_target = bpy.utils.flip_name(target_name)
+    if obj.vertex_groups.get(mirrored_target) is None:
+        return plan, [target_name]
+
+    mirrored_sources = plan.setdefault(mirrored_target, [])
+    for name in source_names:
+        mirrored = bpy.utils.flip_name(name)
+        if mirrored == name or obj.vertex_groups.get(mirrored) is None:
+            unpaired.append(name)
+        elif mirrored not in mirrored_sources:
+            mirrored_sources.append(mirrored)
+
+    return {target: sources for target, sources in plan.items() if sources}, unpaired
+
+
+def check_merge_mask(operator: Operator, obj: Object, options: MergeOptions) -> bool:
+    """Report an error and return False if the mask group of a merge is missing"""
+    if (
+        options.mask_mode == "GROUP"
+        and obj.vertex_groups.get(options.mask_group) is None
+    ):
+        operator.report(
+            {"ERROR"},
+            bpy.app.translations.pgettext("Mask group {group} not found").format(
+                group=options.mask_group
+            ),
+        )
+        return False
+    return True
+
+
+def resolve_merge_groups(
+    obj: Object, settings
+) -> Tuple[Optional[VertexGroup], List[VertexGroup]]:
+    """
+    Resolve the target and checked source groups on obj
+
+    Source groups are re-resolved by name, excluding missing groups and the target.
+
+    Returns:
+        Tuple of (target group or None, list of source groups)
+    """
+    target_group_name: str = settings.target_group
+    target_group: Optional[VertexGroup] = obj.vertex_groups.get(target_group_name)
+    source_groups: List[VertexGroup] = [
+        g
+        for name in (item.name for item in settings.source_groups if item.use)
+        if (g := obj.vertex_groups.get(name)) is not None and name != target_group_name
+    ]
+    return target_group, source_groups
+
+
+def check_merge_inputs(
+    operator: Operator, obj: Object, settings, options: MergeOptions
+) -> Optional[tuple]:
+    """
+    Resolve the groups of a merge from the panel settings, reporting errors
+
+    Returns:
+        Tuple of (target group, source groups, mirrored plan or None, names
+        without a mirrored counterpart), or None after reporting an error
+    """
+    target_group, source_groups = resolve_merge_groups(obj, settings)
+
+    if not target_group:
+        operator.report(
+            {"ERROR"}, bpy.app.translations.pgettext("Target group not found")
+        )
+        return None
+
+    if not source_groups:
+        operator.report(
+            {"ERROR"}, bpy.app.translations.pgettext("No source groups selected")
+        )
+        return None
+
+    if not check_merge_mask(operator, obj, options):
+        return None
+
+    if not settings.mirror:
+        return target_group, source_groups, None, []
+
+    plan, unpaired = mirror_merge_plan(
+        obj, target_group.name, [g.name for g in source_groups]
+    )
+    try:
+        validate_merge_plan(plan)
+    except MergePlanError as e:
+        operator.report(
+            {"ERROR"},
+            bpy.app.translations.pgettext(e.message).format(group=e.group),
+        )
+        return None
+    return target_group, source_groups, plan, unpaired
+
+
+class MESH_OT_merge_vertex_groups_selected(Operator):
+    """Merge selected vertex groups into the target group on every selected mesh"""
+
+    bl_idname = "mesh.merge_vertex_groups_selected"
+    bl_label = "Merge Vertex Groups on Selected Objects"
+    # Undo is pushed by push_merge_history
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        obj = context.active_object
+        return (
+            obj
+            and obj.type == "MESH"
+            and any(o.type == "MESH" for o in context.selected_objects)
+        )
+
+    @timed_execute
+    def execute(self, context) -> Set[str]:
+        settings = context.scene.vertex_group_merger
+        target_group_name: str = settings.target_group
+        source_names: List[str] = [
+            item.name
+            for item in settings.source_groups
+            if item.use and item.name != target_group_name
+        ]
+
+        if not target_group_name:
+            self.report(
+                {"ERROR"}, bpy.app.translations.pgettext("Target group not found")
+            )
+            return {"CANCELLED"}
+
+        if not source_names:
+            self.report(
+                {"ERROR"}, bpy.app.translations.pgettext("No source groups selected")
+            )
+            return {"CANCELLED"}
+
+        jobs = _collect_merge_jobs(
+            context.selected_objects, target_group_name, source_names
+        )
+        if not jobs:
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext(
+                    "No selected objects have the target and source groups"
+                ),
+            )
+            return {"CANCELLED"}
+
+        # Objects without the mask group would get an empty mask, skip them
+        options = merge_options_from_context(context)
+        jobs = [job for job in jobs if check_merge_mask(self, job[0], options)]
+        if not jobs:
+            return {"CANCELLED"}
+
+        if settings.mirror:
+            journals = self.merge_mirrored(jobs, options)
+        else:
+            journals = self.merge_parallel(jobs, options)
+        if journals is None:
+            return {"CANCELLED"}
+
+        with timed_phase("list_update"):
+            update_source_groups(self, context)
+
+        self.report(
+            {"INFO"},
+            bpy.app.translations.pgettext(
+                "Groups merged into {target} on {count} objects"
+            ).format(target=target_group_name, count=len(jobs)),
+        )
+        push_merge_history(self.bl_label, journals)
+        return {"FINISHED"}
+
+    def merge_parallel(
+        self, jobs: List[tuple], options: MergeOptions
+    ) -> Dict[str, WeightJournal]:
         """
-        Apply calculated weights to target group and remove zero-weight vertices
+        Merge every job, computing all objects concurrently
 
-        Args:
-            target_group: Target vertex group to apply weights to
-            vertex_weights: Dictionary of vertex indices and their calculated weights
+        Returns:
+            Journals of the merged objects by name (if options.record_journal is set)
+        """
+        # Read weights on the main thread (bpy data is not thread safe)
+        with timed_phase("mask"):
+            masks = [masked_vertex_indices(obj, options) for obj, _, _ in jobs]
+        compute_jobs = [
+            prepare_merge_job(obj, source_groups, target_group, options, mask)
+            for (obj, target_group, source_groups), mask in zip(jobs, masks)
+        ]
+        with timed_phase("compute"):
+            outcomes: List[MergeOutcome] = compute_merge_outcomes_parallel(compute_jobs)
+
+        # Write back on the main thread
+        journals: Dict[str, WeightJournal] = {}
+        for (obj, _, source_groups), outcome in zip(jobs, outcomes):
+            _, journal = commit_merge_outcome(obj, outcome, source_groups, options)
+            if journal:
+                journals[obj.name] = journal
+        return journals
+
+    def merge_mirrored(
+        self, jobs: List[tuple], options: MergeOptions
+    ) -> Optional[Dict[str, WeightJournal]]:
+        """
+        Merge every job together with its mirrored counterpart, one object at a time
 
         Returns:
-            Number of vertices removed due to zero weight
+            Journals of the merged objects by name (if options.record_journal is
+            set), or None after reporting an invalid mirrored plan
         """
-        removed_vertices = 0
+        plans = []
+        for obj, target_group, source_groups in jobs:
+            plan, _ = mirror_merge_plan(
+                obj, target_group.name, [g.name for g in source_groups]
+            )
+            try:
+                validate_merge_plan(plan)
+            except MergePlanError as e:
+                self.report(
+                    {"ERROR"},
+                    bpy.app.translations.pgettext(e.message).format(group=e.group),
+                )
+                return None
+            plans.append(plan)
+
+        factors = mirrored_source_factors(options)
+        journals: Dict[str, WeightJournal] = {}
+        for (obj, _, _), plan in zip(jobs, plans):
+            _, journal = merge_plan_on_object(obj, plan, factors, options)
+            if journal:
+                journals[obj.name] = journal
+        return journals
+
+
+def _collect_merge_jobs(
+    objects: List[Object], target_group_name: str, source_names: List[str]
+) -> List[tuple]:
+    """
+    Resolve target and source groups on each mesh object
+
+    Objects sharing the same mesh data (linked duplicates) share their vertex
+    groups, so only the first of them is returned.
+
+    Returns:
+        List of (object, target group, source groups) tuples
+    """
+    jobs = []
+    seen_meshes: Set[int] = set()
+
+    for obj in objects:
+        if obj.type != "MESH":
+            continue
+
+        mesh_id = obj.data.as_pointer()
+        if mesh_id in seen_meshes:
+            continue
+
+        target_group = obj.vertex_groups.get(target_group_name)
+        source_groups = [
+            g for name in source_names if (g := obj.vertex_groups.get(name)) is not None
+        ]
+        if target_group is None or not source_groups:
+            continue
 
-        for vertex_index, weight in vertex_weights.items():
-            if weight > 0.0:
-                target_group.add([vertex_index], weight, "REPLACE")
-            else:
-                # Remove vertices with zero weight from the group
-                # This only happens in SUBTRACT mode or when maintain_total_weight clamps to 0
-                try:
-                    target_group.remove([vertex_index])
-                    removed_vertices += 1
-                except RuntimeError:
-                    # Vertex wasn't in the group, this is normal - ignore the error
-                    pass
+        seen_meshes.add(mesh_id)
+        jobs.append((obj, target_group, source_groups))
+
+    return jobs
+
+
+class MESH_OT_execute_merge_plan(Operator):
+    """Execute every entry of the merge plan in a single pass over the vertices"""
+
+    bl_idname = "mesh.execute_merge_plan"
+    bl_label = "Execute Merge Plan"
+    # Undo is pushed by push_merge_history
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        obj = context.active_object
+        return (
+            obj
+            and obj.type == "MESH"
+            and len(context.scene.vertex_group_merger.merge_plan) > 0
+        )
+
+    @timed_execute
+    def execute(self, context) -> Set[str]:
+        obj: Object = context.active_object
+        settings = context.scene.vertex_group_merger
+
+        # Resolve plan entries (exclude missing source groups like the single merge)
+        plan: Dict[str, List[str]] = {}
+        factors: Dict[str, float] = {}
+        for entry in settings.merge_plan:
+            if obj.vertex_groups.get(entry.name) is None:
+                self.report(
+                    {"ERROR"},
+                    bpy.app.translations.pgettext(
+                        "Target group {group} not found"
+                    ).format(group=entry.name),
+                )
+                return {"CANCELLED"}
+            plan[entry.name] = [
+                source.name
+                for source in entry.sources
+                if obj.vertex_groups.get(source.name) is not None
+            ]
+            factors.update((source.name, source.factor) for source in entry.sources)
+
+        try:
+            validate_merge_plan(plan)
+        except MergePlanError as e:
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext(e.message).format(group=e.group),
+            )
+            return {"CANCELLED"}
+
+        plan = {target: sources for target, sources in plan.items() if sources}
+        if not plan:
+            self.report(
+                {"ERROR"}, bpy.app.translations.pgettext("No source groups selected")
+            )
+            return {"CANCELLED"}
+
+        options = merge_options_from_context(context)
+        if not check_merge_mask(self, obj, options):
+            return {"CANCELLED"}
+        outcome, journal = merge_plan_on_object(obj, plan, factors, options)
+        with timed_phase("list_update"):
+            update_source_groups(self, context)
+
+        self.report(
+            {"INFO"},
+            bpy.app.translations.pgettext(
+                "Merge plan executed: {count} targets"
+            ).format(count=len(plan)),
+        )
+        push_merge_history(self.bl_label, {obj.name: journal} if journal else {})
+        return {"FINISHED"}
+
+
+def _bone_hierarchy(armature: Object) -> Tuple[Dict[str, Optional[str]], List[str]]:
+    """
+    Read the bone hierarchy of an armature
+
+    In Edit Mode the edit bones are read, since bone selection and parents are
+    only synced back when leaving it.
+
+    Returns:
+        Tuple of (parent name of every bone, names of the selected bones)
+    """
+    bones = armature.data.edit_bones if armature.mode == "EDIT" else armature.data.bones
+    parents = {bone.name: bone.parent.name if bone.parent else None for bone in bones}
+    selected = [bone.name for bone in bones if bone.select]
+    return parents, selected
+
+
+def _collect_deformed_meshes(
+    objects: Iterable[Object], armature: Object
+) -> List[Object]:
+    """
+    Find the mesh objects deformed by an armature through Armature modifiers
+
+    Like _collect_merge_jobs, only the first object of each mesh data is returned.
+    """
+    meshes = []
+    seen_meshes: Set[int] = set()
 
-        return removed_vertices
+    for obj in objects:
+        if obj.type != "MESH" or not any(
+            mod.type == "ARMATURE" and mod.object == armature for mod in obj.modifiers
+        ):
+            continue
+
+        mesh_id = obj.data.as_pointer()
+        if mesh_id in seen_meshes:
+            continue
+
+        seen_meshes.add(mesh_id)
+        meshes.append(obj)
+
+    return meshes
+
+
+class ARMATURE_OT_collapse_bones_into_parent(Operator):
+    """Merge the vertex groups of the selected bones into the group of their nearest unselected ancestor on every mesh deformed by the armature"""
+
+    bl_idname = "armature.collapse_bones_into_parent"
+    bl_label = "Collapse Bones into Parent"
+    # Undo is pushed by push_merge_history
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        obj = context.active_object
+        return obj and obj.type == "ARMATURE"
+
+    @timed_execute
+    def execute(self, context) -> Set[str]:
+        armature: Object = context.active_object
+        parents, selected = _bone_hierarchy(armature)
+        if not selected:
+            self.report({"ERROR"}, bpy.app.translations.pgettext("No bones selected"))
+            return {"CANCELLED"}
+
+        plan, orphans = collapse_bone_plan(parents, selected)
+        if not plan:
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext(
+                    "Selected bones have no unselected ancestor"
+                ),
+            )
+            return {"CANCELLED"}
+
+        meshes = _collect_deformed_meshes(context.scene.objects, armature)
+        if not meshes:
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext(
+                    "No meshes are deformed by {armature}"
+                ).format(armature=armature.name),
+            )
+            return {"CANCELLED"}
+
+        # Bone weights are always added; a mask or source factors set up for the
+        # active mesh do not apply to other meshes. The remaining options are
+        # shown in the armature panel
+        options = merge_options_from_context(context)._replace(
+            operation_mode="ADD", source_factors=(), mask_mode="NONE", mask_group=""
+        )
+
+        journals: Dict[str, WeightJournal] = {}
+        merged_meshes = 0
+        for obj in meshes:
+            # Only the bones weighted on this mesh; a kept ancestor without a
+            # group gets one, so the weights of its collapsed bones are kept
+            mesh_plan: Dict[str, List[str]] = {}
+            created_groups: List[str] = []
+            for target, sources in plan.items():
+                present = [name for name in sources if name in obj.vertex_groups]
+                if not present:
+                    continue
+                if target not in obj.vertex_groups:
+                    obj.vertex_groups.new(name=target)
+                    created_groups.append(target)
+                mesh_plan[target] = present
+            if not mesh_plan:
+                continue
+
+            _, journal = merge_plan_on_object(obj, mesh_plan, {}, options)
+            if journal:
+                journals[obj.name] = journal._replace(
+                    created_groups=tuple(created_groups)
+                )
+            merged_meshes += 1
+
+        if not merged_meshes:
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext(
+                    "No deformed meshes have groups of the selected bones"
+                ),
+            )
+            return {"CANCELLED"}
+
+        message = bpy.app.translations.pgettext(
+            "{bones} bones collapsed on {count} meshes"
+        ).format(bones=len(selected) - len(orphans), count=merged_meshes)
+        if orphans:
+            orphans_msg = bpy.app.translations.pgettext(
+                "no unselected ancestor: {names}"
+            ).format(names=", ".join(orphans))
+            self.report({"WARNING"}, f"{message} ({orphans_msg})")
+        else:
+            self.report({"INFO"}, message)
+        push_merge_history(self.bl_label, journals)
+        return {"FINISHED"}
+
+
+class MESH_OT_revert_vertex_group_merge(Operator):
+    """Restore the weights and groups changed by the last journaled merge"""
+
+    bl_idname = "mesh.revert_vertex_group_merge"
+    bl_label = "Revert Merge"
+    bl_options = {"REGISTER"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return bool(_weight_journals)
+
+    def execute(self, context) -> Set[str]:
+        journals = _weight_journals[-1]
+
+        # Check every object first so a revert is never applied halfway
+        for obj_name, journal in journals.items():
+            obj = bpy.data.objects.get(obj_name)
+            if not self._journal_matches(obj, journal):
+                self.report(
+                    {"ERROR"},
+                    bpy.app.translations.pgettext(
+                        "Cannot revert: vertex groups of {object} changed since the merge"
+                    ).format(object=obj_name),
+                )
+                return {"CANCELLED"}
+
+        _weight_journals.pop()
+        for obj_name, journal in journals.items():
+            obj = bpy.data.objects[obj_name]
+            self._revert_journal(obj, journal)
+            drop_membership_index(obj)
+            invalidate_group_statistics(obj)
+
+        invalidate_merge_preview()
+        update_source_groups(self, context)
+
+        self.report(
+            {"INFO"},
+            bpy.app.translations.pgettext("Merge reverted on {count} objects").format(
+                count=len(journals)
+            ),
+        )
+        return {"FINISHED"}
+
+    def _journal_matches(self, obj: Optional[Object], journal: WeightJournal) -> bool:
+        """Check that changed and created groups exist and removed ones are gone"""
+        if obj is None or obj.type != "MESH":
+            return False
+        groups = obj.vertex_groups
+        return (
+            all(groups.get(name) is not None for name in journal.changed_groups)
+            and all(groups.get(name) is not None for name in journal.created_groups)
+            and all(groups.get(group.name) is None for group in journal.removed_groups)
+        )
+
+    def _revert_journal(self, obj: Object, journal: WeightJournal) -> None:
+        # Recreate removed groups first (they are appended after existing groups)
+        for removed in journal.removed_groups:
+            group = obj.vertex_groups.new(name=removed.name)
+            group.lock_weight = removed.lock_weight
+
+        groups = writable_vertex_groups(obj)
+        for removed in journal.removed_groups:
+            restore_group_weights(
+                groups[find_vertex_group_index(obj, removed.name)],
+                removed.vertex_indices,
+                removed.weights,
+            )
+        for name, (vertex_indices, weights) in journal.changed_groups.items():
+            restore_group_weights(
+                groups[find_vertex_group_index(obj, name)], vertex_indices, weights
+            )
+        finish_vertex_group_writes(obj)
+
+        # Delete groups the merge created, after all writes by index
+        for name in journal.created_groups:
+            obj.vertex_groups.remove(obj.vertex_groups[name])
 
 
 class VertexGroupItem(PropertyGroup):
@@ -248,11 +1761,139 @@ class VertexGroupItem(PropertyGroup):
     name: StringProperty(name="Name", default="")
     # Redefined in register() with update callback
     use: BoolProperty(name="Use", default=False)
+    factor: FloatProperty(
+        name="Factor",
+        description="Multiplier applied to this group's weights before merging",
+        default=1.0,
+        min=0.0,
+        soft_max=1.0,
+    )
+
+
+class MergePlanSource(PropertyGroup):
+    """Source group of a merge plan entry"""
+
+    name: StringProperty(name="Name", default="")
+    factor: FloatProperty(name="Factor", default=1.0, min=0.0)
+
+
+class MergePlanEntry(PropertyGroup):
+    """Merge plan entry: one target group and its source groups"""
+
+    # Target group name
+    name: StringProperty(name="Target", default="")
+    sources: CollectionProperty(type=MergePlanSource)
 
 
 class MESH_UL_merge_source_groups(UIList):
     """Source vertex groups list UI"""
 
+    sort_mode: EnumProperty(
+        name="Sort By",
+        items=[
+            ("NONE", "Index", "Keep the vertex group order"),
+            ("NAME", "Name", "Sort by name"),
+            ("COUNT", "Vertex Count", "Sort by number of vertices in the group"),
+            ("WEIGHT", "Total Weight", "Sort by sum of the group's weights"),
+        ],
+        default="NONE",
+    )
+    show_only_checked: BoolProperty(
+        name="Only Checked",
+        description="Show only checked source groups",
+        default=False,
+    )
+
+    # Filter results keyed by list contents and filter options, per list
+    _filter_cache: Dict[str, tuple] = {}
+
+    def draw_filter(self, context, layout) -> None:
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "use_filter_invert", text="", icon="ARROW_LEFTRIGHT")
+        row = layout.row(align=True)
+        row.prop(self, "sort_mode", text="")
+        row.prop(self, "use_filter_sort_reverse", text="", icon="SORT_DESC")
+        row.prop(self, "show_only_checked", text="", icon="CHECKBOX_HLT")
+
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        obj = context.active_object
+
+        stats = None
+        if self.sort_mode in {"COUNT", "WEIGHT"} and obj and obj.type == "MESH":
+            stats = get_group_statistics(
+                obj, context.scene.vertex_group_merger.target_group
+            )
+
+        use_flags = None
+        if self.show_only_checked:
+            use_flags = get_source_groups_use(data)
+
+        key = (
+            data.as_pointer(),
+            _list_sync_state["list_version"],
+            len(items),
+            self.filter_name,
+            self.sort_mode,
+            id(stats),
+            None if use_flags is None else use_flags.tobytes(),
+        )
+        cached = self._filter_cache.get(self.list_id)
+        if cached is not None and cached[0] == key:
+            flt_flags, flt_neworder = cached[1], cached[2]
+        else:
+            flt_flags, flt_neworder = self._compute_filter(obj, items, stats, use_flags)
+            self._filter_cache[self.list_id] = (key, flt_flags, flt_neworder)
+
+        _source_list_display.update(
+            key=key[:3],
+            flags=flt_flags,
+            order=flt_neworder,
+            bitflag=self.bitflag_filter_item,
+            invert=self.use_filter_invert,
+            reverse=self.use_filter_sort_reverse,
+        )
+        return flt_flags, flt_neworder
+
+    def _compute_filter(self, obj, items, stats, use_flags):
+        helper = bpy.types.UI_UL_list
+
+        # Name filter (same matching as the default list filter)
+        if self.filter_name:
+            flt_flags = helper.filter_items_by_name(
+                self.filter_name, self.bitflag_filter_item, items, "name"
+            )
+        else:
+            flt_flags = [self.bitflag_filter_item] * len(items)
+
+        if use_flags is not None:
+            flt_flags = [
+                flag if use else 0 for flag, use in zip(flt_flags, use_flags.tolist())
+            ]
+
+        # Sorting
+        if self.sort_mode == "NAME":
+            flt_neworder = helper.sort_items_by_name(items, "name")
+        elif stats is not None:
+            values = (
+                stats.member_counts if self.sort_mode == "COUNT" else stats.weight_sums
+            )
+            group_indices = np.array(
+                [find_vertex_group_index(obj, item.name) for item in items],
+                dtype=np.int64,
+            )
+            item_values = np.where(group_indices >= 0, values[group_indices], 0)
+            # Largest first; flt_neworder[i] is the display position of item i
+            order = np.argsort(-item_values, kind="stable")
+            neworder = np.empty_like(order)
+            neworder[order] = np.arange(len(order))
+            flt_neworder = neworder.tolist()
+        else:
+            flt_neworder = []
+
+        return flt_flags, flt_neworder
+
     def draw_item(
         self,
         context,
@@ -272,21 +1913,236 @@ class MESH_UL_merge_source_groups(UIList):
             layout.prop(item, "use", text="")
             return
 
-        # Default layout handling
-        row = layout.row()
+        # Default layout handling
+        row = layout.row()
+
+        # Range selection mode visual feedback using global state
+        if (
+            settings.range_selection_mode
+            and _range_selection_state["last_clicked_index"] == index
+        ):
+            # Highlight last clicked item
+            row.alert = True
+
+        is_checked: bool = item.use
+        icon_value: str = "CHECKBOX_HLT" if is_checked else "CHECKBOX_DEHLT"
+        row.prop(item, "use", text="", icon=icon_value, emboss=False)
+        row.label(text=item.name, translate=False)
+
+        # Factor of checked sources
+        if is_checked:
+            sub = row.row()
+            sub.ui_units_x = 3
+            sub.prop(item, "factor", text="")
+
+        # Per-group statistics from the cached index
+        if settings.show_statistics:
+            obj = context.active_object
+            stats = get_group_statistics(obj, settings.target_group)
+            group_index = find_vertex_group_index(obj, item.name)
+            if stats is not None and 0 <= group_index < len(stats.member_counts):
+                sub = row.row()
+                sub.alignment = "RIGHT"
+                sub.label(
+                    text=(
+                        f"{stats.member_counts[group_index]}  "
+                        f"Σ{stats.weight_sums[group_index]:.2f}  "
+                        f"↑{stats.max_weights[group_index]:.2f}  "
+                        f"∩{stats.shared_counts[group_index]}"
+                    ),
+                    translate=False,
+                )
+
+
+class MESH_UL_merge_plan(UIList):
+    """Merge plan entries list UI"""
+
+    def draw_item(
+        self,
+        context,
+        layout,
+        data,
+        item,
+        icon,
+        active_data,
+        active_propname,
+        index: int,
+    ) -> None:
+        sources = ", ".join(
+            (
+                source.name
+                if source.factor == 1.0
+                else f"{source.name}×{source.factor:.2f}"
+            )
+            for source in item.sources
+        )
+        layout.label(text=f"{item.name} ← {sources}", translate=False)
+
+
+class SelectionRule(PropertyGroup):
+    """Name-based source group selection rule"""
+
+    enabled: BoolProperty(name="Enabled", default=True)
+    pattern: StringProperty(
+        name="Pattern",
+        description="Vertex group name pattern",
+        default="*",
+    )
+    match_type: EnumProperty(
+        name="Match Type",
+        items=[
+            ("GLOB", "Glob", "Wildcard pattern matching the whole name (e.g. DEF-*)"),
+            ("REGEX", "Regex", "Regular expression searched anywhere in the name"),
+        ],
+        default="GLOB",
+    )
+    action: EnumProperty(
+        name="Action",
+        items=[
+            ("SELECT", "Select", "Check matching groups"),
+            ("DESELECT", "Deselect", "Uncheck matching groups"),
+        ],
+        default="SELECT",
+    )
+
+
+class MESH_UL_selection_rules(UIList):
+    """Selection rules list UI"""
+
+    def draw_item(
+        self,
+        context,
+        layout,
+        data,
+        item,
+        icon,
+        active_data,
+        active_propname,
+        index: int,
+    ) -> None:
+        row = layout.row(align=True)
+        row.prop(item, "enabled", text="")
+        row.prop(item, "action", text="")
+        row.prop(item, "pattern", text="")
+        row.prop(item, "match_type", text="")
+
+
+class MESH_OT_add_selection_rule(Operator):
+    """Add a source group selection rule"""
+
+    bl_idname = "mesh.add_selection_rule"
+    bl_label = "Add Selection Rule"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    def execute(self, context) -> Set[str]:
+        prefs = get_preferences(context)
+        prefs.selection_rules.add()
+        prefs.active_rule_index = len(prefs.selection_rules) - 1
+        return {"FINISHED"}
+
+
+class MESH_OT_remove_selection_rule(Operator):
+    """Remove the active source group selection rule"""
+
+    bl_idname = "mesh.remove_selection_rule"
+    bl_label = "Remove Selection Rule"
+    bl_options = {"REGISTER", "INTERNAL"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        prefs = get_preferences(context)
+        return 0 <= prefs.active_rule_index < len(prefs.selection_rules)
+
+    def execute(self, context) -> Set[str]:
+        prefs = get_preferences(context)
+        prefs.selection_rules.remove(prefs.active_rule_index)
+        prefs.active_rule_index = min(
+            prefs.active_rule_index, len(prefs.selection_rules) - 1
+        )
+        return {"FINISHED"}
+
+
+class MESH_OT_apply_selection_rules(Operator):
+    """Check source groups matching the enabled selection rules"""
+
+    bl_idname = "mesh.apply_selection_rules"
+    bl_label = "Apply Selection Rules"
+    bl_options = {"REGISTER", "UNDO"}
+
+    extend: BoolProperty(
+        name="Extend",
+        description="Apply rules on top of the current selection instead of replacing it",
+        default=False,
+    )
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return len(context.scene.vertex_group_merger.source_groups) > 0
+
+    def execute(self, context) -> Set[str]:
+        settings = context.scene.vertex_group_merger
+        rules = [
+            (rule.pattern, rule.match_type, rule.action)
+            for rule in get_preferences(context).selection_rules
+            if rule.enabled and rule.pattern
+        ]
+
+        index = GroupNameIndex(item.name for item in settings.source_groups)
+        initial = get_source_groups_use(settings) if self.extend else None
+
+        try:
+            selected = index.evaluate_rules(rules, initial)
+        except re.error as e:
+            self.report(
+                {"ERROR"},
+                bpy.app.translations.pgettext("Invalid pattern: {error}").format(
+                    error=e
+                ),
+            )
+            return {"CANCELLED"}
+
+        set_source_groups_use(context, selected)
+
+        self.report(
+            {"INFO"},
+            bpy.app.translations.pgettext("{count} source groups selected").format(
+                count=int(selected.sum())
+            ),
+        )
+        return {"FINISHED"}
+
+
+def displayed_range(settings, start_index: int, end_index: int) -> np.ndarray:
+    """
+    Return which source list items are shown between two items on screen
+
+    Items hidden by the list filter are left out and sorting is followed, using
+    the filter results of the last draw. The two end items are always included.
 
-        # Range selection mode visual feedback using global state
-        if (
-            settings.range_selection_mode
-            and _range_selection_state["last_clicked_index"] == index
-        ):
-            # Highlight last clicked item
-            row.alert = True
+    Returns:
+        Boolean array over settings.source_groups
+    """
+    count = len(settings.source_groups)
+    positions = np.arange(count)
+    shown = np.ones(count, dtype=bool)
 
-        is_checked: bool = item.use
-        icon_value: str = "CHECKBOX_HLT" if is_checked else "CHECKBOX_DEHLT"
-        row.prop(item, "use", text="", icon=icon_value, emboss=False)
-        row.label(text=item.name, translate=False)
+    display = _source_list_display
+    if display["key"] == (
+        settings.as_pointer(),
+        _list_sync_state["list_version"],
+        count,
+    ):
+        if display["order"]:
+            positions = np.array(display["order"], dtype=np.int64)
+        if display["reverse"]:
+            positions = -positions
+        flags = np.array(display["flags"], dtype=np.int64)
+        shown = (flags & display["bitflag"] != 0) != display["invert"]
+
+    low, high = sorted((positions[start_index], positions[end_index]))
+    in_range = shown & (positions >= low) & (positions <= high)
+    in_range[[start_index, end_index]] = True
+    return in_range
 
 
 class MESH_OT_apply_range_selection(Operator):
@@ -302,24 +2158,84 @@ class MESH_OT_apply_range_selection(Operator):
 
     def execute(self, context) -> Set[str]:
         settings = context.scene.vertex_group_merger
-        start_idx = min(self.start_index, self.end_index)
-        end_idx = max(self.start_index, self.end_index)
+        count = len(settings.source_groups)
+        if not (0 <= self.start_index < count and 0 <= self.end_index < count):
+            return {"CANCELLED"}
 
-        # Set flag to prevent callback recursion
-        settings.updating_range = True
+        # Update items in range as a single batch
+        use_flags = get_source_groups_use(settings)
+        use_flags[displayed_range(settings, self.start_index, self.end_index)] = (
+            self.target_state
+        )
+        set_source_groups_use(context, use_flags)
 
-        try:
-            # Safely update items in range
-            for i in range(start_idx, end_idx + 1):
-                if i < len(settings.source_groups):
-                    settings.source_groups[i].use = self.target_state
-        finally:
-            # Always reset flag
-            settings.updating_range = False
+        return {"FINISHED"}
+
+
+class MESH_OT_select_source_groups(Operator):
+    """Change the checkbox state of all source groups at once"""
+
+    bl_idname = "mesh.select_source_groups"
+    bl_label = "Select Source Groups"
+    bl_options = {"REGISTER", "UNDO"}
+
+    action: EnumProperty(
+        name="Action",
+        items=[
+            ("SELECT", "Select All", "Check all source groups"),
+            ("DESELECT", "Deselect All", "Uncheck all source groups"),
+            ("INVERT", "Invert", "Invert the checkbox state of all source groups"),
+        ],
+        default="SELECT",
+    )
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return len(context.scene.vertex_group_merger.source_groups) > 0
+
+    def execute(self, context) -> Set[str]:
+        settings = context.scene.vertex_group_merger
+
+        if self.action == "INVERT":
+            use_flags = ~get_source_groups_use(settings)
+        else:
+            use_flags = np.full(
+                len(settings.source_groups), self.action == "SELECT", dtype=bool
+            )
+
+        set_source_groups_use(context, use_flags)
+
+        # A bulk change invalidates any pending range start
+        _range_selection_state["last_clicked_index"] = -1
 
         return {"FINISHED"}
 
 
+def get_source_groups_use(settings) -> np.ndarray:
+    """Read the checkbox state of every source group item in one call"""
+    use_flags = np.zeros(len(settings.source_groups), dtype=bool)
+    settings.source_groups.foreach_get("use", use_flags)
+    return use_flags
+
+
+def set_source_groups_use(context, use_flags: np.ndarray) -> None:
+    """
+    Write the checkbox state of every source group item in one call
+
+    foreach_set does not run item_use_update per item; the flag additionally
+    guards against callbacks while the batch is applied.
+    """
+    settings = context.scene.vertex_group_merger
+    settings.updating_range = True
+    try:
+        settings.source_groups.foreach_set("use", use_flags)
+    finally:
+        settings.updating_range = False
+
+    if context.area:
+        context.area.tag_redraw()
+
+
 def generate_vertex_group_name(obj) -> str:
     """Generate a default vertex group name following Blender's naming convention."""
     base = "Group"
@@ -367,6 +2283,94 @@ class MESH_OT_add_target_vertex_group(Operator):
         return {"FINISHED"}
 
 
+class MESH_OT_add_merge_plan_entry(Operator):
+    """Add the current target and selected source groups to the merge plan"""
+
+    bl_idname = "mesh.add_merge_plan_entry"
+    bl_label = "Add to Merge Plan"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return bool(context.scene.vertex_group_merger.target_group)
+
+    def execute(self, context) -> Set[str]:
+        settings = context.scene.vertex_group_merger
+        target_group_name: str = settings.target_group
+        source_names: List[str] = [
+            item.name
+            for item in settings.source_groups
+            if item.use and item.name != target_group_name
+        ]
+
+        if not source_names:
+            self.report(
+                {"ERROR"}, bpy.app.translations.pgettext("No source groups selected")
+            )
+            return {"CANCELLED"}
+
+        # Extend the existing entry for this target instead of adding a duplicate
+        entry = next(
+            (e for e in settings.merge_plan if e.name == target_group_name), None
+        )
+        if entry is None:
+            entry = settings.merge_plan.add()
+            entry.name = target_group_name
+
+        # Factors are taken when the source is added (or added again)
+        existing = {source.name: source for source in entry.sources}
+        for item in settings.source_groups:
+            if item.name not in source_names:
+                continue
+            source = existing.get(item.name)
+            if source is None:
+                source = entry.sources.add()
+                source.name = item.name
+            source.factor = item.factor
+
+        settings.active_plan_index = list(settings.merge_plan).index(entry)
+        return {"FINISHED"}
+
+
+class MESH_OT_remove_merge_plan_entry(Operator):
+    """Remove the active entry from the merge plan"""
+
+    bl_idname = "mesh.remove_merge_plan_entry"
+    bl_label = "Remove Merge Plan Entry"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        settings = context.scene.vertex_group_merger
+        return 0 <= settings.active_plan_index < len(settings.merge_plan)
+
+    def execute(self, context) -> Set[str]:
+        settings = context.scene.vertex_group_merger
+        settings.merge_plan.remove(settings.active_plan_index)
+        settings.active_plan_index = min(
+            settings.active_plan_index, len(settings.merge_plan) - 1
+        )
+        return {"FINISHED"}
+
+
+class MESH_OT_clear_merge_plan(Operator):
+    """Remove all entries from the merge plan"""
+
+    bl_idname = "mesh.clear_merge_plan"
+    bl_label = "Clear Merge Plan"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context) -> bool:
+        return len(context.scene.vertex_group_merger.merge_plan) > 0
+
+    def execute(self, context) -> Set[str]:
+        settings = context.scene.vertex_group_merger
+        settings.merge_plan.clear()
+        settings.active_plan_index = -1
+        return {"FINISHED"}
+
+
 class MESH_OT_update_source_groups_list(Operator):
     """Update source groups list safely"""
 
@@ -378,7 +2382,8 @@ class MESH_OT_update_source_groups_list(Operator):
         # Reset range selection state and update source groups list
         global _range_selection_state
         _range_selection_state["last_clicked_index"] = -1
-        update_source_groups(self, context)
+        with timed_operation(self.bl_idname), timed_phase("list_update"):
+            update_source_groups(self, context)
         return {"FINISHED"}
 
 
@@ -388,11 +2393,7 @@ def handle_range_selection(current_item, context) -> None:
     settings = context.scene.vertex_group_merger
 
     # Get current clicked item index
-    current_index = -1
-    for i, item in enumerate(settings.source_groups):
-        if item.name == current_item.name:
-            current_index = i
-            break
+    current_index = find_source_item_index(settings, current_item.name)
 
     if current_index == -1:
         return
@@ -430,10 +2431,9 @@ def item_use_update(self, context) -> None:
 
     # Normal processing
     if self.use:
-        for i, vg in enumerate(obj.vertex_groups):
-            if vg.name == self.name:
-                obj.vertex_groups.active_index = i
-                break
+        index = find_vertex_group_index(obj, self.name)
+        if index >= 0:
+            obj.vertex_groups.active_index = index
 
     # Range selection mode additional processing
     if settings.range_selection_mode:
@@ -455,10 +2455,9 @@ def active_source_index_update(self, context) -> None:
     selected_name: str = settings.source_groups[index].name
 
     # Find that group in standard list and make it active
-    for i, vg in enumerate(obj.vertex_groups):
-        if vg.name == selected_name:
-            obj.vertex_groups.active_index = i
-            break
+    vg_index = find_vertex_group_index(obj, selected_name)
+    if vg_index >= 0:
+        obj.vertex_groups.active_index = vg_index
 
 
 class VertexGroupMergerSettings(PropertyGroup):
@@ -486,6 +2485,66 @@ class VertexGroupMergerSettings(PropertyGroup):
         default=False,
     )
 
+    normalize_all: BoolProperty(
+        name="Normalize All Groups",
+        description=(
+            "Rescale all groups on the merged vertices so their weights sum to 1.0 "
+            "(locked groups are kept)"
+        ),
+        default=False,
+    )
+
+    limit_influences: BoolProperty(
+        name="Limit Influences",
+        description=(
+            "Remove the smallest group weights of merged vertices that exceed the "
+            "limit, then normalize the remaining weights"
+        ),
+        default=False,
+    )
+
+    max_influences: IntProperty(
+        name="Max Influences",
+        description="Maximum number of vertex groups per merged vertex",
+        default=4,
+        min=1,
+        max=32,
+    )
+
+    mask_mode: EnumProperty(
+        name="Mask",
+        description="Restrict the merge to some of the vertices",
+        items=[
+            ("NONE", "All Vertices", "Merge on every vertex"),
+            (
+                "SELECTED",
+                "Selected Vertices",
+                "Merge only on selected vertices (source groups keep their other weights)",
+            ),
+            (
+                "GROUP",
+                "Mask Group",
+                "Merge only on members of the mask group (source groups keep their other weights)",
+            ),
+        ],
+        default="NONE",
+    )
+
+    mirror: BoolProperty(
+        name="Mirror (.L/.R)",
+        description=(
+            "Also merge the mirrored source groups into the mirrored target "
+            "(.L/.R, _L/_R, Left/Right) in the same pass"
+        ),
+        default=False,
+    )
+
+    mask_group: StringProperty(
+        name="Mask Group",
+        description="Vertex group whose members the merge is restricted to",
+        default="",
+    )
+
     operation_mode: EnumProperty(
         name="Operation Mode",
         description="How to merge vertex groups",
@@ -496,6 +2555,17 @@ class VertexGroupMergerSettings(PropertyGroup):
                 "Subtract",
                 "Subtract source groups from target (vertices with zero weight will be removed)",
             ),
+            ("MAX", "Max", "Keep the largest of the target and source weights"),
+            (
+                "MIN",
+                "Min",
+                "Keep the smallest of the target and source weights (vertices missing from any of them get zero weight and are removed)",
+            ),
+            (
+                "MULTIPLY",
+                "Multiply",
+                "Multiply the target by the source weights (vertices missing from any of them get zero weight and are removed)",
+            ),
         ],
         default="ADD",
     )
@@ -514,59 +2584,281 @@ class VertexGroupMergerSettings(PropertyGroup):
         default=False,
     )
 
+    show_statistics: BoolProperty(
+        name="Show Statistics",
+        description=(
+            "Show vertex count, total weight (Σ), max weight (↑) and vertices "
+            "shared with the target (∩) for each source group"
+        ),
+        default=False,
+    )
+
+    # Many-to-many merge plan
+    merge_plan: CollectionProperty(type=MergePlanEntry)
+    active_plan_index: IntProperty(default=-1)
+
+
+class VertexGroupMergerPreferences(AddonPreferences):
+    """Vertex Group Merger Preferences"""
+
+    bl_idname = __package__
+
+    # Stored in preferences so the same rules can be reused on other files
+    selection_rules: CollectionProperty(type=SelectionRule)
+    active_rule_index: IntProperty(default=-1)
+
+    merge_history: EnumProperty(
+        name="Merge Undo",
+        description="How merges can be undone",
+        items=[
+            (
+                "UNDO",
+                "Global Undo",
+                "Push a regular undo step for each merge (stores a copy of the mesh)",
+            ),
+            (
+                "JOURNAL",
+                "Weight Journal",
+                "Keep only the changed weights and removed groups, and undo merges "
+                "with Revert Merge instead of Ctrl+Z",
+            ),
+        ],
+        default="UNDO",
+    )
+
+    profile_next_merge: BoolProperty(
+        name="Profile Next Merge",
+        description=(
+            "Write a cProfile dump of the next merge to the temporary directory "
+            "(cleared after the merge)"
+        ),
+        default=False,
+    )
+
+    def draw(self, context) -> None:
+        self.layout.prop(self, "merge_history")
+        self.layout.prop(self, "profile_next_merge")
+        draw_selection_rules(self.layout, context)
+
+
+def get_preferences(context) -> VertexGroupMergerPreferences:
+    return context.preferences.addons[__package__].preferences
+
+
+def draw_selection_rules(layout, context) -> None:
+    """Draw the selection rules list and its buttons"""
+    prefs = get_preferences(context)
+
+    row = layout.row()
+    row.template_list(
+        "MESH_UL_selection_rules",
+        "",
+        prefs,
+        "selection_rules",
+        prefs,
+        "active_rule_index",
+        rows=3,
+    )
+    col = row.column(align=True)
+    col.operator("mesh.add_selection_rule", text="", icon="ADD")
+    col.operator("mesh.remove_selection_rule", text="", icon="REMOVE")
+
+
+def update_source_groups(self, context) -> int:
+    """
+    Reconcile source groups list with the object's vertex groups
 
-def update_source_groups(self, context) -> None:
-    """Update source groups list"""
+    Only changed entries are inserted, removed or renamed, so surviving items
+    keep their checkbox state. A renamed entry keeps its state only if its
+    vertex group was renamed; an entry reused for another group (e.g. after
+    the target changed or the groups were sorted) is reset. Switching to
+    another object resets every entry, even if its groups have the same names.
+
+    Returns:
+        Number of list entries touched
+    """
     obj: Optional[Object] = context.active_object
     if not obj or obj.type != "MESH":
-        return
+        return 0
 
     settings = context.scene.vertex_group_merger
-
-    # Suppress item_use_update callbacks during list rebuild
-    # Without this, each item.use = False triggers handle_range_selection
+    source_groups = settings.source_groups
+
+    # A renamed vertex group keeps its index, and its old name is gone
+    group_names = tuple(vg.name for vg in obj.vertex_groups)
+    previous_names = _list_sync_state["group_names"]
+    previous_object = _list_sync_state["object_id"]
+    renamed: Set[Tuple[str, str]] = set()
+    if obj.as_pointer() == previous_object and len(previous_names) == len(group_names):
+        old_names, new_names = set(previous_names), set(group_names)
+        renamed = {
+            (old, new)
+            for old, new in zip(previous_names, group_names)
+            if old != new and old not in new_names and new not in old_names
+        }
+
+    # Name lookups remember missing names, so they must see every rename
+    if group_names != previous_names:
+        _vertex_group_name_cache.invalidate(obj.as_pointer())
+
+    # State checked on another object must not carry over (None after a file
+    # load or undo, where the list belongs to the active object)
+    reset = []
+    if previous_object not in (None, obj.as_pointer()):
+        reset = [item for item in source_groups if item.use or item.factor != 1.0]
+
+    _list_sync_state["object_id"] = obj.as_pointer()
+    _list_sync_state["group_order"] = group_order_key(obj)
+    _list_sync_state["group_names"] = group_names
+
+    desired: List[str] = [
+        vg.name for vg in obj.vertex_groups if vg.name != settings.target_group
+    ]
+    current: List[str] = [item.name for item in source_groups]
+    edits = diff_name_lists(current, desired)
+    count_event("list_edits", len(edits))
+    if not edits and not reset:
+        return 0
+
+    _list_sync_state["list_version"] += 1
+
+    # The group set changed, drop stale name lookups
+    _vertex_group_name_cache.invalidate(obj.as_pointer())
+    _source_item_name_cache.invalidate(settings.as_pointer())
+
+    # Suppress item_use_update callbacks during list updates
+    # Without this, each item.use change triggers handle_range_selection
     # in range selection mode, leaving the last group as the selection anchor
     settings.updating_range = True
     try:
-        settings.source_groups.clear()
-
-        for vg in obj.vertex_groups:
-            if vg.name == settings.target_group:
-                continue
-
-            item = settings.source_groups.add()
-            item.name = vg.name
+        for item in reset:
             item.use = False
+            item.factor = 1.0
+        for op, index, name in edits:
+            if op == "RENAME":
+                item = source_groups[index]
+                if (item.name, name) not in renamed:
+                    item.use = False
+                    item.factor = 1.0
+                item.name = name
+            elif op == "REMOVE":
+                source_groups.remove(index)
+            else:  # INSERT
+                item = source_groups.add()
+                item.name = name
+                item.use = False
+                source_groups.move(len(source_groups) - 1, index)
     finally:
         settings.updating_range = False
 
+    return len(edits) + len(reset)
 
-def needs_update(context) -> bool:
-    """Simple check if source groups list needs updating"""
-    global _last_object_id, _last_target_group, _last_vg_names
 
-    obj = context.active_object
-    if not obj or obj.type != "MESH":
-        return False
+def group_order_key(obj: Object) -> tuple:
+    """
+    Cheap signature of the vertex groups of obj, without reading every name
+
+    Adding or removing a group changes the count, sorting usually changes the
+    first or last name, and moving a group up or down changes the active index
+    (the moved group is the active one). Vertex group order has no msgbus key.
+    """
+    groups = obj.vertex_groups
+    if not groups:
+        return (0,)
+    return (len(groups), groups.active_index, groups[0].name, groups[-1].name)
 
-    settings = context.scene.vertex_group_merger
 
-    # Check if object, target group, or vertex group composition changed
-    current_object_id = obj.as_pointer()
-    current_target_group = settings.target_group
-    current_vg_names = tuple(vg.name for vg in obj.vertex_groups)
+def schedule_source_groups_update(*args) -> None:
+    """Schedule a source groups list update, coalescing repeated requests"""
+    if _list_sync_state["update_scheduled"]:
+        return
+    _list_sync_state["update_scheduled"] = True
+
+    # Run via timer to avoid draw and notification context issues
+    def timer_update():
+        _list_sync_state["update_scheduled"] = False
+        bpy.ops.mesh.update_source_groups_list()
+        return None
+
+    bpy.app.timers.register(timer_update, first_interval=0.01)
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph) -> None:
+    """Detect vertex groups added, removed or reordered on the active object"""
+    # Weight edits update the mesh itself; updates of the object (posing,
+    # playback, modifiers) do not change its weights
+    updated_meshes = {
+        update.id.original.as_pointer()
+        for update in depsgraph.updates
+        if isinstance(update.id.original, bpy.types.Mesh)
+    }
+
+    # Statistics and previews of updated meshes are rebuilt on next use
+    for key in updated_meshes:
+        _group_stats_cache.pop(key, None)
+    preview_key = _merge_preview["key"]
+    if preview_key is not None and preview_key[0] in updated_meshes:
+        invalidate_merge_preview()
+
+    # Weight indices survive only the updates caused by merges (already applied)
+    if _membership_indices:
+        for key in updated_meshes:
+            if key in _own_weight_writes:
+                _own_weight_writes.discard(key)
+            else:
+                _membership_indices.pop(key, None)
+
+    obj = bpy.context.active_object
+    if not obj or obj.type != "MESH":
+        return
 
     if (
-        _last_object_id != current_object_id
-        or _last_target_group != current_target_group
-        or _last_vg_names != current_vg_names
+        obj.as_pointer() != _list_sync_state["object_id"]
+        or group_order_key(obj) != _list_sync_state["group_order"]
     ):
-        _last_object_id = current_object_id
-        _last_target_group = current_target_group
-        _last_vg_names = current_vg_names
-        return True
-
-    return False
+        schedule_source_groups_update()
+
+
+@persistent
+def on_undo_redo(*args) -> None:
+    """Undo and redo replace mesh data, so weight indices and journals are stale"""
+    drop_membership_index()
+    # The restored weights may predate a journaled merge (which pushes no undo
+    # step), so reverting it would no longer match the mesh
+    _weight_journals.clear()
+    # Objects are reallocated and the list is restored along with them
+    _list_sync_state["object_id"] = None
+
+
+@persistent
+def on_load_post(*args) -> None:
+    """Subscriptions are cleared when a file is loaded, so add them again"""
+    _vertex_group_name_cache.invalidate()
+    _source_item_name_cache.invalidate()
+    invalidate_group_statistics()
+    invalidate_merge_preview()
+    drop_membership_index()
+    _weight_journals.clear()
+    _list_sync_state["object_id"] = None
+    subscribe_change_notifications()
+    schedule_source_groups_update()
+
+
+def subscribe_change_notifications() -> None:
+    """Subscribe to active object, scene and vertex group name changes"""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for key in (
+        (bpy.types.LayerObjects, "active"),
+        (bpy.types.Window, "scene"),
+        (bpy.types.VertexGroup, "name"),
+    ):
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=_msgbus_owner,
+            args=(),
+            notify=schedule_source_groups_update,
+        )
 
 
 class VIEW3D_PT_vertex_group_merger(Panel):
@@ -604,15 +2896,6 @@ class VIEW3D_PT_vertex_group_merger(Panel):
             )
             return
 
-        # Simple update check and schedule if needed
-        if needs_update(context):
-
-            def timer_update():
-                bpy.ops.mesh.update_source_groups_list()
-                return None
-
-            bpy.app.timers.register(timer_update, first_interval=0.01)
-
         # Check if active object changed and reset global state
         if _range_selection_state["prev_active_object"] != obj:
             _range_selection_state["prev_active_object"] = obj
@@ -654,6 +2937,27 @@ class VIEW3D_PT_vertex_group_merger(Panel):
             "range_selection_mode",
             text=bpy.app.translations.pgettext("Range Selection Mode"),
         )
+        row.prop(
+            settings,
+            "show_statistics",
+            text="",
+            icon="INFO",
+        )
+
+        # Rule-based selection
+        header, body = box.panel("vertex_group_merger_rules", default_closed=True)
+        header.label(text=bpy.app.translations.pgettext("Selection Rules"))
+        if body:
+            draw_selection_rules(body, context)
+            row = body.row(align=True)
+            row.operator(
+                "mesh.apply_selection_rules",
+                text=bpy.app.translations.pgettext("Apply Rules"),
+            ).extend = False
+            row.operator(
+                "mesh.apply_selection_rules",
+                text=bpy.app.translations.pgettext("Extend Selection"),
+            ).extend = True
 
         box.label(text=bpy.app.translations.pgettext("Select Source Groups"))
 
@@ -670,6 +2974,18 @@ class VIEW3D_PT_vertex_group_merger(Panel):
             rows=5,
         )
 
+        # Bulk selection
+        col = row.column(align=True)
+        col.operator(
+            "mesh.select_source_groups", text="", icon="CHECKBOX_HLT"
+        ).action = "SELECT"
+        col.operator(
+            "mesh.select_source_groups", text="", icon="CHECKBOX_DEHLT"
+        ).action = "DESELECT"
+        col.operator(
+            "mesh.select_source_groups", text="", icon="ARROW_LEFTRIGHT"
+        ).action = "INVERT"
+
         # Range selection mode help text
         if settings.range_selection_mode:
             help_box = box.box()
@@ -697,15 +3013,106 @@ class VIEW3D_PT_vertex_group_merger(Panel):
         row = layout.row()
         row.prop(settings, "keep_source_groups")
 
-        # Merge button
         row = layout.row()
+        row.prop(settings, "mirror")
+
+        row = layout.row()
+        row.prop(settings, "normalize_all")
+
+        row = layout.row(align=True)
+        row.prop(settings, "limit_influences")
+        sub = row.row(align=True)
+        sub.active = settings.limit_influences
+        sub.prop(settings, "max_influences", text="")
+
+        row = layout.row()
+        row.prop(settings, "mask_mode")
+        if settings.mask_mode == "GROUP":
+            row = layout.row()
+            row.prop_search(
+                settings,
+                "mask_group",
+                context.active_object,
+                "vertex_groups",
+                text=bpy.app.translations.pgettext("Mask Group"),
+            )
+
+        # Preview of the last dry run
+        summary: Optional[MergeSummary] = _merge_preview["summary"]
+        if (
+            summary is not None
+            and _merge_preview["target_group"] == settings.target_group
+        ):
+            draw_merge_preview(layout, summary)
+
+        # Merge button
+        row = layout.row(align=True)
         row.scale_y = 1.5
         row.operator(
-            "mesh.merge_vertex_groups",
+            "mesh.merge_vertex_groups_modal",
             text=bpy.app.translations.pgettext("Merge Selected Groups"),
         )
+        row.operator("mesh.preview_vertex_group_merge", text="", icon="HIDE_OFF")
         row.enabled = bool(settings.target_group)
 
+        # Merge on all selected objects
+        if len(context.selected_objects) > 1:
+            row = layout.row()
+            row.operator(
+                "mesh.merge_vertex_groups_selected",
+                text=bpy.app.translations.pgettext("Merge on Selected Objects"),
+            )
+            row.enabled = bool(settings.target_group)
+
+        # Revert journaled merges
+        if _weight_journals:
+            journal_bytes = sum(
+                journal.nbytes
+                for journals in _weight_journals
+                for journal in journals.values()
+            )
+            row = layout.row()
+            row.operator(
+                "mesh.revert_vertex_group_merge",
+                text=bpy.app.translations.pgettext("Revert Merge ({count})").format(
+                    count=len(_weight_journals)
+                ),
+                icon="LOOP_BACK",
+            )
+            row.label(text=f"{journal_bytes / 1024:.0f} KiB")
+
+        # Merge plan
+        box = layout.box()
+        box.label(text=bpy.app.translations.pgettext("Merge Plan"))
+        row = box.row(align=True)
+        row.operator(
+            "mesh.add_merge_plan_entry",
+            text=bpy.app.translations.pgettext("Add to Merge Plan"),
+            icon="ADD",
+        )
+        row.operator("mesh.remove_merge_plan_entry", text="", icon="REMOVE")
+        row.operator("mesh.clear_merge_plan", text="", icon="X")
+        if settings.merge_plan:
+            box.template_list(
+                "MESH_UL_merge_plan",
+                "",
+                settings,
+                "merge_plan",
+                settings,
+                "active_plan_index",
+                rows=3,
+            )
+            box.operator(
+                "mesh.execute_merge_plan",
+                text=bpy.app.translations.pgettext("Execute Merge Plan"),
+            )
+
+        # Timings of the last operations
+        header, body = layout.panel("vertex_group_merger_timings", default_closed=True)
+        header.label(text=bpy.app.translations.pgettext("Timings"))
+        if body:
+            draw_timing_records(body)
+
         # Toggle weight paint mode button
         if obj.mode == "WEIGHT_PAINT":
             return
@@ -717,15 +3124,102 @@ class VIEW3D_PT_vertex_group_merger(Panel):
         )
 
 
-def target_group_update(self, context) -> None:
-    """Update source list when target group changes"""
+class VIEW3D_PT_vertex_group_merger_bones(Panel):
+    """Collapse bones into their parent on the meshes of an armature"""
 
-    # Schedule list update via timer to avoid draw context issues
-    def timer_update():
-        bpy.ops.mesh.update_source_groups_list()
-        return None
+    bl_label = "Vertex Group Merger"
+    bl_idname = "VIEW3D_PT_vertex_group_merger_bones"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "Edit"
 
-    bpy.app.timers.register(timer_update, first_interval=0.01)
+    @classmethod
+    def poll(cls, context) -> bool:
+        return context.object and context.object.type == "ARMATURE"
+
+    def draw(self, context) -> None:
+        layout = self.layout
+        settings = context.scene.vertex_group_merger
+
+        row = layout.row()
+        row.prop(settings, "maintain_total_weight")
+
+        row = layout.row()
+        row.prop(settings, "keep_source_groups")
+
+        row = layout.row()
+        row.prop(settings, "normalize_all")
+
+        row = layout.row(align=True)
+        row.prop(settings, "limit_influences")
+        sub = row.row(align=True)
+        sub.active = settings.limit_influences
+        sub.prop(settings, "max_influences", text="")
+
+        row = layout.row()
+        row.operator(
+            "armature.collapse_bones_into_parent",
+            text=bpy.app.translations.pgettext("Collapse Bones into Parent"),
+        )
+
+
+def draw_timing_records(layout) -> None:
+    """Draw the latest timing record of each operation"""
+    latest: Dict[str, Dict[str, Any]] = {}
+    for record in _timing_records:
+        latest[record["operation"]] = record
+    if not latest:
+        layout.label(text=bpy.app.translations.pgettext("No timings recorded yet"))
+        return
+
+    for record in sorted(latest.values(), key=_timing_records.index, reverse=True):
+        box = layout.box()
+        box.label(
+            text=f"{record['operation']}: {record['total'] * 1000:.1f} ms",
+            icon="TIME",
+            translate=False,
+        )
+        col = box.column(align=True)
+        for phase, seconds in record["phases"].items():
+            col.label(text=f"{phase}: {seconds * 1000:.1f} ms", translate=False)
+        for counter, value in record["counters"].items():
+            col.label(text=f"{counter}: {value}", translate=False)
+        if "profile" in record:
+            col.label(text=record["profile"], icon="FILE", translate=False)
+
+
+def draw_merge_preview(layout, summary: MergeSummary) -> None:
+    """Draw preview counts and the weight histogram"""
+    box = layout.box()
+    box.label(
+        text=bpy.app.translations.pgettext(
+            "{affected} vertices affected, {clamped} clamped, {removed} removed"
+        ).format(
+            affected=summary.affected_count,
+            clamped=summary.clamped_count,
+            removed=summary.removed_count,
+        ),
+        icon="HIDE_OFF",
+    )
+
+    col = box.column(align=True)
+    peak = max(int(summary.histogram.max(initial=0)), summary.over_count, 1)
+    edges = summary.bin_edges
+    for i, count in enumerate(summary.histogram.tolist()):
+        col.progress(
+            factor=count / peak,
+            text=f"{edges[i]:.1f}–{edges[i + 1]:.1f}: {count}",
+        )
+    if summary.over_count:
+        col.progress(
+            factor=summary.over_count / peak,
+            text=f"> 1.0: {summary.over_count}",
+        )
+
+
+def target_group_update(self, context) -> None:
+    """Update source list when target group changes"""
+    schedule_source_groups_update()
 
 
 def range_selection_mode_update(self, context) -> None:
@@ -739,13 +3233,33 @@ def range_selection_mode_update(self, context) -> None:
 # Class registration/unregistration
 classes: List[Any] = [
     VertexGroupItem,
+    MergePlanSource,
+    MergePlanEntry,
     MESH_UL_merge_source_groups,
+    MESH_UL_merge_plan,
+    SelectionRule,
+    MESH_UL_selection_rules,
+    MESH_OT_add_selection_rule,
+    MESH_OT_remove_selection_rule,
+    MESH_OT_apply_selection_rules,
     MESH_OT_update_source_groups_list,
     MESH_OT_apply_range_selection,
+    MESH_OT_select_source_groups,
     MESH_OT_add_target_vertex_group,
+    MESH_OT_add_merge_plan_entry,
+    MESH_OT_remove_merge_plan_entry,
+    MESH_OT_clear_merge_plan,
     VertexGroupMergerSettings,
+    VertexGroupMergerPreferences,
     MESH_OT_merge_vertex_groups,
+    MESH_OT_merge_vertex_groups_modal,
+    MESH_OT_preview_vertex_group_merge,
+    MESH_OT_revert_vertex_group_merge,
+    MESH_OT_merge_vertex_groups_selected,
+    MESH_OT_execute_merge_plan,
+    ARMATURE_OT_collapse_bones_into_parent,
     VIEW3D_PT_vertex_group_merger,
+    VIEW3D_PT_vertex_group_merger_bones,
 ]
 
 
@@ -775,11 +3289,26 @@ def register() -> None:
         type=VertexGroupMergerSettings
     )
 
+    # Detect list changes from events instead of polling in Panel.draw
+    subscribe_change_notifications()
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_load_post)
+    bpy.app.handlers.undo_post.append(on_undo_redo)
+    bpy.app.handlers.redo_post.append(on_undo_redo)
+    schedule_source_groups_update()
+
 
 def unregister() -> None:
     # Unregister translations
     bpy.app.translations.unregister(__package__)
 
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    bpy.app.handlers.load_post.remove(on_load_post)
+    bpy.app.handlers.undo_post.remove(on_undo_redo)
+    bpy.app.handlers.redo_post.remove(on_undo_redo)
+    drop_membership_index()
+
     del bpy.types.Scene.vertex_group_merger
 
     for cls in reversed(classes):
@@ -0,0 +1,133 @@
+# Batch merge driver
+#
+# Applies one merge specification (see batch_worker.py) to many .blend files,
+# running a pool of headless Blender processes, and collects a per-file timing
+# and result report. Runs with plain Python:
+#   python batch/batch_merge.py spec.json assets/ --blender /path/to/blender --jobs 8
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_worker.py")
+
+
+def collect_blend_files(paths: List[str]) -> List[Path]:
+    """Expand directories into the .blend files they contain"""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob("*.blend")))
+        else:
+            files.append(path)
+    return files
+
+
+def run_file(
+    path: Path, options: argparse.Namespace, report_dir: str, index: int
+) -> Dict:
+    """Run the worker on one file in its own Blender process"""
+    report_path = os.path.join(report_dir, f"{index:05d}.json")
+    command = [
+        options.blender,
+        "-b",
+        "--factory-startup",
+        str(path),
+        "--python",
+        WORKER,
+        "--",
+        "--spec",
+        os.path.abspath(options.spec),
+        "--report",
+        report_path,
+    ]
+    if options.no_save:
+        command.append("--no-save")
+    elif options.output_dir:
+        command += [
+            "--output",
+            os.path.join(os.path.abspath(options.output_dir), path.name),
+        ]
+
+    start = time.perf_counter()
+    try:
+        process = subprocess.run(
+            command, capture_output=True, text=True, timeout=options.timeout
+        )
+        returncode: Optional[int] = process.returncode
+        output = process.stdout + process.stderr
+    except subprocess.TimeoutExpired:
+        returncode = None
+        output = ""
+    elapsed = time.perf_counter() - start
+
+    row = {"file": str(path), "seconds": elapsed, "returncode": returncode}
+    if os.path.exists(report_path):
+        with open(report_path, encoding="utf-8") as f:
+            row.update({k: v for k, v in json.load(f).items() if k != "file"})
+        row["seconds"] = elapsed  # wall time including Blender startup and load
+    elif returncode is None:
+        row["error"] = f"Timed out after {options.timeout} s"
+    else:
+        # Blender failed before the worker could write a report
+        row["error"] = output[-2000:] or f"Blender exited with code {returncode}"
+    return row
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Merge vertex groups in .blend files")
+    parser.add_argument("spec", help="Merge specification (JSON)")
+    parser.add_argument("paths", nargs="+", help=".blend files or directories")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output-dir", help="Save results here instead of in place")
+    parser.add_argument("--no-save", action="store_true", help="Dry run")
+    parser.add_argument("--timeout", type=float, help="Seconds per file")
+    parser.add_argument("--report", help="Write the combined report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    options = parse_args(argv)
+    files = collect_blend_files(options.paths)
+    if options.output_dir:
+        os.makedirs(options.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as report_dir:
+        with ThreadPoolExecutor(max_workers=max(1, options.jobs)) as pool:
+            rows = list(
+                pool.map(
+                    lambda item: run_file(item[1], options, report_dir, item[0]),
+                    enumerate(files),
+                )
+            )
+    elapsed = time.perf_counter() - start
+
+    header = f"{'status':<8} {'merged':>6} {'seconds':>9}  file"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        merged = sum(1 for m in row.get("merges", []) if m["status"] == "merged")
+        status = "error" if row.get("error") else "ok"
+        print(f"{status:<8} {merged:>6} {row['seconds']:>9.2f}  {row['file']}")
+
+    failed = sum(1 for row in rows if row.get("error"))
+    print(f"{len(rows)} files, {failed} failed, {elapsed:.2f} s")
+
+    if options.report:
+        with open(options.report, "w", encoding="utf-8") as f:
+            json.dump({"seconds": elapsed, "files": rows}, f, indent=2)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,204 @@
+# Headless batch merge worker
+#
+# Applies a merge specification to the loaded .blend file with the same merge code
+# as the add-on's merge operator. Normally started by batch_merge.py, but it can be
+# run on a single file:
+#   blender -b file.blend --python batch/batch_worker.py -- --spec spec.json
+#
+# Spec format (JSON):
+#   {"merges": [{"target": "spine", "sources": ["spine.001", "spine.002"],
+#                "objects": ["Body"], "operation_mode": "ADD"}]}
+# "objects" defaults to every mesh object. Any MergeOptions field
+# (maintain_total_weight, operation_mode, keep_source_groups, normalize_all,
+# max_influences, mask_mode, mask_group) can be set per merge, and
+# "source_factors" maps source names to weight multipliers, e.g. {"spine.002": 0.5}.
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from typing import Dict, List
+
+import bpy
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADDON_NAME = "vertex_group_merger"
+
+# Options that only make sense in the UI
+EXCLUDED_OPTIONS = {"record_journal"}
+
+
+class MergeSpecError(ValueError):
+    pass
+
+
+def load_addon():
+    """Import the add-on package from this checkout (registration is not needed)"""
+    if ADDON_NAME in sys.modules:
+        return sys.modules[ADDON_NAME]
+
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME,
+        os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations=[ADDON_DIR],
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_merge_spec(path: str, addon) -> List[Dict]:
+    """
+    Read and validate a merge specification
+
+    Raises:
+        MergeSpecError: If an entry is missing its target or sources, has
+            unknown keys or an unknown operation or mask mode
+    """
+    with open(path, encoding="utf-8") as f:
+        merges = json.load(f).get("merges", [])
+
+    allowed = {"target", "sources", "objects"} | set(addon.MergeOptions._fields)
+    allowed -= EXCLUDED_OPTIONS
+    for i, merge in enumerate(merges):
+        if not merge.get("target") or not merge.get("sources"):
+            raise MergeSpecError(f"Merge {i} needs a target and sources")
+        if not isinstance(merge.get("source_factors", {}), dict):
+            raise MergeSpecError(f"Merge {i} source_factors must be an object")
+        unknown = set(merge) - allowed
+        if unknown:
+            raise MergeSpecError(f"Merge {i} has unknown keys: {sorted(unknown)}")
+        for key, modes in (
+            ("operation_mode", addon.merge_core.OPERATION_MODES),
+            ("mask_mode", addon.merge_core.MASK_MODES),
+        ):
+            if key in merge and merge[key] not in modes:
+                raise MergeSpecError(
+                    f"Merge {i} {key} must be one of {list(modes)}, "
+                    f"not {merge[key]!r}"
+                )
+        if merge.get("mask_mode") == "GROUP" and not merge.get("mask_group"):
+            raise MergeSpecError(f"Merge {i} mask_mode GROUP needs a mask_group")
+    return merges
+
+
+def apply_merge_spec(addon, merges: List[Dict]) -> List[Dict]:
+    """
+    Run every merge of the spec on the loaded file
+
+    Returns:
+        One result row per object and merge, including skipped objects
+    """
+    rows = []
+    for merge in merges:
+        fields = {k: v for k, v in merge.items() if k in addon.MergeOptions._fields}
+        if "source_factors" in fields:
+            fields["source_factors"] = tuple(fields["source_factors"].items())
+        options = addon.MergeOptions(**fields)
+        target_name: str = merge["target"]
+        source_names = [name for name in merge["sources"] if name != target_name]
+
+        if "objects" in merge:
+            objects = [bpy.data.objects.get(name) for name in merge["objects"]]
+            for name, obj in zip(merge["objects"], objects):
+                if obj is None:
+                    rows.append(
+                        {"object": name, "target": target_name, "status": "missing"}
+                    )
+            objects = [obj for obj in objects if obj is not None]
+        else:
+            objects = [obj for obj in bpy.data.objects if obj.type == "MESH"]
+
+        # Resolves groups and skips objects sharing mesh data, like the
+        # selected-objects operator
+        jobs = addon._collect_merge_jobs(objects, target_name, source_names)
+        if options.mask_mode == "GROUP":
+            # Without the mask group nothing would be merged
+            jobs = [
+                job
+                for job in jobs
+                if job[0].vertex_groups.get(options.mask_group) is not None
+            ]
+        merged_objects = {obj.name for obj, _, _ in jobs}
+        for obj in objects:
+            if obj.name not in merged_objects:
+                rows.append(
+                    {"object": obj.name, "target": target_name, "status": "skipped"}
+                )
+
+        for obj, target_group, source_groups in jobs:
+            merged_names = [g.name for g in source_groups]
+            target_idx = target_group.index
+            start = time.perf_counter()
+            with addon.timed_operation("batch") as timings:
+                outcome, removed_vertices, _ = addon.merge_object_vertex_groups(
+                    obj, source_groups, target_group, options
+                )
+            rows.append(
+                {
+                    "object": obj.name,
+                    "target": target_name,
+                    "status": "merged",
+                    "sources": merged_names,
+                    "missing_sources": [
+                        name for name in source_names if name not in merged_names
+                    ],
+                    "affected": len(outcome.results[target_idx].vertex_indices),
+                    "removed": removed_vertices,
+                    "normalized": outcome.normalized_count,
+                    "trimmed": outcome.trimmed_count,
+                    "seconds": time.perf_counter() - start,
+                    "phases": timings.phases,
+                    "counters": timings.counters,
+                }
+            )
+    return rows
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Apply a merge spec to this file")
+    parser.add_argument("--spec", required=True, help="Merge specification (JSON)")
+    parser.add_argument("--report", help="Write the result report to this file")
+    parser.add_argument("--output", help="Save to this file instead of in place")
+    parser.add_argument("--no-save", action="store_true", help="Do not save")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    options = parse_args(argv)
+    report = {"file": bpy.data.filepath, "merges": [], "saved": None, "error": None}
+    start = time.perf_counter()
+
+    try:
+        addon = load_addon()
+        merges = load_merge_spec(options.spec, addon)
+        report["merges"] = apply_merge_spec(addon, merges)
+
+        if not options.no_save:
+            if options.output:
+                bpy.ops.wm.save_as_mainfile(filepath=options.output, copy=True)
+                report["saved"] = options.output
+            else:
+                bpy.ops.wm.save_mainfile()
+                report["saved"] = bpy.data.filepath
+    except Exception:
+        report["error"] = traceback.format_exc()
+
+    report["seconds"] = time.perf_counter() - start
+    if options.report:
+        with open(options.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    return 1 if report["error"] else 0
+
+
+if __name__ == "__main__":
+    # Blender passes script arguments after "--"
+    args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else []
+    sys.exit(main(args))
@@ -0,0 +1,231 @@
+# Merge benchmark suite
+#
+# Times the scan, compute and write phases of a merge for every backend on
+# synthetic meshes of configurable size and sparsity.
+#
+# Stub mode (plain Python, no Blender required):
+#   python benchmarks/bench_merge.py --preset quick
+#
+# Blender mode (real meshes, run headless):
+#   blender -b --factory-startup --python benchmarks/bench_merge.py -- --preset quick
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Set
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import merge_core  # noqa: E402
+from synthetic import (  # noqa: E402
+    MeshSpec,
+    StubVertices,
+    build_stub_group,
+    generate_mesh,
+)
+
+try:
+    import bpy  # noqa: F401
+
+    IN_BLENDER = True
+except ImportError:
+    IN_BLENDER = False
+
+
+PRESETS: Dict[str, Dict[str, List[int]]] = {
+    "quick": {
+        "vertices": [10_000, 100_000],
+        "groups": [10, 100],
+        "influences": [4],
+    },
+    "full": {
+        "vertices": [10_000, 100_000, 1_000_000, 5_000_000],
+        "groups": [10, 100, 1000],
+        "influences": [1, 4, 8],
+    },
+}
+
+
+# Backends
+# Each backend receives (vertices, target_group, source_indices, options) and
+# returns the elapsed seconds per phase.
+
+
+def run_loop_backend(vertices, target_group, source_indices: Set[int], options) -> Dict:
+    """Reference per-vertex implementation (v0.6.0), scan and compute are fused"""
+    target_idx = target_group.index
+    timings = {}
+
+    start = time.perf_counter()
+    vertex_weights = {}
+    for v in vertices:
+        target_weight = 0.0
+        source_sum = 0.0
+        relevant = False
+        for g in v.groups:
+            if g.group == target_idx:
+                target_weight = g.weight
+                relevant = True
+            elif g.group in source_indices:
+                source_sum += g.weight
+                relevant = True
+        if not relevant:
+            continue
+        if options.mode == "ADD":
+            weight = target_weight + source_sum
+        else:
+            weight = target_weight - source_sum
+        weight = max(0.0, weight)
+        if options.mode == "SUBTRACT" and weight < 1e-6:
+            weight = 0.0
+        if options.clamp and weight > 1.0:
+            weight = 1.0
+        vertex_weights[v.index] = weight
+    timings["scan"] = time.perf_counter() - start
+    timings["compute"] = 0.0
+
+    start = time.perf_counter()
+    for vertex_index, weight in vertex_weights.items():
+        if weight > 0.0:
+            target_group.add([vertex_index], weight, "REPLACE")
+        else:
+            try:
+                target_group.remove([vertex_index])
+            except RuntimeError:
+                pass
+    timings["write"] = time.perf_counter() - start
+
+    return timings
+
+
+def run_numpy_backend(
+    vertices, target_group, source_indices: Set[int], options
+) -> Dict:
+    """merge_core array implementation"""
+    target_idx = target_group.index
+    timings = {}
+
+    start = time.perf_counter()
+    memberships = merge_core.extract_group_weights(
+        vertices, source_indices | {target_idx}
+    )
+    timings["scan"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = merge_core.compute_merged_weights(
+        memberships, target_idx, options.clamp, options.mode
+    )
+    timings["compute"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merge_core.apply_merge_result(target_group, result)
+    timings["write"] = time.perf_counter() - start
+
+    return timings
+
+
+BACKENDS: Dict[str, Callable] = {
+    "loop": run_loop_backend,
+    "numpy": run_numpy_backend,
+}
+
+
+# Runner
+
+
+def run_case(spec: MeshSpec, backend: str, options) -> Dict:
+    """Run one backend on one mesh, keeping the fastest of options.repeat runs"""
+    mesh = generate_mesh(spec)
+    source_indices = set(range(1, min(options.sources, spec.group_count - 1) + 1))
+    best = None
+
+    for _ in range(options.repeat):
+        # Every run starts from pristine weights
+        if IN_BLENDER and not options.stub:
+            from synthetic import build_blender_object, remove_blender_object
+
+            obj = build_blender_object(mesh)
+            try:
+                timings = BACKENDS[backend](
+                    obj.data.vertices, obj.vertex_groups[0], source_indices, options
+                )
+            finally:
+                remove_blender_object(obj)
+        else:
+            timings = BACKENDS[backend](
+                StubVertices(mesh), build_stub_group(mesh, 0), source_indices, options
+            )
+
+        timings["total"] = sum(timings.values())
+        if best is None or timings["total"] < best["total"]:
+            best = timings
+
+    return {
+        "backend": backend,
+        "vertices": spec.vertex_count,
+        "groups": spec.group_count,
+        "influences": spec.influences,
+        "sources": len(source_indices),
+        **best,
+    }
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark vertex group merging")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--vertices", type=int, nargs="+")
+    parser.add_argument("--groups", type=int, nargs="+")
+    parser.add_argument("--influences", type=int, nargs="+")
+    parser.add_argument("--sources", type=int, default=8)
+    parser.add_argument("--mode", choices=["ADD", "SUBTRACT"], default="ADD")
+    parser.add_argument("--clamp", action="store_true")
+    parser.add_argument(
+        "--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--stub", action="store_true", help="Use stub meshes in Blender"
+    )
+    parser.add_argument("--json", help="Write results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> None:
+    options = parse_args(argv)
+    preset = PRESETS[options.preset]
+    vertex_counts = options.vertices or preset["vertices"]
+    group_counts = options.groups or preset["groups"]
+    influence_counts = options.influences or preset["influences"]
+
+    environment = "blender" if IN_BLENDER and not options.stub else "stub"
+    print(f"Environment: {environment}, mode: {options.mode}, clamp: {options.clamp}")
+    header = f"{'backend':<8} {'mesh':<24} {'scan':>9} {'compute':>9} {'write':>9} {'total':>9}"
+    print(header)
+    print("-" * len(header))
+
+    results = []
+    for vertex_count, group_count, influences in itertools.product(
+        vertex_counts, group_counts, influence_counts
+    ):
+        spec = MeshSpec(vertex_count, group_count, influences)
+        for backend in options.backends:
+            row = run_case(spec, backend, options)
+            results.append(row)
+            print(
+                f"{backend:<8} {spec.label:<24} {row['scan']:>9.4f} "
+                f"{row['compute']:>9.4f} {row['write']:>9.4f} {row['total']:>9.4f}"
+            )
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    # Blender passes script arguments after "--"
+    args = sys.argv[sys.argv.index("--") + 1 :] if "--" in sys.argv else sys.argv[1:]
+    main(args)
@@ -0,0 +1,163 @@
+# Synthetic mesh generation for the merge benchmarks
+# Meshes are described as flat membership arrays and can be materialized either as
+# lightweight stub objects (plain Python) or as real Blender meshes (blender -b).
+
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+
+class MeshSpec(NamedTuple):
+    """Size and sparsity of a synthetic mesh"""
+
+    vertex_count: int
+    group_count: int
+    influences: int  # vertex group memberships per vertex
+    seed: int = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.vertex_count}v/{self.group_count}g/{self.influences}i"
+
+
+class SyntheticMesh(NamedTuple):
+    """Vertex group memberships in CSR layout (offsets into groups/weights)"""
+
+    spec: MeshSpec
+    offsets: np.ndarray  # int64, vertex_count + 1
+    groups: np.ndarray  # int32
+    weights: np.ndarray  # float32
+
+
+def generate_mesh(spec: MeshSpec) -> SyntheticMesh:
+    """
+    Generate memberships with a fixed number of distinct groups per vertex
+
+    Weights are quantized to 1/256 steps and about half of them are exactly 1.0,
+    which mirrors typical skinning data and keeps bucketed writes realistic.
+    """
+    rng = np.random.default_rng(spec.seed)
+    influences = min(spec.influences, spec.group_count)
+
+    base = rng.integers(0, spec.group_count, size=spec.vertex_count)
+    groups = (base[:, None] + np.arange(influences)[None, :]) % spec.group_count
+
+    weights = np.round(rng.random((spec.vertex_count, influences)) * 256.0) / 256.0
+    weights[rng.random(weights.shape) < 0.5] = 1.0
+    weights = np.maximum(weights, 1.0 / 256.0)
+
+    offsets = np.arange(spec.vertex_count + 1, dtype=np.int64) * influences
+    return SyntheticMesh(
+        spec,
+        offsets,
+        groups.astype(np.int32).ravel(),
+        weights.astype(np.float32).ravel(),
+    )
+
+
+# Stub mesh (no bpy)
+
+
+class StubGroupElement:
+    __slots__ = ("group", "weight")
+
+    def __init__(self, group: int, weight: float):
+        self.group = group
+        self.weight = weight
+
+
+class StubVertex:
+    __slots__ = ("index", "groups")
+
+    def __init__(self, index: int, groups: List[StubGroupElement]):
+        self.index = index
+        self.groups = groups
+
+
+class StubVertices:
+    """Iterates vertices like mesh.vertices, building element wrappers on access"""
+
+    def __init__(self, mesh: SyntheticMesh):
+        self._offsets = mesh.offsets.tolist()
+        self._groups = mesh.groups.tolist()
+        self._weights = mesh.weights.tolist()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        groups = self._groups
+        weights = self._weights
+        offsets = self._offsets
+        for index in range(len(offsets) - 1):
+            yield StubVertex(
+                index,
+                [
+                    StubGroupElement(groups[i], weights[i])
+                    for i in range(offsets[index], offsets[index + 1])
+                ],
+            )
+
+
+class StubVertexGroup:
+    """Blender-compatible add()/remove() writing into a dense weight array"""
+
+    def __init__(self, index: int, vertex_count: int):
+        self.index = index
+        self.weights = np.full(vertex_count, np.nan, dtype=np.float32)
+        self.add_calls = 0
+        self.remove_calls = 0
+
+    def add(self, index: List[int], weight: float, type: str) -> None:
+        self.add_calls += 1
+        self.weights[index] = weight
+
+    def remove(self, index: List[int]) -> None:
+        self.remove_calls += 1
+        if np.isnan(self.weights[index]).any():
+            raise RuntimeError("Vertex not in group")
+        self.weights[index] = np.nan
+
+
+def build_stub_group(mesh: SyntheticMesh, group_index: int) -> StubVertexGroup:
+    """Create a stub vertex group preloaded with the synthetic memberships"""
+    spec = mesh.spec
+    group = StubVertexGroup(group_index, spec.vertex_count)
+    owners = np.repeat(np.arange(spec.vertex_count), np.diff(mesh.offsets))
+    members = mesh.groups == group_index
+    group.weights[owners[members]] = mesh.weights[members]
+    return group
+
+
+# Blender mesh (blender -b only)
+
+
+def build_blender_object(mesh: SyntheticMesh, name: Optional[str] = None):
+    """Create a mesh object with the synthetic vertex groups assigned"""
+    import bpy
+
+    from merge_core import add_weights_bucketed
+
+    spec = mesh.spec
+    name = name or f"bench_{spec.label}"
+    data = bpy.data.meshes.new(name)
+    data.vertices.add(spec.vertex_count)
+    data.vertices.foreach_set("co", np.zeros(spec.vertex_count * 3, dtype=np.float32))
+    obj = bpy.data.objects.new(name, data)
+
+    counts = np.diff(mesh.offsets)
+    owners = np.repeat(np.arange(spec.vertex_count, dtype=np.int32), counts)
+    for group_index in range(spec.group_count):
+        vertex_group = obj.vertex_groups.new(name=f"Group_{group_index:04d}")
+        members = mesh.groups == group_index
+        add_weights_bucketed(vertex_group, owners[members], mesh.weights[members])
+
+    return obj
+
+
+def remove_blender_object(obj) -> None:
+    import bpy
+
+    data = obj.data
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(data)
@@ -0,0 +1,1178 @@
+# Vertex weight merge core
+# Pure Python/NumPy implementation of the merge math. This module must not import
+# bpy so it can be benchmarked and reused outside of Blender. Mesh access is duck
+# typed: "vertices" only needs .index and .groups (with .group/.weight), and target
+# groups only need Blender-compatible add()/remove() methods.
+
+import os
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+
+class MembershipArrays(NamedTuple):
+    """Flat vertex group memberships, one entry per (vertex, group) pair"""
+
+    vertex_indices: np.ndarray  # int32
+    group_indices: np.ndarray  # int32
+    weights: np.ndarray  # float32
+
+
+class MergeResult(NamedTuple):
+    """Merged target weights for every vertex touched by the merge"""
+
+    vertex_indices: np.ndarray  # int32, sorted
+    weights: np.ndarray  # float32
+    in_target: np.ndarray  # bool, vertex was already a member of the target
+    clamped_count: int = 0  # weights limited to 1.0 by maintain_total_weight
+
+
+class MergeSummary(NamedTuple):
+    """What a merge result would change, for previews"""
+
+    affected_count: int
+    clamped_count: int
+    removed_count: int
+    histogram: np.ndarray  # int64, counts of written weights per bin
+    bin_edges: np.ndarray  # len(histogram) + 1 bin boundaries
+    over_count: int  # written weights above the last bin edge
+
+
+OPERATION_MODES = ("ADD", "SUBTRACT", "MAX", "MIN", "MULTIPLY")
+MASK_MODES = ("NONE", "SELECTED", "GROUP")
+
+
+class MergeOptions(NamedTuple):
+    """User options of a merge"""
+
+    maintain_total_weight: bool = False
+    operation_mode: str = "ADD"  # 'ADD', 'SUBTRACT', 'MAX', 'MIN' or 'MULTIPLY'
+    keep_source_groups: bool = False
+    normalize_all: bool = False  # rescale all groups on merged vertices
+    max_influences: int = 0  # groups per merged vertex, 0 for no limit
+    record_journal: bool = False  # keep previous weights for reverting
+    # (group name, factor) pairs for sources whose factor is not 1.0
+    source_factors: Tuple[Tuple[str, float], ...] = ()
+    mask_mode: str = "NONE"  # 'NONE', 'SELECTED' or 'GROUP'
+    mask_group: str = ""  # name of the mask group in 'GROUP' mode
+
+    @property
+    def masked(self) -> bool:
+        """Whether the merge is restricted to some of the vertices"""
+        return self.mask_mode != "NONE"
+
+    @property
+    def deletes_source_groups(self) -> bool:
+        """Whether source groups are deleted (masked merges only clear the mask)"""
+        return not self.keep_source_groups and not self.masked
+
+    @property
+    def reads_all_groups(self) -> bool:
+        """Whether the merge needs the memberships of every group"""
+        return self.normalize_all or self.max_influences > 0
+
+
+class MergeOutcome(NamedTuple):
+    """Final weights of a merge: target results and other changed groups"""
+
+    results: Dict[int, MergeResult]  # by target group index
+    group_weights: Dict[int, Tuple[np.ndarray, np.ndarray]]  # other groups
+    group_removals: Dict[int, np.ndarray]  # vertices to remove, by group index
+    normalized_count: int = 0  # vertices whose weights were rescaled
+    trimmed_count: int = 0  # vertices that lost influences to the limit
+    # Set by record_previous_weights: (vertex indices, weights) by group index
+    previous_weights: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None
+    removed_weights: Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]] = None
+
+
+class RemovedGroup(NamedTuple):
+    """A vertex group deleted by a merge, with everything needed to recreate it"""
+
+    name: str
+    lock_weight: bool
+    vertex_indices: np.ndarray  # int32
+    weights: np.ndarray  # float32
+
+
+class WeightJournal(NamedTuple):
+    """Previous weights of everything a merge changed on one mesh"""
+
+    # (vertex indices, weights) by group name, NaN for vertices that were not members
+    changed_groups: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    removed_groups: List[RemovedGroup]
+    # Groups created for the merge (e.g. a missing target), deleted on revert
+    created_groups: Tuple[str, ...] = ()
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [a for pair in self.changed_groups.values() for a in pair]
+        arrays += [
+            a for g in self.removed_groups for a in (g.vertex_indices, g.weights)
+        ]
+        return sum(a.nbytes for a in arrays)
+
+
+class GroupStatistics(NamedTuple):
+    """Per-group statistics, indexed by vertex group index"""
+
+    member_counts: np.ndarray  # int32
+    weight_sums: np.ndarray  # float32
+    max_weights: np.ndarray  # float32
+    shared_counts: np.ndarray  # int32, vertices also in the target group
+    target_idx: int
+
+
+class PhaseTimings:
+    """Wall-clock time per phase and event counters of one operation"""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.phases: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block, adding to earlier time of the same phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_record(self) -> Dict[str, Any]:
+        """Return the timings as a JSON-serializable record"""
+        return {
+            "operation": self.operation,
+            "total": time.perf_counter() - self.start,
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+        }
+
+
+def extract_group_weights(
+    vertices: Iterable,
+    group_indices: Optional[Set[int]],
+    vertex_indices: Optional[np.ndarray] = None,
+) -> MembershipArrays:
+    """
+    Read the weights of the given groups into flat arrays in one pass
+
+    Args:
+        vertices: Mesh vertices (e.g. mesh.vertices)
+        group_indices: Indices of the vertex groups to read, or None for all
+        vertex_indices: Sorted indices of the only vertices to visit (a mask),
+            or None for all
+
+    Returns:
+        Membership arrays in vertex order
+    """
+    vertex_buffer = array("i")
+    group_buffer = array("i")
+    weight_buffer = array("f")
+
+    if vertex_indices is not None:
+        vertices = map(vertices.__getitem__, vertex_indices.tolist())
+    for v in vertices:
+        for g in v.groups:
+            if group_indices is None or g.group in group_indices:
+                vertex_buffer.append(v.index)
+                group_buffer.append(g.group)
+                weight_buffer.append(g.weight)
+
+    return MembershipArrays(
+        np.frombuffer(vertex_buffer, dtype=np.int32),
+        np.frombuffer(group_buffer, dtype=np.int32),
+        np.frombuffer(weight_buffer, dtype=np.float32),
+    )
+
+
+def iter_group_weight_chunks(
+    vertices: Iterable, group_indices: Optional[Set[int]], chunk_size: int
+) -> Iterator[MembershipArrays]:
+    """
+    Read weights like extract_group_weights, one chunk of vertices at a time
+
+    Lets a long scan be spread over several steps (e.g. timer ticks of a modal
+    operator). Join the chunks with concatenate_memberships.
+    """
+    iterator = iter(vertices)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield extract_group_weights(chunk, group_indices)
+
+
+def concatenate_memberships(chunks: Sequence[MembershipArrays]) -> MembershipArrays:
+    """Join membership chunks read in vertex order"""
+    return MembershipArrays(
+        np.concatenate(
+            [np.zeros(0, dtype=np.int32)] + [c.vertex_indices for c in chunks]
+        ),
+        np.concatenate(
+            [np.zeros(0, dtype=np.int32)] + [c.group_indices for c in chunks]
+        ),
+        np.concatenate([np.zeros(0, dtype=np.float32)] + [c.weights for c in chunks]),
+    )
+
+
+def extract_deform_weights(
+    deform_verts: Iterable,
+    group_indices: Optional[Set[int]],
+    vertex_indices: Optional[np.ndarray] = None,
+) -> MembershipArrays:
+    """
+    Read the weights of the given groups from per-vertex deform mappings
+
+    Args:
+        deform_verts: Group index to weight mapping of each vertex in vertex order
+            (e.g. the bmesh deform layer values in edit mode)
+        group_indices: Indices of the vertex groups to read, or None for all
+        vertex_indices: Sorted vertex index of each mapping when deform_verts
+            only holds the masked vertices, or None
+
+    Returns:
+        Membership arrays in vertex order
+    """
+    vertex_buffer = array("i")
+    group_buffer = array("i")
+    weight_buffer = array("f")
+
+    if vertex_indices is None:
+        indexed = enumerate(deform_verts)
+    else:
+        indexed = zip(vertex_indices.tolist(), deform_verts)
+    for index, dvert in indexed:
+        for group, weight in dvert.items():
+            if group_indices is None or group in group_indices:
+                vertex_buffer.append(index)
+                group_buffer.append(group)
+                weight_buffer.append(weight)
+
+    return MembershipArrays(
+        np.frombuffer(vertex_buffer, dtype=np.int32),
+        np.frombuffer(group_buffer, dtype=np.int32),
+        np.frombuffer(weight_buffer, dtype=np.float32),
+    )
+
+
+def select_groups(
+    memberships: MembershipArrays, group_indices: Iterable[int]
+) -> MembershipArrays:
+    """Return only the memberships of the given groups"""
+    mask = np.isin(
+        memberships.group_indices, np.fromiter(group_indices, dtype=np.int32)
+    )
+    return MembershipArrays(
+        memberships.vertex_indices[mask],
+        memberships.group_indices[mask],
+        memberships.weights[mask],
+    )
+
+
+class MembershipIndex:
+    """
+    Inverted index of a mesh's weights: group index to sorted member arrays
+
+    Built from one full scan and kept across merges. Merges update only the
+    groups they wrote, so later reads only touch the members of the groups
+    they ask for.
+    """
+
+    def __init__(
+        self, memberships: MembershipArrays, group_count: int, vertex_count: int
+    ):
+        # Counts of the indexed mesh, for detecting changes made elsewhere
+        self.group_count = group_count
+        self.vertex_count = vertex_count
+        self.groups: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+        vertex_indices, group_indices, weights = memberships
+        order = np.lexsort((vertex_indices, group_indices))
+        boundaries = np.flatnonzero(np.diff(group_indices[order])) + 1
+        for entries in np.split(order, boundaries):
+            if len(entries):
+                group = int(group_indices[entries[0]])
+                self.groups[group] = (vertex_indices[entries], weights[entries])
+
+    @property
+    def nbytes(self) -> int:
+        return sum(v.nbytes + w.nbytes for v, w in self.groups.values())
+
+    def memberships(
+        self,
+        group_indices: Optional[Iterable[int]] = None,
+        vertex_indices: Optional[np.ndarray] = None,
+    ) -> MembershipArrays:
+        """
+        Return the memberships of the given groups like extract_group_weights
+
+        Args:
+            group_indices: Groups to return, or None for all
+            vertex_indices: Indices of the only vertices to return (a mask), or None
+
+        Returns:
+            Membership arrays in vertex order
+        """
+        if group_indices is None:
+            group_indices = self.groups.keys()
+        groups = sorted(g for g in group_indices if g in self.groups)
+
+        vertex_parts = [np.zeros(0, dtype=np.int32)]
+        group_parts = [np.zeros(0, dtype=np.int32)]
+        weight_parts = [np.zeros(0, dtype=np.float32)]
+        for group in groups:
+            members, weights = self.groups[group]
+            if vertex_indices is not None:
+                inside = np.isin(members, vertex_indices, assume_unique=True)
+                members, weights = members[inside], weights[inside]
+            vertex_parts.append(members)
+            group_parts.append(np.full(len(members), group, dtype=np.int32))
+            weight_parts.append(weights)
+
+        vertices = np.concatenate(vertex_parts)
+        order = np.argsort(vertices, kind="stable")
+        return MembershipArrays(
+            vertices[order],
+            np.concatenate(group_parts)[order],
+            np.concatenate(weight_parts)[order],
+        )
+
+    def apply_outcome(self, outcome: MergeOutcome) -> None:
+        """Update the groups written by apply_merge_outcome"""
+        for target, result in outcome.results.items():
+            # Zero weights are removed or never added on write
+            has_weight = result.weights > 0.0
+            self._replace_members(
+                target,
+                result.vertex_indices,
+                result.vertex_indices[has_weight],
+                result.weights[has_weight],
+            )
+        for group, (vertex_indices, weights) in outcome.group_weights.items():
+            self._replace_members(group, vertex_indices, vertex_indices, weights)
+        for group, vertex_indices in outcome.group_removals.items():
+            self._replace_members(
+                group,
+                vertex_indices,
+                np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=np.float32),
+            )
+
+    def remove_groups(self, group_indices: Iterable[int]) -> None:
+        """Drop deleted groups and shift the indices of the groups after them"""
+        for removed in sorted(group_indices, reverse=True):
+            self.groups = {
+                group - (group > removed): members
+                for group, members in self.groups.items()
+                if group != removed
+            }
+            self.group_count -= 1
+
+    def _replace_members(
+        self,
+        group: int,
+        written: np.ndarray,
+        vertex_indices: np.ndarray,
+        weights: np.ndarray,
+    ) -> None:
+        """Replace the memberships of group on the written vertices"""
+        members, member_weights = self.groups.get(
+            group, (np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32))
+        )
+        kept = ~np.isin(members, written)
+        members = np.concatenate([members[kept], vertex_indices]).astype(np.int32)
+        member_weights = np.concatenate([member_weights[kept], weights]).astype(
+            np.float32
+        )
+        order = np.argsort(members, kind="stable")
+        if len(order):
+            self.groups[group] = (members[order], member_weights[order])
+        else:
+            self.groups.pop(group, None)
+
+
+def compute_merged_weights(
+    memberships: MembershipArrays,
+    target_idx: int,
+    maintain_total_weight: bool,
+    operation_mode: str,
+    source_factors: Optional[Mapping[int, float]] = None,
+) -> MergeResult:
+    """
+    Calculate merged target weights from flat membership arrays
+
+    Every group in memberships other than target_idx is treated as a source.
+    Accumulation is done in float64 to match the original per-vertex loop,
+    then the result is narrowed to float32 as stored by Blender.
+
+    Source weights are scaled by their factor before they are combined. In MIN
+    and MULTIPLY mode a vertex missing from the target or any source counts as
+    weight 0, like vertices outside a group when deforming.
+
+    Args:
+        memberships: Memberships of the target and source groups
+        target_idx: Index of the target vertex group
+        maintain_total_weight: Flag to keep merged weight ≤ 1.0
+        operation_mode: 'ADD', 'SUBTRACT', 'MAX', 'MIN' or 'MULTIPLY'
+        source_factors: Factor of every source group by index, defaults to 1.0
+            for each source found in memberships
+
+    Returns:
+        Merged weights for every vertex in the target or any source
+
+    Raises:
+        ValueError: If operation_mode is not one of OPERATION_MODES
+    """
+    if operation_mode not in OPERATION_MODES:
+        raise ValueError(f"Unknown operation mode: {operation_mode!r}")
+
+    vertex_indices, group_indices, weights = memberships
+    vertices, slots = np.unique(vertex_indices, return_inverse=True)
+    count = len(vertices)
+
+    is_target = group_indices == target_idx
+    target_weights = np.zeros(count, dtype=np.float64)
+    target_weights[slots[is_target]] = weights[is_target]
+    in_target = np.zeros(count, dtype=bool)
+    in_target[slots[is_target]] = True
+
+    is_source = ~is_target
+    source_slots = slots[is_source]
+    source_groups = group_indices[is_source]
+    source_values = weights[is_source].astype(np.float64)
+    if source_factors is None:
+        source_count = len(np.unique(source_groups))
+    else:
+        source_count = len(source_factors)
+        size = max(int(source_groups.max(initial=-1)), *source_factors, -1) + 1
+        factors = np.ones(size, dtype=np.float64)
+        for group, factor in source_factors.items():
+            factors[group] = factor
+        source_values *= factors[source_groups]
+
+    if operation_mode in {"ADD", "SUBTRACT"}:
+        source_sums = np.bincount(source_slots, weights=source_values, minlength=count)
+        if operation_mode == "ADD":
+            merged = target_weights + source_sums
+        else:
+            merged = target_weights - source_sums
+    elif operation_mode == "MAX":
+        merged = target_weights.copy()
+        np.maximum.at(merged, source_slots, source_values)
+    else:  # MIN, MULTIPLY
+        merged = target_weights.copy()
+        combine = np.minimum if operation_mode == "MIN" else np.multiply
+        combine.at(merged, source_slots, source_values)
+        in_all = in_target & (
+            np.bincount(source_slots, minlength=count) == source_count
+        )
+        merged[~in_all] = 0.0
+
+    np.maximum(merged, 0.0, out=merged)
+    if operation_mode == "SUBTRACT":
+        merged[merged < 1e-6] = 0.0
+    clamped_count = 0
+    if maintain_total_weight:
+        clamped_count = int(np.count_nonzero(merged > 1.0))
+        np.minimum(merged, 1.0, out=merged)
+
+    return MergeResult(
+        vertices.astype(np.int32),
+        merged.astype(np.float32),
+        in_target,
+        clamped_count,
+    )
+
+
+def normalize_merged_weights(
+    memberships: MembershipArrays,
+    results: Mapping[int, MergeResult],
+    removed_groups: Iterable[int] = (),
+    locked_groups: Iterable[int] = (),
+    max_influences: int = 0,
+) -> MergeOutcome:
+    """
+    Rescale every group on the vertices touched by a merge so they sum to 1.0
+
+    Runs on the memberships already read for the merge, so no second pass over
+    the mesh is needed, and only vertices touched by a merge are considered.
+    Locked groups keep their weight; unlocked groups share what is left of 1.0.
+    Vertices without unlocked weight are left unchanged. Unlocked influences
+    that end up at zero (e.g. locked weight already at 1.0) are removed.
+
+    With max_influences, the smallest influences beyond the limit are dropped
+    before rescaling. Locked groups are never dropped but count toward the limit;
+    zero weights do not.
+
+    Args:
+        memberships: Memberships of all groups (see extract_group_weights)
+        results: Merge results by target group index
+        removed_groups: Groups that are deleted after the merge (ignored)
+        locked_groups: Groups whose weights must not change
+        max_influences: Maximum groups per vertex, 0 for no limit
+
+    Returns:
+        Normalized target results, new weights of the other changed groups and
+        the vertices to remove from them
+    """
+    touched = np.unique(
+        np.concatenate(
+            [np.zeros(0, dtype=np.int32)]
+            + [result.vertex_indices for result in results.values()]
+        )
+    )
+    if not len(touched):
+        return MergeOutcome(dict(results), {}, {})
+
+    # Current weights of the other groups on touched vertices
+    vertex_indices, group_indices, weights = memberships
+    excluded = np.fromiter(results.keys(), dtype=np.int32, count=len(results))
+    excluded = np.concatenate([excluded, np.fromiter(removed_groups, dtype=np.int32)])
+    slots = np.searchsorted(touched, vertex_indices)
+    found = touched[np.minimum(slots, len(touched) - 1)] == vertex_indices
+    keep = found & ~np.isin(group_indices, excluded)
+
+    # Merged target weights replace the current target weights
+    entry_slots = [slots[keep]]
+    entry_groups = [group_indices[keep]]
+    entry_weights = [weights[keep]]
+    for target, result in results.items():
+        entry_slots.append(np.searchsorted(touched, result.vertex_indices))
+        entry_groups.append(np.full(len(result.vertex_indices), target, np.int32))
+        entry_weights.append(result.weights)
+    entry_slots = np.concatenate(entry_slots)
+    entry_groups = np.concatenate(entry_groups)
+    old_weights = np.concatenate(entry_weights).astype(np.float32)
+
+    count = len(touched)
+    locked = np.isin(entry_groups, np.fromiter(locked_groups, dtype=np.int32))
+    values = old_weights.astype(np.float64)
+
+    # Keep the largest influences of each vertex, locked groups first. Empty
+    # entries (e.g. a target subtracted to zero) neither take a slot nor count
+    # as trimmed; unlocked ones are removed below.
+    kept = np.ones(len(entry_slots), dtype=bool)
+    if max_influences > 0:
+        ranked = np.flatnonzero(values > 0.0)
+        order = ranked[
+            np.lexsort((-values[ranked], ~locked[ranked], entry_slots[ranked]))
+        ]
+        sorted_slots = entry_slots[order]
+        starts = np.searchsorted(sorted_slots, sorted_slots)
+        ranks = np.arange(len(order)) - starts
+        kept[order[ranks >= max_influences]] = False
+        kept |= locked
+    trimmed_count = len(np.unique(entry_slots[~kept]))
+
+    # Sum locked and unlocked weight per vertex, then scale the unlocked part
+    locked_sums = np.bincount(
+        entry_slots[locked & kept], weights=values[locked & kept], minlength=count
+    )
+    unlocked = ~locked & kept
+    unlocked_sums = np.bincount(
+        entry_slots[unlocked], weights=values[unlocked], minlength=count
+    )
+    available = np.maximum(1.0 - locked_sums, 0.0)
+    scales = np.ones(count, dtype=np.float64)
+    np.divide(available, unlocked_sums, out=scales, where=unlocked_sums > 0.0)
+
+    new_weights = np.where(locked, values, values * scales[entry_slots])
+    new_weights[~kept] = 0.0
+    new_weights = new_weights.astype(np.float32)
+    changed = kept & (new_weights != old_weights)
+    # Empty influences are removed instead of written as 0.0
+    dropped = ~kept | (~locked & (new_weights == 0.0))
+    normalized_count = len(np.unique(entry_slots[changed]))
+
+    # Split entries by group
+    order = np.argsort(entry_groups, kind="stable")
+    sorted_groups = entry_groups[order]
+    boundaries = np.flatnonzero(np.diff(sorted_groups)) + 1
+
+    normalized_results: Dict[int, MergeResult] = dict(results)
+    group_weights: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    group_removals: Dict[int, np.ndarray] = {}
+    for entries in np.split(order, boundaries):
+        if not len(entries):
+            continue
+        group = int(entry_groups[entries[0]])
+        entry_vertices = touched[entry_slots[entries]]
+        if group in results:
+            # Trimmed target entries get zero weight and are removed on write
+            result = results[group]
+            positions = np.searchsorted(result.vertex_indices, entry_vertices)
+            target_weights = result.weights.copy()
+            target_weights[positions] = new_weights[entries]
+            normalized_results[group] = result._replace(weights=target_weights)
+            continue
+
+        removals = entries[dropped[entries]]
+        if len(removals):
+            group_removals[group] = touched[entry_slots[removals]].astype(np.int32)
+        entries = entries[changed[entries] & ~dropped[entries]]
+        if len(entries):
+            group_weights[group] = (
+                touched[entry_slots[entries]].astype(np.int32),
+                new_weights[entries],
+            )
+
+    return MergeOutcome(
+        normalized_results,
+        group_weights,
+        group_removals,
+        normalized_count,
+        trimmed_count,
+    )
+
+
+def summarize_merge_result(result: MergeResult, bins: int = 10) -> MergeSummary:
+    """
+    Summarize a merge result without writing it
+
+    Args:
+        result: Result from compute_merged_weights
+        bins: Number of histogram bins over [0, 1]
+
+    Returns:
+        Counts of affected, clamped and removed vertices and a histogram of the
+        weights that would be written
+    """
+    has_weight = result.weights > 0.0
+    written = result.weights[has_weight]
+    histogram, bin_edges = np.histogram(written, bins=bins, range=(0.0, 1.0))
+
+    return MergeSummary(
+        affected_count=len(result.vertex_indices),
+        clamped_count=result.clamped_count,
+        removed_count=int(np.count_nonzero(~has_weight & result.in_target)),
+        histogram=histogram,
+        bin_edges=bin_edges,
+        over_count=int(np.count_nonzero(written > 1.0)),
+    )
+
+
+def summarize_merge_outcome(outcome: MergeOutcome, bins: int = 10) -> MergeSummary:
+    """
+    Summarize every target result of a merge outcome together
+
+    A vertex is counted once per target it is merged into.
+    """
+    results = list(outcome.results.values())
+    if len(results) == 1:
+        return summarize_merge_result(results[0], bins)
+    return summarize_merge_result(
+        MergeResult(
+            np.concatenate([r.vertex_indices for r in results]),
+            np.concatenate([r.weights for r in results]),
+            np.concatenate([r.in_target for r in results]),
+            sum(r.clamped_count for r in results),
+        ),
+        bins,
+    )
+
+
+def compute_group_statistics(
+    memberships: MembershipArrays, group_count: int, target_idx: int = -1
+) -> GroupStatistics:
+    """
+    Calculate member count, weight sum, max weight and target overlap of every group
+
+    Args:
+        memberships: Memberships of all groups (see extract_group_weights)
+        group_count: Number of vertex groups on the object
+        target_idx: Index of the target group for shared counts, or -1 for none
+
+    Returns:
+        Statistics arrays of length group_count
+    """
+    vertices, groups, weights = memberships
+
+    counts = np.bincount(groups, minlength=group_count)[:group_count]
+    sums = np.bincount(groups, weights=weights, minlength=group_count)[:group_count]
+    max_weights = np.zeros(group_count, dtype=np.float32)
+    np.maximum.at(max_weights, groups, weights)
+
+    shared = np.zeros(group_count, dtype=np.int64)
+    if target_idx >= 0 and len(vertices):
+        in_target = np.zeros(int(vertices.max()) + 1, dtype=bool)
+        in_target[vertices[groups == target_idx]] = True
+        shared = np.bincount(groups[in_target[vertices]], minlength=group_count)[
+            :group_count
+        ]
+
+    return GroupStatistics(
+        counts.astype(np.int32),
+        sums.astype(np.float32),
+        max_weights,
+        shared.astype(np.int32),
+        target_idx,
+    )
+
+
+class MergePlanError(ValueError):
+    """Raised for merge plans that cannot be executed in a single pass"""
+
+    def __init__(self, message: str, group: Hashable):
+        super().__init__(message.format(group=group))
+        # Untranslated message template, formatted with group=...
+        self.message = message
+        self.group = group
+
+
+def validate_merge_plan(plan: Mapping[Hashable, Sequence[Hashable]]) -> None:
+    """
+    Check that every group has a single role in a many-to-many merge plan
+
+    Args:
+        plan: Mapping of target group to its source groups (names or indices)
+
+    Raises:
+        MergePlanError: If a group is both a source and a target, or one
+            source feeds more than one target
+    """
+    source_owner: Dict[Hashable, Hashable] = {}
+    for target, sources in plan.items():
+        for source in sources:
+            if source in plan:
+                raise MergePlanError(
+                    "Group {group} is both a source and a target", source
+                )
+            if source_owner.setdefault(source, target) != target:
+                raise MergePlanError(
+                    "Group {group} is a source of more than one target", source
+                )
+
+
+def collapse_bone_plan(
+    parents: Mapping[str, Optional[str]], collapsed: Iterable[str]
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    Build a merge plan that collapses bones into their nearest kept ancestor
+
+    Args:
+        parents: Parent name of every bone, None for root bones
+        collapsed: Names of the bones to collapse
+
+    Returns:
+        Tuple of (mapping of kept ancestor to the collapsed bones under it, in
+        the order of collapsed; collapsed bones without a kept ancestor)
+    """
+    collapsed = list(dict.fromkeys(collapsed))
+    removed = set(collapsed)
+    # Kept ancestor of each visited collapsed bone, shared along chains
+    ancestors: Dict[str, Optional[str]] = {}
+
+    def kept_ancestor(name: str) -> Optional[str]:
+        chain = []
+        parent = parents.get(name)
+        while parent in removed and parent not in ancestors:
+            chain.append(parent)
+            parent = parents.get(parent)
+        ancestor = ancestors[parent] if parent in removed else parent
+        for bone in chain:
+            ancestors[bone] = ancestor
+        return ancestor
+
+    plan: Dict[str, List[str]] = {}
+    orphans: List[str] = []
+    for name in collapsed:
+        if name not in ancestors:
+            ancestors[name] = kept_ancestor(name)
+        if ancestors[name] is None:
+            orphans.append(name)
+        else:
+            plan.setdefault(ancestors[name], []).append(name)
+    return plan, orphans
+
+
+def compute_plan_weights(
+    memberships: MembershipArrays,
+    plan: Mapping[int, Sequence[int]],
+    maintain_total_weight: bool,
+    operation_mode: str,
+    source_factors: Optional[Mapping[int, float]] = None,
+) -> Dict[int, MergeResult]:
+    """
+    Calculate merged weights for every target of a merge plan
+
+    memberships must come from a single scan covering all groups in the plan.
+    Entries are routed to their target once, then each target is merged with
+    compute_merged_weights.
+
+    Args:
+        memberships: Memberships of every target and source group in the plan
+        plan: Mapping of target group index to source group indices
+        maintain_total_weight: Flag to keep merged weight ≤ 1.0
+        operation_mode: Operation mode (see compute_merged_weights)
+        source_factors: Factors of source groups by index, defaults to 1.0
+
+    Returns:
+        Merge result for each target group index
+    """
+    source_factors = source_factors or {}
+    validate_merge_plan(plan)
+
+    group_count = max(
+        [int(memberships.group_indices.max(initial=-1))]
+        + [max([target, *sources]) for target, sources in plan.items()]
+    )
+    owner = np.full(group_count + 1, -1, dtype=np.int32)
+    for target, sources in plan.items():
+        owner[target] = target
+        owner[list(sources)] = target
+
+    # Stable sort keeps every target's entries in vertex order
+    entry_owner = owner[memberships.group_indices]
+    order = np.argsort(entry_owner, kind="stable")
+    sorted_owner = entry_owner[order]
+
+    results: Dict[int, MergeResult] = {}
+    for target in plan:
+        start, end = np.searchsorted(sorted_owner, [target, target + 1])
+        entries = order[start:end]
+        results[target] = compute_merged_weights(
+            MembershipArrays(
+                memberships.vertex_indices[entries],
+                memberships.group_indices[entries],
+                memberships.weights[entries],
+            ),
+            target,
+            maintain_total_weight,
+            operation_mode,
+            {source: source_factors.get(source, 1.0) for source in plan[target]},
+        )
+
+    return results
+
+
+def compute_merge_outcome(
+    memberships: MembershipArrays,
+    target_idx: int,
+    source_indices: Iterable[int],
+    options: MergeOptions,
+    locked_groups: Iterable[int] = (),
+    source_factors: Optional[Mapping[int, float]] = None,
+) -> MergeOutcome:
+    """
+    Calculate the merge of source groups into one target
+
+    Args:
+        memberships: Memberships of the target and sources, or of all groups
+            when options.reads_all_groups is set (only of the masked vertices
+            when options.masked is set)
+        target_idx: Index of the target vertex group
+        source_indices: Indices of the source vertex groups
+        options: Merge options
+        locked_groups: Groups the normalization must not change
+        source_factors: Factors of source groups by index, defaults to 1.0
+
+    Returns:
+        Merge outcome with the result for target_idx
+    """
+    source_indices = set(source_indices)
+    merge_memberships = memberships
+    if options.reads_all_groups:
+        merge_memberships = select_groups(memberships, source_indices | {target_idx})
+    source_factors = source_factors or {}
+    result = compute_merged_weights(
+        merge_memberships,
+        target_idx,
+        options.maintain_total_weight,
+        options.operation_mode,
+        {source: source_factors.get(source, 1.0) for source in source_indices},
+    )
+    removed_groups = () if options.keep_source_groups else source_indices
+    if options.reads_all_groups:
+        # Sources that are kept take part in the normalization
+        outcome = normalize_merged_weights(
+            memberships,
+            {target_idx: result},
+            removed_groups=removed_groups,
+            locked_groups=locked_groups,
+            max_influences=options.max_influences,
+        )
+    else:
+        outcome = MergeOutcome({target_idx: result}, {}, {})
+
+    if options.masked and removed_groups:
+        outcome = remove_masked_sources(merge_memberships, outcome, removed_groups)
+        removed_groups = ()
+
+    if options.record_journal:
+        outcome = record_previous_weights(memberships, outcome, removed_groups)
+    return outcome
+
+
+def remove_masked_sources(
+    memberships: MembershipArrays, outcome: MergeOutcome, source_indices: Iterable[int]
+) -> MergeOutcome:
+    """
+    Remove the merged source weights instead of deleting the source groups
+
+    Used for masked merges, where memberships only cover the masked vertices
+    and the sources keep their weights outside the mask.
+
+    Returns:
+        The outcome with every source membership added to group_removals
+    """
+    group_removals = dict(outcome.group_removals)
+    for group in source_indices:
+        vertex_indices, _ = _group_members(memberships, group)
+        if len(vertex_indices):
+            group_removals[group] = vertex_indices
+    return outcome._replace(group_removals=group_removals)
+
+
+def _group_members(
+    memberships: MembershipArrays, group: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the sorted member vertices of group and their weights"""
+    mask = memberships.group_indices == group
+    return memberships.vertex_indices[mask], memberships.weights[mask]
+
+
+def record_previous_weights(
+    memberships: MembershipArrays,
+    outcome: MergeOutcome,
+    removed_groups: Iterable[int] = (),
+) -> MergeOutcome:
+    """
+    Attach the current weights of everything an outcome is about to change
+
+    Only the written memberships are kept, so the size follows the change, not
+    the mesh. Removed groups are kept in full.
+
+    Args:
+        memberships: Memberships the outcome was computed from
+        outcome: Outcome that has not been written yet
+        removed_groups: Groups that are deleted after the merge
+
+    Returns:
+        The outcome with previous_weights and removed_weights set
+    """
+    written: Dict[int, np.ndarray] = {}
+    for target, result in outcome.results.items():
+        # Non-members that end up with zero weight are never written
+        touched = (result.weights > 0.0) | result.in_target
+        written[target] = result.vertex_indices[touched]
+    for group, (vertex_indices, _) in outcome.group_weights.items():
+        written[group] = vertex_indices
+    for group, vertex_indices in outcome.group_removals.items():
+        written[group] = np.union1d(
+            written.get(group, np.zeros(0, dtype=np.int32)), vertex_indices
+        ).astype(np.int32)
+
+    previous_weights: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    for group, vertex_indices in written.items():
+        members, member_weights = _group_members(memberships, group)
+        weights = np.full(len(vertex_indices), np.nan, dtype=np.float32)
+        if len(members):
+            positions = np.minimum(
+                np.searchsorted(members, vertex_indices), len(members) - 1
+            )
+            found = members[positions] == vertex_indices
+            weights[found] = member_weights[positions[found]]
+        previous_weights[group] = (vertex_indices, weights)
+
+    removed_weights = {
+        group: _group_members(memberships, group) for group in removed_groups
+    }
+    return outcome._replace(
+        previous_weights=previous_weights, removed_weights=removed_weights
+    )
+
+
+def compute_merge_outcomes_parallel(
+    jobs: Sequence[tuple], max_workers: Optional[int] = None
+) -> List[MergeOutcome]:
+    """
+    Calculate several independent merges concurrently in a thread pool
+
+    NumPy releases the GIL inside its array kernels, so merges of separate
+    meshes overlap. Results are returned in job order.
+
+    Args:
+        jobs: Arguments for compute_merge_outcome, one tuple per merge
+        max_workers: Thread count, defaults to the number of CPUs
+
+    Returns:
+        Merge outcomes aligned with jobs
+    """
+    if len(jobs) <= 1:
+        return [compute_merge_outcome(*job) for job in jobs]
+
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(compute_merge_outcome, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+class DeformLayerGroup:
+    """
+    Vertex group over per-vertex deform mappings with Blender-compatible add()/remove()
+
+    Lets the write helpers below target the bmesh deform layer in edit mode.
+    """
+
+    def __init__(self, deform_verts: Sequence, index: int):
+        self.deform_verts = deform_verts
+        self.index = index
+
+    def add(self, index: List[int], weight: float, type: str) -> None:
+        # Merges only ever write with 'REPLACE'
+        for vertex_index in index:
+            self.deform_verts[vertex_index][self.index] = weight
+
+    def remove(self, index: List[int]) -> None:
+        for vertex_index in index:
+            del self.deform_verts[vertex_index][self.index]
+
+
+class DeformLayerGroups:
+    """Vertex groups by index over per-vertex deform mappings"""
+
+    def __init__(self, deform_verts: Sequence):
+        self.deform_verts = deform_verts
+
+    def __getitem__(self, index: int) -> DeformLayerGroup:
+        return DeformLayerGroup(self.deform_verts, index)
+
+
+def add_weights_bucketed(group, vertex_indices: np.ndarray, weights: np.ndarray) -> int:
+    """
+    Write weights with one add() call per distinct float32 weight value
+
+    Returns:
+        Number of add() calls issued
+    """
+    if not len(vertex_indices):
+        return 0
+
+    order = np.argsort(weights, kind="stable")
+    boundaries = np.flatnonzero(np.diff(weights[order])) + 1
+    buckets = np.split(order, boundaries)
+
+    for bucket in buckets:
+        group.add(vertex_indices[bucket].tolist(), float(weights[bucket[0]]), "REPLACE")
+
+    return len(buckets)
+
+
+def apply_group_weights(
+    groups: Mapping[int, object],
+    group_weights: Mapping[int, Tuple[np.ndarray, np.ndarray]],
+) -> int:
+    """
+    Write new weights of non-target groups (e.g. from normalization)
+
+    Args:
+        groups: Vertex groups by index (e.g. obj.vertex_groups)
+        group_weights: (vertex indices, weights) by group index
+
+    Returns:
+        Number of add() calls issued
+    """
+    calls = 0
+    for group_index, (vertex_indices, weights) in group_weights.items():
+        calls += add_weights_bucketed(groups[group_index], vertex_indices, weights)
+    return calls
+
+
+def apply_group_removals(
+    groups: Mapping[int, object], group_removals: Mapping[int, np.ndarray]
+) -> int:
+    """
+    Remove vertices from non-target groups with one remove() call per group
+
+    Returns:
+        Number of remove() calls issued
+    """
+    for group_index, vertex_indices in group_removals.items():
+        groups[group_index].remove(vertex_indices.tolist())
+    return len(group_removals)
+
+
+def apply_merge_result(group, result: MergeResult) -> Tuple[int, int]:
+    """
+    Write a merge result to the target group and remove zero-weight vertices
+
+    Zero weights come from SUBTRACT, MIN and MULTIPLY mode or trimmed influences.
+    Only actual members are passed to remove(), so it never raises for non-members.
+
+    Returns:
+        Tuple of (number of vertices removed due to zero weight, number of
+        add() and remove() calls issued)
+    """
+    has_weight = result.weights > 0.0
+    calls = add_weights_bucketed(
+        group, result.vertex_indices[has_weight], result.weights[has_weight]
+    )
+
+    removed_indices = result.vertex_indices[~has_weight & result.in_target]
+    if len(removed_indices):
+        group.remove(removed_indices.tolist())
+        calls += 1
+
+    return len(removed_indices), calls
+
+
+def restore_group_weights(
+    group, vertex_indices: np.ndarray, weights: np.ndarray
+) -> None:
+    """
+    Write previous weights back to a group
+
+    NaN weights mark vertices that were not members before; they are removed.
+    """
+    missing = np.isnan(weights)
+    add_weights_bucketed(group, vertex_indices[~missing], weights[~missing])
+    if missing.any():
+        group.remove(vertex_indices[missing].tolist())
+
+
+def apply_merge_outcome(
+    groups: Mapping[int, object], outcome: MergeOutcome
+) -> Tuple[int, int]:
+    """
+    Write every target result and other changed group of a merge outcome
+
+    Args:
+        groups: Vertex groups by index (e.g. obj.vertex_groups)
+        outcome: Outcome from compute_merge_outcome or normalize_merged_weights
+
+    Returns:
+        Tuple of (number of target vertices removed due to zero weight, number
+        of add() and remove() calls issued)
+    """
+    removed = calls = 0
+    for target_idx, result in outcome.results.items():
+        result_removed, result_calls = apply_merge_result(groups[target_idx], result)
+        removed += result_removed
+        calls += result_calls
+    calls += apply_group_weights(groups, outcome.group_weights)
+    calls += apply_group_removals(groups, outcome.group_removals)
+    return removed, calls
@@ -0,0 +1,177 @@
+# Vertex group name index
+# Precompiled lookup structures for vertex group names. Like merge_core, this module
+# must not import bpy.
+
+import fnmatch
+import re
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import numpy as np
+
+
+@lru_cache(maxsize=256)
+def compile_name_pattern(pattern: str, match_type: str) -> Callable:
+    """
+    Compile a selection pattern into a matcher callable
+
+    Args:
+        pattern: Glob (e.g. 'DEF-spine.*') or regular expression
+        match_type: 'GLOB' (whole name must match) or 'REGEX' (search anywhere)
+
+    Raises:
+        re.error: If the regular expression is invalid
+    """
+    if match_type == "GLOB":
+        return re.compile(fnmatch.translate(pattern)).match
+    return re.compile(pattern).search
+
+
+class GroupNameIndex:
+    """Vertex group names with precomputed name-to-position lookups"""
+
+    def __init__(self, names: Iterable[str]):
+        self.names: Tuple[str, ...] = tuple(names)
+        self.positions: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def position(self, name: str) -> int:
+        """Return the position of name, or -1 if it is not indexed"""
+        return self.positions.get(name, -1)
+
+    def match(self, pattern: str, match_type: str) -> np.ndarray:
+        """Return a boolean mask of the names matching pattern"""
+        matcher = compile_name_pattern(pattern, match_type)
+        return np.fromiter(
+            (matcher(name) is not None for name in self.names),
+            dtype=bool,
+            count=len(self.names),
+        )
+
+    def evaluate_rules(
+        self,
+        rules: Sequence[Tuple[str, str, str]],
+        initial: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate selection rules in order
+
+        Args:
+            rules: Sequence of (pattern, match_type, action) where action is
+                'SELECT' or 'DESELECT'
+            initial: Selection to start from, defaults to nothing selected
+
+        Returns:
+            Boolean selection mask aligned with names
+        """
+        if initial is None:
+            selected = np.zeros(len(self.names), dtype=bool)
+        else:
+            selected = np.array(initial, dtype=bool)
+
+        for pattern, match_type, action in rules:
+            matched = self.match(pattern, match_type)
+            if action == "SELECT":
+                selected |= matched
+            else:  # DESELECT
+                selected &= ~matched
+
+        return selected
+
+
+def diff_name_lists(
+    current: Sequence[str], desired: Sequence[str]
+) -> List[Tuple[str, int, str]]:
+    """
+    Compute the edits that turn the current name list into the desired one
+
+    Same-length replaced runs are returned as renames, so the entries are
+    reused instead of removed and inserted; whether an entry keeps its state
+    is up to the caller. Edits are ordered from the end of the list to the start, so each
+    index is valid at the time the edit is applied.
+
+    Returns:
+        List of ('RENAME', index, name), ('REMOVE', index, '') and
+        ('INSERT', index, name) edits
+    """
+    edits: List[Tuple[str, int, str]] = []
+    matcher = SequenceMatcher(None, current, desired, autojunk=False)
+
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == "equal":
+            continue
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            edits.extend(("RENAME", i1 + k, desired[j1 + k]) for k in range(i2 - i1))
+            continue
+        # Unequal replace, delete or insert
+        edits.extend(("REMOVE", i, "") for i in reversed(range(i1, i2)))
+        edits.extend(("INSERT", i1 + k, desired[j1 + k]) for k in range(j2 - j1))
+
+    return edits
+
+
+class CollectionNameCache:
+    """
+    Per-collection name-to-position lookups
+
+    Works with any sequence of items with a .name (e.g. obj.vertex_groups). Every
+    hit is verified against the collection in O(1), so a stale index is rebuilt
+    on demand instead of returning a wrong position. Names missing from a freshly
+    built index are remembered, so looking up a missing name again costs O(1)
+    until the index is rebuilt or invalidated.
+    """
+
+    def __init__(self):
+        self._indices: Dict[Hashable, GroupNameIndex] = {}
+        self._misses: Dict[Hashable, Set[str]] = {}
+
+    def find(self, key: Hashable, collection, name: str) -> int:
+        """
+        Return the position of name in collection, or -1 if it is missing
+
+        Args:
+            key: Identity of the collection (e.g. its owner's as_pointer())
+            collection: Collection to search
+            name: Item name
+        """
+        index = self._indices.get(key)
+        if index is not None and len(index) == len(collection):
+            if name in self._misses[key]:
+                return -1
+            position = index.position(name)
+            if position >= 0 and collection[position].name == name:
+                return position
+
+        # Missing, stale or never built: rebuild once. Misses stay valid as long
+        # as the names are unchanged.
+        previous = index
+        index = GroupNameIndex(item.name for item in collection)
+        self._indices[key] = index
+        if previous is None or previous.names != index.names:
+            self._misses[key] = set()
+        position = index.position(name)
+        if position < 0:
+            self._misses[key].add(name)
+        return position
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop the index for key, or every index if key is None"""
+        if key is None:
+            self._indices.clear()
+            self._misses.clear()
+        else:
+            self._indices.pop(key, None)
+            self._misses.pop(key, None)
@@ -0,0 +1,12 @@
+# Test setup
+# merge_core and name_index do not import bpy, so they are tested as top-level
+# modules with plain pytest, like the benchmarks import them (pytest.ini makes
+# tests/ the rootdir so the add-on package itself is never imported):
+#   python -m pytest tests
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
@@ -0,0 +1,421 @@
+# Tests of the bpy-free merge kernels
+# Meshes are dense (vertex, group) weight arrays with NaN for non-members, written
+# through the benchmark stub vertex groups, which behave like Blender's add() and
+# remove() (remove() raises for non-members).
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from bench_merge import run_loop_backend
+from merge_core import (
+    OPERATION_MODES,
+    MembershipArrays,
+    MembershipIndex,
+    MergeOptions,
+    MergeOutcome,
+    MergePlanError,
+    MergeResult,
+    apply_merge_outcome,
+    apply_merge_result,
+    collapse_bone_plan,
+    compute_merge_outcome,
+    compute_merged_weights,
+    compute_plan_weights,
+    concatenate_memberships,
+    extract_group_weights,
+    iter_group_weight_chunks,
+    normalize_merged_weights,
+    restore_group_weights,
+    select_groups,
+    validate_merge_plan,
+)
+from synthetic import (
+    MeshSpec,
+    StubVertexGroup,
+    StubVertices,
+    build_stub_group,
+    generate_mesh,
+)
+
+VERTEX_COUNT = 400
+GROUP_COUNT = 10
+
+
+def random_weights(seed: int, influences: int = 4) -> np.ndarray:
+    """Dense weights with a few influences per vertex, some of them 1.0"""
+    rng = np.random.default_rng(seed)
+    dense = np.full((VERTEX_COUNT, GROUP_COUNT), np.nan, dtype=np.float32)
+    for vertex in range(VERTEX_COUNT):
+        groups = rng.choice(GROUP_COUNT, rng.integers(1, influences + 1), False)
+        dense[vertex, groups] = np.maximum(np.round(rng.random(len(groups)), 3), 0.001)
+    dense[rng.random(dense.shape) < 0.05] = 1.0
+    return dense
+
+
+def memberships_of(dense: np.ndarray) -> MembershipArrays:
+    """Memberships in vertex order, like extract_group_weights"""
+    vertices, groups = np.nonzero(~np.isnan(dense))
+    return MembershipArrays(
+        vertices.astype(np.int32),
+        groups.astype(np.int32),
+        dense[vertices, groups].astype(np.float32),
+    )
+
+
+def stub_groups(dense: np.ndarray) -> dict:
+    groups = {}
+    for index in range(dense.shape[1]):
+        groups[index] = StubVertexGroup(index, dense.shape[0])
+        groups[index].weights[:] = dense[:, index]
+    return groups
+
+
+def dense_of(groups: dict) -> np.ndarray:
+    return np.stack([groups[i].weights for i in sorted(groups)], axis=1)
+
+
+def only_groups(dense: np.ndarray, groups) -> np.ndarray:
+    """Copy of dense without the memberships of other groups"""
+    subset = np.full_like(dense, np.nan)
+    subset[:, sorted(groups)] = dense[:, sorted(groups)]
+    return subset
+
+
+def reference_merge(dense, target, sources, mode, clamp, factors=None) -> dict:
+    """Per-vertex merge, written like the original loop"""
+    factors = factors or {}
+    merged = {}
+    for vertex in range(dense.shape[0]):
+        in_target = not np.isnan(dense[vertex, target])
+        values = [
+            float(dense[vertex, s]) * factors.get(s, 1.0)
+            for s in sorted(sources)
+            if not np.isnan(dense[vertex, s])
+        ]
+        if not in_target and not values:
+            continue
+        weight = float(dense[vertex, target]) if in_target else 0.0
+        in_all = in_target and len(values) == len(sources)
+        if mode == "ADD":
+            weight += sum(values)
+        elif mode == "SUBTRACT":
+            weight -= sum(values)
+        elif mode == "MAX":
+            weight = max([weight] + values)
+        elif mode == "MIN":
+            weight = min([weight] + values) if in_all else 0.0
+        else:  # MULTIPLY
+            for value in values:
+                weight *= value
+            weight = weight if in_all else 0.0
+        weight = max(0.0, weight)
+        if mode == "SUBTRACT" and weight < 1e-6:
+            weight = 0.0
+        if clamp:
+            weight = min(weight, 1.0)
+        merged[vertex] = weight
+    return merged
+
+
+# Merge kernel
+
+
+@pytest.mark.parametrize("mode", ["ADD", "SUBTRACT"])
+@pytest.mark.parametrize("clamp", [False, True])
+def test_merge_matches_per_vertex_loop(mode, clamp):
+    mesh = generate_mesh(MeshSpec(3000, 12, 4, seed=3))
+    target_idx, sources = 2, {0, 1, 3, 5}
+    options = SimpleNamespace(mode=mode, clamp=clamp)
+
+    loop_group = build_stub_group(mesh, target_idx)
+    run_loop_backend(StubVertices(mesh), loop_group, sources, options)
+
+    numpy_group = build_stub_group(mesh, target_idx)
+    memberships = extract_group_weights(StubVertices(mesh), sources | {target_idx})
+    result = compute_merged_weights(memberships, target_idx, clamp, mode)
+    apply_merge_result(numpy_group, result)
+
+    np.testing.assert_array_equal(numpy_group.weights, loop_group.weights)
+
+
+@pytest.mark.parametrize("mode", OPERATION_MODES)
+@pytest.mark.parametrize("clamp", [False, True])
+def test_merge_matches_reference(mode, clamp):
+    dense = random_weights(seed=1)
+    target, sources = 0, {1, 2, 3}
+    factors = {1: 0.5, 2: 1.0, 3: 2.0}
+    memberships = memberships_of(only_groups(dense, sources | {target}))
+
+    result = compute_merged_weights(memberships, target, clamp, mode, factors)
+    expected = reference_merge(dense, target, sources, mode, clamp, factors)
+
+    np.testing.assert_array_equal(result.vertex_indices, sorted(expected))
+    np.testing.assert_allclose(
+        result.weights, np.float32(list(expected.values())), rtol=1e-6
+    )
+    np.testing.assert_array_equal(
+        result.in_target, ~np.isnan(dense[result.vertex_indices, target])
+    )
+
+
+def test_merge_rejects_unknown_mode():
+    memberships = memberships_of(random_weights(seed=1))
+    with pytest.raises(ValueError):
+        compute_merged_weights(memberships, 0, False, "add")
+
+
+def test_apply_merge_outcome_counts_calls():
+    dense = random_weights(seed=2)
+    memberships = memberships_of(dense)
+    outcome = compute_merge_outcome(
+        memberships,
+        0,
+        {1, 2},
+        MergeOptions(operation_mode="SUBTRACT", max_influences=2),
+    )
+    groups = stub_groups(dense)
+
+    removed, calls = apply_merge_outcome(groups, outcome)
+
+    assert calls == sum(g.add_calls + g.remove_calls for g in groups.values())
+    assert removed == np.count_nonzero(
+        (outcome.results[0].weights == 0.0) & outcome.results[0].in_target
+    )
+
+
+# Normalization and influence limit
+
+
+@pytest.mark.parametrize("max_influences", [0, 2, 3])
+def test_normalize_keeps_locked_and_sums_to_one(max_influences):
+    dense = random_weights(seed=4, influences=6)
+    locked = {7}
+    dense[::3, 7] = 0.6
+    dense[::17, 7] = 1.0  # nothing left for unlocked groups
+    target, sources = 0, {1, 2}
+    memberships = memberships_of(dense)
+
+    outcome = compute_merge_outcome(
+        memberships,
+        target,
+        sources,
+        MergeOptions(normalize_all=True, max_influences=max_influences),
+        locked_groups=locked,
+    )
+    groups = stub_groups(dense)
+    apply_merge_outcome(groups, outcome)
+    after = dense_of(groups)
+    after[:, sorted(sources)] = np.nan  # deleted after the merge
+
+    touched = outcome.results[target].vertex_indices
+    np.testing.assert_array_equal(after[:, 7], dense[:, 7])
+
+    unlocked = [g for g in range(GROUP_COUNT) if g not in locked]
+    # Empty influences are removed, not written as 0.0
+    assert not (after[np.ix_(touched, unlocked)] == 0.0).any()
+
+    totals = np.nansum(after[touched], axis=1)
+    has_unlocked = ~np.isnan(after[np.ix_(touched, unlocked)]).all(axis=1)
+    locked_total = np.nan_to_num(dense[touched, 7])
+    check = has_unlocked & (locked_total < 1.0)
+    np.testing.assert_allclose(totals[check], 1.0, rtol=1e-5)
+
+    if max_influences:
+        counts = (~np.isnan(after[touched])).sum(axis=1)
+        assert (counts <= max_influences).all()
+
+
+@pytest.mark.parametrize("mode", ["SUBTRACT", "MULTIPLY"])
+@pytest.mark.parametrize("locked", [set(), {0}])
+def test_limit_ignores_empty_target(mode, locked):
+    # Vertex 0 is subtracted to zero, vertex 1 is not in the target, so
+    # MULTIPLY gives zero; both keep four other influences that sum to 1.0
+    dense = np.full((2, 6), np.nan, dtype=np.float32)
+    dense[:, 1] = 0.5
+    dense[:, 2:] = 0.25
+    dense[0, 0] = 0.5 if mode == "SUBTRACT" else np.nan
+
+    outcome = compute_merge_outcome(
+        memberships_of(dense),
+        0,
+        {1},
+        MergeOptions(operation_mode=mode, max_influences=4),
+        locked_groups=locked,
+    )
+    groups = stub_groups(dense)
+    apply_merge_outcome(groups, outcome)
+
+    assert outcome.trimmed_count == 0 and outcome.normalized_count == 0
+    assert outcome.group_removals == {} and outcome.group_weights == {}
+    np.testing.assert_array_equal(dense_of(groups)[:, 2:], dense[:, 2:])
+    assert np.isnan(dense_of(groups)[:, 0]).all()
+
+
+def test_normalize_without_touched_vertices():
+    memberships = memberships_of(random_weights(seed=5))
+    empty = compute_merged_weights(select_groups(memberships, set()), 0, False, "ADD")
+    outcome = normalize_merged_weights(memberships, {0: empty})
+    assert outcome.group_weights == {} and outcome.group_removals == {}
+
+
+# Masked merge
+
+
+def test_masked_merge_equals_full_merge_on_mask():
+    dense = random_weights(seed=6)
+    mask = np.arange(0, VERTEX_COUNT, 3, dtype=np.int32)
+    masked_dense = np.full_like(dense, np.nan)
+    masked_dense[mask] = dense[mask]
+    options = MergeOptions(mask_mode="SELECTED")
+
+    full = compute_merged_weights(
+        memberships_of(only_groups(dense, {0, 1, 2})), 0, False, "ADD"
+    )
+    masked = memberships_of(only_groups(masked_dense, {0, 1, 2}))
+    outcome = compute_merge_outcome(masked, 0, {1, 2}, options)
+
+    inside = np.isin(full.vertex_indices, mask)
+    np.testing.assert_array_equal(
+        outcome.results[0].vertex_indices, full.vertex_indices[inside]
+    )
+    np.testing.assert_array_equal(outcome.results[0].weights, full.weights[inside])
+    for source in (1, 2):
+        members = np.flatnonzero(~np.isnan(masked_dense[:, source]))
+        np.testing.assert_array_equal(outcome.group_removals[source], members)
+
+
+# Merge plans
+
+
+def test_plan_matches_separate_merges():
+    dense = random_weights(seed=7)
+    memberships = memberships_of(dense)
+    plan = {0: [1, 2], 3: [4], 5: [6, 8]}
+    factors = {1: 0.5, 2: 1.0, 4: 1.5, 6: 1.0, 8: 0.25}
+
+    results = compute_plan_weights(memberships, plan, True, "ADD", factors)
+
+    for target, sources in plan.items():
+        expected = compute_merged_weights(
+            memberships_of(only_groups(dense, set(sources) | {target})),
+            target,
+            True,
+            "ADD",
+            {s: factors[s] for s in sources},
+        )
+        np.testing.assert_array_equal(
+            results[target].vertex_indices, expected.vertex_indices
+        )
+        np.testing.assert_array_equal(results[target].weights, expected.weights)
+
+
+@pytest.mark.parametrize("plan", [{"A": ["B"], "B": ["C"]}, {"A": ["C"], "B": ["C"]}])
+def test_invalid_plans_are_rejected(plan):
+    with pytest.raises(MergePlanError) as error:
+        validate_merge_plan(plan)
+    assert error.value.group in {"B", "C"}
+
+
+def test_collapse_bone_plan():
+    parents = {
+        "root": None,
+        "spine": "root",
+        "spine.001": "spine",
+        "spine.002": "spine.001",
+        "arm": "spine.002",
+        "hand": "arm",
+        "prop": None,
+    }
+
+    plan, orphans = collapse_bone_plan(
+        parents, ["hand", "spine.001", "spine.002", "prop", "hand"]
+    )
+
+    assert plan == {"arm": ["hand"], "spine": ["spine.001", "spine.002"]}
+    assert orphans == ["prop"]
+    validate_merge_plan(plan)
+
+
+# Weight index
+
+
+def test_membership_index_follows_merges():
+    dense = random_weights(seed=8, influences=6)
+    index = MembershipIndex(memberships_of(dense), GROUP_COUNT, VERTEX_COUNT)
+    options = MergeOptions(normalize_all=True, max_influences=3)
+
+    for target, sources in ((0, [3, 5]), (1, [2]), (0, [4])):
+        current = index.memberships()
+        outcome = compute_merge_outcome(current, target, sources, options)
+        groups = stub_groups(dense)
+        apply_merge_outcome(groups, outcome)
+        dense = np.delete(dense_of(groups), sources, axis=1)
+
+        index.apply_outcome(outcome)
+        index.remove_groups(sources)
+
+        expected = memberships_of(dense)
+        for actual, wanted in zip(index.memberships(), expected):
+            np.testing.assert_array_equal(actual, wanted)
+        assert index.group_count == dense.shape[1]
+
+    mask = np.arange(5, VERTEX_COUNT, 7, dtype=np.int32)
+    masked = index.memberships({0, 1}, mask)
+    wanted = memberships_of(only_groups(dense, {0, 1}))
+    inside = np.isin(wanted.vertex_indices, mask)
+    for actual, expected_array in zip(masked, wanted):
+        np.testing.assert_array_equal(actual, expected_array[inside])
+
+
+def test_chunked_read_matches_full_read():
+    vertices = StubVertices(generate_mesh(MeshSpec(1000, 8, 3, seed=9)))
+    for group_indices in (None, {1, 4}):
+        chunks = list(iter_group_weight_chunks(vertices, group_indices, 64))
+        joined = concatenate_memberships(chunks)
+        full = extract_group_weights(vertices, group_indices)
+        for actual, expected in zip(joined, full):
+            np.testing.assert_array_equal(actual, expected)
+    assert len(concatenate_memberships([]).vertex_indices) == 0
+
+
+# Weight journal
+
+
+def test_journal_restores_previous_weights():
+    dense = random_weights(seed=10, influences=6)
+    dense[::4, 9] = 0.5
+    sources = [2, 3]
+    options = MergeOptions(
+        operation_mode="SUBTRACT",
+        normalize_all=True,
+        max_influences=3,
+        record_journal=True,
+    )
+    outcome = compute_merge_outcome(
+        memberships_of(dense), 0, sources, options, locked_groups={9}
+    )
+    groups = stub_groups(dense)
+    apply_merge_outcome(groups, outcome)
+    for source in sources:
+        # Deleted, then recreated empty by the revert
+        groups[source] = StubVertexGroup(source, VERTEX_COUNT)
+
+    for group, (vertex_indices, weights) in outcome.previous_weights.items():
+        restore_group_weights(groups[group], vertex_indices, weights)
+    for group, (vertex_indices, weights) in outcome.removed_weights.items():
+        restore_group_weights(groups[group], vertex_indices, weights)
+
+    np.testing.assert_array_equal(dense_of(groups), dense)
+    assert set(outcome.removed_weights) == set(sources)
+
+
+def test_empty_outcome_writes_nothing():
+    groups = stub_groups(random_weights(seed=11))
+    empty = np.zeros(0, dtype=np.int32)
+    result = MergeResult(
+        empty, np.zeros(0, dtype=np.float32), np.zeros(0, dtype=bool), 0
+    )
+
+    assert apply_merge_outcome(groups, MergeOutcome({0: result}, {}, {})) == (0, 0)
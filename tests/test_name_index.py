@@ -0,0 +1,111 @@
+# Tests of the vertex group name lookups and list diffing
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from name_index import CollectionNameCache, GroupNameIndex, diff_name_lists
+
+
+def apply_edits(names, edits):
+    names = list(names)
+    for op, index, name in edits:
+        if op == "RENAME":
+            names[index] = name
+        elif op == "REMOVE":
+            del names[index]
+        else:  # INSERT
+            names.insert(index, name)
+    return names
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_diff_name_lists_reaches_desired_list(seed):
+    rng = random.Random(seed)
+    current = [f"Group_{i:02d}" for i in range(rng.randint(0, 30))]
+    desired = list(current)
+    for _ in range(rng.randint(0, 8)):
+        action = rng.choice(["remove", "insert", "rename"])
+        if action == "remove" and desired:
+            del desired[rng.randrange(len(desired))]
+        elif action == "insert":
+            desired.insert(rng.randint(0, len(desired)), f"New_{rng.random():.6f}")
+        elif desired:
+            desired[rng.randrange(len(desired))] += ".renamed"
+
+    assert apply_edits(current, diff_name_lists(current, desired)) == desired
+
+
+def test_diff_name_lists_renames_same_length_runs():
+    assert diff_name_lists(["A", "B", "C"], ["A", "X", "C"]) == [("RENAME", 1, "X")]
+    assert diff_name_lists(["B", "C", "D"], ["A", "C", "D"]) == [("RENAME", 0, "A")]
+    assert diff_name_lists(["A", "B"], ["A", "B"]) == []
+
+
+def test_match_glob_and_regex():
+    index = GroupNameIndex(["DEF-spine", "DEF-spine.001", "ORG-hand.L", "hand.R"])
+
+    np.testing.assert_array_equal(
+        index.match("DEF-spine.*", "GLOB"), [False, True, False, False]
+    )
+    np.testing.assert_array_equal(
+        index.match(r"\.(L|R)$", "REGEX"), [False, False, True, True]
+    )
+    assert index.position("hand.R") == 3
+    assert index.position("missing") == -1
+
+
+def test_evaluate_rules_in_order():
+    index = GroupNameIndex(["a.L", "a.R", "b.L", "b.R"])
+    rules = [("*.L", "GLOB", "SELECT"), ("^b", "REGEX", "DESELECT")]
+
+    np.testing.assert_array_equal(
+        index.evaluate_rules(rules), [True, False, False, False]
+    )
+    np.testing.assert_array_equal(
+        index.evaluate_rules(rules, initial=[False, True, False, True]),
+        [True, True, False, False],
+    )
+
+
+def test_collection_name_cache_rebuilds_stale_index():
+    collection = [SimpleNamespace(name=name) for name in ("A", "B", "C")]
+    cache = CollectionNameCache()
+
+    assert cache.find("obj", collection, "B") == 1
+    collection[0].name, collection[1].name = "B", "A"
+    assert cache.find("obj", collection, "B") == 0
+    collection.pop()
+    assert cache.find("obj", collection, "C") == -1
+    cache.invalidate()
+    assert cache.find("obj", collection, "A") == 1
+
+
+class CountingCollection(list):
+    """Collection that counts full scans, like a rebuild of the index"""
+
+    scans = 0
+
+    def __iter__(self):
+        self.scans += 1
+        return super().__iter__()
+
+
+def test_collection_name_cache_remembers_misses():
+    collection = CountingCollection(
+        SimpleNamespace(name=name) for name in ("A", "B", "C")
+    )
+    cache = CollectionNameCache()
+
+    for _ in range(5):
+        assert cache.find("obj", collection, "missing") == -1
+        assert cache.find("obj", collection, "other") == -1
+        assert cache.find("obj", collection, "B") == 1
+    assert collection.scans == 2
+
+    # A rename is picked up once the cache is invalidated
+    collection[2].name = "missing"
+    cache.invalidate("obj")
+    assert cache.find("obj", collection, "missing") == 2
@@ -46,5 +46,153 @@ translations_dict = {
         ("*", "Groups {source} subtracted from {target}"): "{source}を{target}から減算しました",
         ("*", "{count} vertices removed with zero weight"): "{count}個の頂点がウェイトゼロで削除されました",
         ("*", "(source groups kept)"): "（マージ元グループは保持されました）",
+
+        # Merge preview
+        ("*", "Calculate the merge without changing any weights and show what it would do"): "ウェイトを変更せずにマージを計算し、結果をプレビュー",
+        ("*", "Preview Merge"): "マージをプレビュー",
+        ("Operator", "Preview Merge"): "マージをプレビュー",
+        ("*", "{affected} vertices affected, {clamped} clamped, {removed} removed"): "影響する頂点 {affected}個、クランプ {clamped}個、削除 {removed}個",
+
+        # Merge on selected objects
+        ("*", "Merge selected vertex groups into the target group on every selected mesh"): "選択中のすべてのメッシュオブジェクトで、選択した頂点グループをマージ先グループにマージ",
+        ("*", "Merge Vertex Groups on Selected Objects"): "選択オブジェクトの頂点グループをマージ",
+        ("*", "Merge on Selected Objects"): "選択オブジェクトすべてでマージ",
+        ("*", "No selected objects have the target and source groups"): "マージ先とマージ元のグループを持つ選択オブジェクトがありません",
+        ("*", "Groups merged into {target} on {count} objects"): "{count}個のオブジェクトで{target}にマージしました",
+
+        # Merge plan
+        ("*", "Merge Plan"): "マージプラン",
+        ("*", "Add to Merge Plan"): "マージプランに追加",
+        ("Operator", "Add to Merge Plan"): "マージプランに追加",
+        ("*", "Add the current target and selected source groups to the merge plan"): "現在のマージ先と選択したマージ元グループをマージプランに追加",
+        ("*", "Remove Merge Plan Entry"): "マージプランの項目を削除",
+        ("*", "Remove the active entry from the merge plan"): "アクティブな項目をマージプランから削除",
+        ("*", "Clear Merge Plan"): "マージプランをクリア",
+        ("*", "Remove all entries from the merge plan"): "マージプランの項目をすべて削除",
+        ("*", "Execute Merge Plan"): "マージプランを実行",
+        ("Operator", "Execute Merge Plan"): "マージプランを実行",
+        ("*", "Execute every entry of the merge plan in a single pass over the vertices"): "マージプランのすべての項目を頂点の1回の走査で実行",
+        ("*", "Target group {group} not found"): "マージ先グループ {group} が見つかりません",
+        ("*", "Group {group} is both a source and a target"): "グループ {group} がマージ元とマージ先の両方に指定されています",
+        ("*", "Group {group} is a source of more than one target"): "グループ {group} が複数のマージ先のマージ元に指定されています",
+        ("*", "Merge plan executed: {count} targets"): "マージプランを実行しました（マージ先 {count}件）",
+
+        # Selection rules
+        ("*", "Selection Rules"): "選択ルール",
+        ("*", "Pattern"): "パターン",
+        ("*", "Vertex group name pattern"): "頂点グループ名のパターン",
+        ("*", "Match Type"): "一致方法",
+        ("*", "Glob"): "ワイルドカード",
+        ("*", "Wildcard pattern matching the whole name (e.g. DEF-*)"): "名前全体に一致するワイルドカードパターン（例: DEF-*）",
+        ("*", "Regex"): "正規表現",
+        ("*", "Regular expression searched anywhere in the name"): "名前のどこかに一致する正規表現",
+        ("*", "Select"): "選択",
+        ("*", "Check matching groups"): "一致したグループにチェックを入れる",
+        ("*", "Deselect"): "選択解除",
+        ("*", "Uncheck matching groups"): "一致したグループのチェックを外す",
+        ("*", "Add a source group selection rule"): "マージ元グループの選択ルールを追加",
+        ("*", "Remove the active source group selection rule"): "アクティブな選択ルールを削除",
+        ("*", "Check source groups matching the enabled selection rules"): "有効な選択ルールに一致するマージ元グループにチェックを入れる",
+        ("*", "Apply Selection Rules"): "選択ルールを適用",
+        ("*", "Apply rules on top of the current selection instead of replacing it"): "現在の選択を置き換えず、その上にルールを適用",
+        ("*", "Apply Rules"): "ルールを適用",
+        ("*", "Extend Selection"): "選択に追加",
+        ("*", "Invalid pattern: {error}"): "無効なパターン: {error}",
+        ("*", "{count} source groups selected"): "{count}個のマージ元グループを選択しました",
+
+        # Bulk selection
+        ("*", "Change the checkbox state of all source groups at once"): "すべてのマージ元グループのチェック状態を一括で変更",
+        ("*", "Select All"): "すべて選択",
+        ("*", "Check all source groups"): "すべてのマージ元グループにチェックを入れる",
+        ("*", "Deselect All"): "すべて選択解除",
+        ("*", "Uncheck all source groups"): "すべてのマージ元グループのチェックを外す",
+        ("*", "Invert"): "反転",
+        ("*", "Invert the checkbox state of all source groups"): "すべてのマージ元グループのチェック状態を反転",
+
+        # Source list filtering and sorting
+        ("*", "Sort By"): "並べ替え",
+        ("*", "Index"): "インデックス",
+        ("*", "Keep the vertex group order"): "頂点グループの順序のまま表示",
+        ("*", "Sort by name"): "名前で並べ替え",
+        ("*", "Vertex Count"): "頂点数",
+        ("*", "Sort by number of vertices in the group"): "グループに含まれる頂点数で並べ替え",
+        ("*", "Total Weight"): "合計ウェイト",
+        ("*", "Sort by sum of the group's weights"): "グループのウェイトの合計で並べ替え",
+        ("*", "Only Checked"): "チェック済みのみ",
+        ("*", "Show only checked source groups"): "チェックしたマージ元グループのみ表示",
+        ("*", "Show Statistics"): "統計を表示",
+        ("*", "Show vertex count, total weight (Σ), max weight (↑) and vertices shared with the target (∩) for each source group"): "各マージ元グループの頂点数・合計ウェイト（Σ）・最大ウェイト（↑）・マージ先と共有する頂点数（∩）を表示",
+
+        # Normalization
+        ("*", "Normalize All Groups"): "全グループを正規化",
+        ("*", "Rescale all groups on the merged vertices so their weights sum to 1.0 (locked groups are kept)"): "マージした頂点の全グループのウェイト合計が1.0になるよう調整（ロックされたグループは変更しない）",
+        ("*", "{count} vertices normalized"): "{count}個の頂点を正規化",
+        ("*", "Limit Influences"): "影響数を制限",
+        ("*", "Remove the smallest group weights of merged vertices that exceed the limit, then normalize the remaining weights"): "マージした頂点で上限を超えるグループのうちウェイトの小さいものを削除し、残りのウェイトを正規化",
+        ("*", "Max Influences"): "最大影響数",
+        ("*", "Maximum number of vertex groups per merged vertex"): "マージした頂点ごとの頂点グループ数の上限",
+        ("*", "{count} vertices trimmed to {limit} influences"): "{count}個の頂点を影響数{limit}に制限",
+
+        # Weight journal
+        ("*", "Merge Undo"): "マージの取り消し",
+        ("*", "How merges can be undone"): "マージを取り消す方法",
+        ("*", "Global Undo"): "通常のアンドゥ",
+        ("*", "Push a regular undo step for each merge (stores a copy of the mesh)"): "マージごとに通常のアンドゥステップを追加（メッシュ全体のコピーを保存）",
+        ("*", "Weight Journal"): "ウェイト履歴",
+        ("*", "Keep only the changed weights and removed groups, and undo merges with Revert Merge instead of Ctrl+Z"): "変更されたウェイトと削除されたグループのみを保存し、Ctrl+Zの代わりに「マージを元に戻す」で取り消す",
+        ("*", "Revert Merge"): "マージを元に戻す",
+        ("*", "Revert Merge ({count})"): "マージを元に戻す（{count}）",
+        ("*", "Restore the weights and groups changed by the last journaled merge"): "最後に履歴を記録したマージで変更されたウェイトとグループを復元",
+        ("*", "Cannot revert: vertex groups of {object} changed since the merge"): "元に戻せません: マージ後に{object}の頂点グループが変更されています",
+        ("*", "Merge reverted on {count} objects"): "{count}個のオブジェクトでマージを元に戻しました",
+
+        # Blend modes
+        ("*", "Max"): "最大",
+        ("*", "Keep the largest of the target and source weights"): "マージ先とマージ元のウェイトのうち最大のものを使用",
+        ("*", "Min"): "最小",
+        ("*", "Keep the smallest of the target and source weights (vertices missing from any of them get zero weight and are removed)"): "マージ先とマージ元のウェイトのうち最小のものを使用（いずれかに含まれない頂点はウェイトゼロとなり削除されます）",
+        ("*", "Multiply"): "乗算",
+        ("*", "Multiply the target by the source weights (vertices missing from any of them get zero weight and are removed)"): "マージ先のウェイトにマージ元のウェイトを掛ける（いずれかに含まれない頂点はウェイトゼロとなり削除されます）",
+        ("*", "Factor"): "係数",
+        ("*", "Multiplier applied to this group's weights before merging"): "マージ前にこのグループのウェイトに掛ける係数",
+
+        # Masked merge
+        ("*", "Mask"): "マスク",
+        ("*", "Restrict the merge to some of the vertices"): "マージを一部の頂点に限定",
+        ("*", "All Vertices"): "すべての頂点",
+        ("*", "Merge on every vertex"): "すべての頂点でマージ",
+        ("*", "Selected Vertices"): "選択した頂点",
+        ("*", "Merge only on selected vertices (source groups keep their other weights)"): "選択した頂点のみでマージ（マージ元グループのそれ以外のウェイトは残ります）",
+        ("*", "Mask Group"): "マスクグループ",
+        ("*", "Merge only on members of the mask group (source groups keep their other weights)"): "マスクグループに含まれる頂点のみでマージ（マージ元グループのそれ以外のウェイトは残ります）",
+        ("*", "Vertex group whose members the merge is restricted to"): "マージ対象を限定する頂点グループ",
+        ("*", "Mask group {group} not found"): "マスクグループ{group}が見つかりません",
+        ("*", "(masked vertices only)"): "（マスクした頂点のみ）",
+
+        # Mirrored merge
+        ("*", "Mirror (.L/.R)"): "ミラー（.L/.R）",
+        ("*", "Also merge the mirrored source groups into the mirrored target (.L/.R, _L/_R, Left/Right) in the same pass"): "ミラー側のマージ元グループもミラー側のマージ先に同じ処理でマージ（.L/.R、_L/_R、Left/Rightなど）",
+        ("*", "no mirrored counterpart: {names}"): "ミラー側が見つかりません: {names}",
+
+        # Modal merge
+        ("*", "Merge cancelled, no weights were changed"): "マージを中止しました（ウェイトは変更されていません）",
+        ("*", "Mesh changed while reading, merge cancelled"): "読み込み中にメッシュが変更されたため、マージを中止しました",
+        ("*", "Reading weights: {percent}% (Esc to cancel)"): "ウェイトを読み込み中: {percent}%（Escで中止）",
+
+        # Collapse bones
+        ("*", "Collapse Bones into Parent"): "ボーンを親に統合",
+        ("*", "No bones selected"): "ボーンが選択されていません",
+        ("*", "Selected bones have no unselected ancestor"): "選択したボーンに選択されていない親ボーンがありません",
+        ("*", "No meshes are deformed by {armature}"): "{armature} で変形するメッシュがありません",
+        ("*", "No deformed meshes have groups of the selected bones"): "変形するメッシュに選択したボーンのグループがありません",
+        ("*", "{bones} bones collapsed on {count} meshes"): "{count}個のメッシュで{bones}個のボーンを統合しました",
+        ("*", "no unselected ancestor: {names}"): "選択されていない親ボーンなし: {names}",
+
+        # Timings
+        ("*", "Timings"): "処理時間",
+        ("*", "No timings recorded yet"): "処理時間の記録はまだありません",
+        ("*", "Profile Next Merge"): "次のマージをプロファイル",
+        ("*", "Write a cProfile dump of the next merge to the temporary directory (cleared after the merge)"): "次のマージのcProfileダンプを一時ディレクトリに書き出す（マージ後に解除）",
+        ("*", "Profile written to {path}"): "プロファイルを{path}に書き出しました",
     }
 }
\ No newline at end of file